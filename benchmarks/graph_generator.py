@@ -0,0 +1,81 @@
+import random
+from dataclasses import dataclass
+
+from grimp.adaptors.graph import ImportGraph
+
+
+@dataclass(frozen=True)
+class GraphShape:
+    """
+    Shape parameters of a synthetic import graph.
+
+    module_count:   Number of modules in the graph (packages included), unless the tree of depth and fan_out is smaller.
+    depth:          Maximal nesting depth of packages below the root package. The tree is filled breadth first, so the
+                    actual depth grows with module_count up to this maximum.
+    fan_out:        Number of child packages per package.
+    edge_density:   Average number of imports per module.
+    locality:       Probability that an import targets a module of the same top level subpackage.
+    seed:           Seed of the random generator, so graphs are reproducible.
+    """
+    module_count: int = 1_000
+    depth: int = 8
+    fan_out: int = 5
+    edge_density: float = 4.0
+    locality: float = 0.8
+    seed: int = 0
+
+
+def generate_graph(shape: GraphShape, root_package: str = 'root') -> ImportGraph:
+    """
+    Builds a package tree below the root package, breadth first, until module_count modules exist. Every package gets a
+    'shared' package, and every package named after a port gets matching 'ports' and 'adapters' modules, so the rule sets
+    of the benchmark find both valid and invalid imports.
+    """
+    rng = random.Random(shape.seed)
+    modules = _generate_modules(shape, root_package)
+
+    import_graph = ImportGraph()
+    for module in modules:
+        import_graph.add_module(module)
+
+    modules_by_top_level: dict[str, list[str]] = {}
+    for module in modules:
+        modules_by_top_level.setdefault(_top_level(module), []).append(module)
+
+    edge_count = int(len(modules) * shape.edge_density)
+    for _ in range(edge_count):
+        importer = rng.choice(modules)
+        if rng.random() < shape.locality:
+            imported = rng.choice(modules_by_top_level[_top_level(importer)])
+        else:
+            imported = rng.choice(modules)
+        if importer != imported:
+            import_graph.add_import(importer=importer, imported=imported)
+
+    return import_graph
+
+
+def _generate_modules(shape: GraphShape, root_package: str) -> list[str]:
+    modules = [root_package]
+    frontier = [(root_package, 0)]
+    while frontier and len(modules) < shape.module_count:
+        next_frontier = []
+        for package, depth in frontier:
+            if depth >= shape.depth:
+                continue
+            children = [f"{package}.p{index}" for index in range(shape.fan_out)]
+            children.append(f"{package}.shared")
+            children.extend([f"{package}.ports.p{index}_port" for index in range(2)])
+            children.extend([f"{package}.adapters.p{index}_adapter" for index in range(2)])
+            for child in children:
+                if len(modules) >= shape.module_count:
+                    break
+                modules.append(child)
+                if child.rsplit('.', 1)[-1].startswith('p') and '.ports.' not in child and '.adapters.' not in child:
+                    next_frontier.append((child, depth + 1))
+        frontier = next_frontier
+    return modules
+
+
+def _top_level(module: str) -> str:
+    return '.'.join(module.split('.')[:2])
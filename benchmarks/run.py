@@ -0,0 +1,184 @@
+"""
+Benchmarks RequiredGraphContract.check on synthetic import graphs.
+
+Usage:
+
+    python -m benchmarks.run --module-counts 1000 10000 --rule-sets shared-package port-adapter --output results.json
+    python -m benchmarks.run --compare baseline.json results.json --threshold 0.1
+
+Every combination of graph shape, rule set and contract options is measured. Reported are the imports checked per
+second, the peak memory allocated by Python during the check and the time of every phase (contract load, import
+enumeration, check of the enumerated imports). Results are written as JSON, so runs can be compared for regressions.
+"""
+import argparse
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from dataclasses import asdict
+from typing import Any
+
+from grimp.adaptors.graph import ImportGraph
+
+from import_linter_dependency_graph.domain.edge_columns import EdgeColumns
+from import_linter_dependency_graph.fields.import_expression_field import clear_interned_import_expressions
+from import_linter_dependency_graph.helpers.package_edges import iter_package_edges
+from import_linter_dependency_graph.required_graph import RequiredGraphContract
+
+from benchmarks.graph_generator import GraphShape, generate_graph
+
+
+RULE_SETS: dict[str, list[str]] = {
+    "same-package": [
+        "[**parent].* -> [parent].**",
+    ],
+    "shared-package": [
+        "[**parent].* -> [parent].**",
+        "[**?shared_parent].shared.** <- [shared_parent].**",
+    ],
+    "port-adapter": [
+        "[**parent].* -> [parent].**",
+        "[**?shared_parent].shared.** <- [shared_parent].**",
+        "root.[**parent].ports.[port_name]_port <- root.[parent].adapters.[port_name]_adapter",
+    ],
+}
+
+# Named contract option sets, so engines and evaluation modes can be compared on the same graphs.
+OPTION_SETS: dict[str, dict[str, str]] = {
+    "default": {},
+    "combined-regex": {"matching_engine": "combined-regex"},
+    "segment": {"matching_engine": "segment"},
+    "grouped": {"evaluation_mode": "grouped"},
+    "target-sets": {"materialize_target_sets": "true"},
+}
+
+
+def run_benchmark(graph: ImportGraph, shape: GraphShape, rule_set: str, option_set: str, repeat: int = 1, fresh_expressions: bool = False) -> dict[str, Any]:
+    """
+    Measures one benchmark. With fresh_expressions, every contract parses its import expressions anew instead of
+    reusing the process-wide parsed ones with their warm compile caches, which resets them for the whole process.
+    """
+    best: dict[str, Any] = {}
+    for _ in range(repeat):
+        start = time.perf_counter()
+        contract = _contract(rule_set, option_set, fresh_expressions)
+        loaded = time.perf_counter()
+        edges = EdgeColumns.from_edges(iter_package_edges(graph, 'root'))
+        enumerated = time.perf_counter()
+        check = contract.check_edges(graph, edges, verbose=False)
+        checked = time.perf_counter()
+
+        check_seconds = checked - enumerated
+        result = {
+            "module_count": len(graph.modules),
+            "edge_count": len(edges),
+            "invalid_import_count": len(check.metadata["invalid_imports"]),
+            "phases": {
+                "contract_load_seconds": loaded - start,
+                "edge_enumeration_seconds": enumerated - loaded,
+                "check_seconds": check_seconds,
+            },
+            "edges_per_second": len(edges) / check_seconds if check_seconds else None,
+        }
+        if not best or result["phases"]["check_seconds"] < best["phases"]["check_seconds"]:
+            best = result
+
+    # Tracing allocations slows the check down considerably, so memory is measured in a separate run.
+    contract = _contract(rule_set, option_set, fresh_expressions)
+    edges = EdgeColumns.from_edges(iter_package_edges(graph, 'root'))
+    tracemalloc.start()
+    contract.check_edges(graph, edges, verbose=False)
+    _, peak_memory = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {"shape": asdict(shape), "rule_set": rule_set, "option_set": option_set, **best, "peak_memory_bytes": peak_memory}
+
+
+def _contract(rule_set: str, option_set: str, fresh_expressions: bool) -> RequiredGraphContract:
+    if fresh_expressions:
+        clear_interned_import_expressions()
+    return RequiredGraphContract('benchmark', {}, {
+        "root_package": 'root',
+        "required_imports": RULE_SETS[rule_set],
+        **OPTION_SETS[option_set],
+    })
+
+
+def compare(baseline: dict[str, Any], current: dict[str, Any], threshold: float) -> list[str]:
+    """
+    Returns a description of every benchmark whose check got slower than the baseline by more than the threshold.
+    """
+    def key(result: dict[str, Any]) -> str:
+        return json.dumps([result["shape"], result["rule_set"], result["option_set"]], sort_keys=True)
+
+    baseline_by_key = {key(result): result for result in baseline["results"]}
+    regressions = []
+    for result in current["results"]:
+        baseline_result = baseline_by_key.get(key(result))
+        if baseline_result is None:
+            continue
+        before = baseline_result["phases"]["check_seconds"]
+        after = result["phases"]["check_seconds"]
+        if before and (after - before) / before > threshold:
+            regressions.append(
+                f"{result['rule_set']}/{result['option_set']} with {result['shape']['module_count']} modules: "
+                f"{before:.3f}s -> {after:.3f}s"
+            )
+    return regressions
+
+
+def main(argv: list[str]) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--module-counts', type=int, nargs='+', default=[1_000, 10_000])
+    parser.add_argument('--depth', type=int, default=GraphShape.depth)
+    parser.add_argument('--fan-out', type=int, default=GraphShape.fan_out)
+    parser.add_argument('--edge-density', type=float, default=GraphShape.edge_density)
+    parser.add_argument('--locality', type=float, default=GraphShape.locality)
+    parser.add_argument('--seed', type=int, default=GraphShape.seed)
+    parser.add_argument('--rule-sets', nargs='+', choices=sorted(RULE_SETS), default=sorted(RULE_SETS))
+    parser.add_argument('--option-sets', nargs='+', choices=sorted(OPTION_SETS), default=['default'])
+    parser.add_argument('--repeat', type=int, default=1, help='Runs per benchmark, the fastest one is reported.')
+    parser.add_argument('--output', help='Write the results as JSON to this file.')
+    parser.add_argument('--compare', nargs=2, metavar=('BASELINE', 'CURRENT'), help='Compare two result files.')
+    parser.add_argument('--threshold', type=float, default=0.1, help='Relative slowdown reported as regression.')
+    arguments = parser.parse_args(argv)
+
+    if arguments.compare:
+        with open(arguments.compare[0]) as baseline_file, open(arguments.compare[1]) as current_file:
+            regressions = compare(json.load(baseline_file), json.load(current_file), arguments.threshold)
+        for regression in regressions:
+            print(f"Regression: {regression}")
+        return 1 if regressions else 0
+
+    results = []
+    for module_count in arguments.module_counts:
+        shape = GraphShape(
+            module_count=module_count,
+            depth=arguments.depth,
+            fan_out=arguments.fan_out,
+            edge_density=arguments.edge_density,
+            locality=arguments.locality,
+            seed=arguments.seed,
+        )
+        graph = generate_graph(shape)
+        for rule_set in arguments.rule_sets:
+            for option_set in arguments.option_sets:
+                # A fresh process would parse the import expressions again, so every contract does.
+                result = run_benchmark(graph, shape, rule_set, option_set, repeat=arguments.repeat, fresh_expressions=True)
+                results.append(result)
+                print(
+                    f"{rule_set:>15} {option_set:>15} {result['module_count']:>8} modules {result['edge_count']:>9} imports "
+                    f"{result['phases']['check_seconds']:>9.3f}s {result['edges_per_second'] or 0:>12.0f} imports/s "
+                    f"{result['peak_memory_bytes'] / 2**20:>8.1f} MiB"
+                )
+
+    report = {"python": platform.python_version(), "platform": platform.platform(), "results": results}
+    if arguments.output:
+        with open(arguments.output, 'w') as output_file:
+            json.dump(report, output_file, indent=2)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,31 @@
+"""
+Exports the matcher artifact of a contract, so CI jobs load the parsed import expressions and the matcher instead of
+building them.
+
+Usage:
+
+    python -m import_linter_dependency_graph.artifact --contract "My contract" --output .import_linter_cache/matcher.pickle [--config .importlinter]
+
+Configure the written path as matcher_artifact of the contract. Artifacts only apply to the import expressions, root
+package and matching engine they were exported for, so export again whenever these change.
+"""
+import argparse
+import sys
+
+from import_linter_dependency_graph.configuration import load_contract
+
+
+def main(argv: list[str]) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--contract', required=True, help='Name of the import_graph contract.')
+    parser.add_argument('--output', required=True, help='Path of the artifact.')
+    parser.add_argument('--config', help='import-linter configuration file (default: found like lint-imports does).')
+    arguments = parser.parse_args(argv)
+
+    load_contract(arguments.contract, arguments.config).export_matcher_artifact(arguments.output)
+    print(f"Matcher artifact written to {arguments.output}.")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,109 @@
+"""
+Checks all import_graph contracts of a configuration with a single traversal of the import graph.
+
+Usage:
+
+    python -m import_linter_dependency_graph.batch [--config .importlinter] [--verbose]
+
+Contracts are recognized by their type, which must be registered in contract_types with RequiredGraphContract or a
+subclass. Results are printed like lint-imports does and the exit code is 1 if any contract is broken.
+"""
+import argparse
+import sys
+from typing import Sequence
+
+from grimp import ImportGraph
+from importlinter import ContractCheck
+from importlinter.application import output
+from importlinter.application.rendering import render_contract_result_line
+
+from import_linter_dependency_graph.configuration import build_contracts_graph, load_graph_contracts
+from import_linter_dependency_graph.domain.edge_columns import EdgeColumns, ModuleTable
+from import_linter_dependency_graph.helpers.package_edges import is_in_package, iter_package_edges
+from import_linter_dependency_graph.required_graph import RequiredGraphContract
+
+
+def check_contracts(contracts: Sequence[RequiredGraphContract], graph: ImportGraph, verbose: bool = False) -> list[ContractCheck]:
+    """
+    Checks several contracts with a single traversal of the graph, returning their checks in the same order.
+
+    Imports are fetched once per outermost root package. Every import is dispatched to all contracts whose root package
+    contains both of its modules, which are found by walking up the packages of the importer. All contracts share one
+    module table. lint-imports checks every contract on its own copy of the graph, so sharing the traversal needs this
+    entry point.
+    """
+    # Scoped contracts only fetch the imports of their changed modules, which is cheaper than sharing the traversal.
+    scoped = [contract.find_changed_modules() is not None for contract in contracts]
+    roots = {contract.root_package.name for contract, is_scoped in zip(contracts, scoped) if not is_scoped}
+    outermost_roots = [root for root in roots if not any(root != other and is_in_package(root, other) for other in roots)]
+
+    module_table = ModuleTable()
+    edges_by_root = {root: EdgeColumns(module_table) for root in roots}
+    for outermost_root in outermost_roots:
+        nested_roots = [root for root in roots if is_in_package(root, outermost_root)]
+        if len(nested_roots) == 1:
+            edges = edges_by_root[outermost_root]
+            for importer, imported in iter_package_edges(graph, outermost_root):
+                edges.append(importer, imported)
+            continue
+
+        # iter_package_edges yields the imports by modules below a root package before those by the root package
+        # itself, each in graph order. Keeping them apart gives every root the order of its own traversal, so limits,
+        # samples and violation files are the same as for a check of the contract on its own.
+        package_imports_by_root: dict[str, list[tuple[int, int]]] = {root: [] for root in nested_roots}
+        for importer, imported in iter_package_edges(graph, outermost_root):
+            importer_id, imported_id = module_table.intern(importer), module_table.intern(imported)
+            for root in _enclosing_roots(importer, edges_by_root):
+                if imported == root or not is_in_package(imported, root):
+                    continue
+                if importer == root:
+                    package_imports_by_root[root].append((importer_id, imported_id))
+                else:
+                    edges_by_root[root].append_ids(importer_id, imported_id)
+        for root, package_imports in package_imports_by_root.items():
+            for importer_id, imported_id in package_imports:
+                edges_by_root[root].append_ids(importer_id, imported_id)
+
+    return [
+        contract.check(graph, verbose) if is_scoped else contract.check_edges(graph, edges_by_root[contract.root_package.name], verbose)
+        for contract, is_scoped in zip(contracts, scoped)
+    ]
+
+
+def _enclosing_roots(module: str, roots: dict[str, EdgeColumns]) -> list[str]:
+    enclosing_roots = []
+    separator_index = module.find('.')
+    while separator_index != -1:
+        if module[:separator_index] in roots:
+            enclosing_roots.append(module[:separator_index])
+        separator_index = module.find('.', separator_index + 1)
+    if module in roots:
+        enclosing_roots.append(module)
+    return enclosing_roots
+
+
+def main(argv: list[str]) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--config', help='import-linter configuration file (default: found like lint-imports does).')
+    parser.add_argument('--verbose', action='store_true')
+    arguments = parser.parse_args(argv)
+
+    contracts = load_graph_contracts(arguments.config)
+    if not contracts:
+        raise SystemExit("No RequiredGraphContract contracts in the configuration.")
+    checks = check_contracts(contracts, build_contracts_graph(contracts), arguments.verbose)
+
+    for contract, check in zip(contracts, checks):
+        render_contract_result_line(contract, check, duration=None)
+        for warning in check.warnings:
+            output.print_warning(warning)
+    for contract, check in zip(contracts, checks):
+        if not check.kept:
+            output.new_line()
+            output.print_heading(contract.name, output.HEADING_LEVEL_TWO, style=output.ERROR)
+            contract.render_broken_contract(check)
+    return 0 if all(check.kept for check in checks) else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,61 @@
+import importlib
+from typing import Optional, Sequence
+
+import grimp
+from grimp import ImportGraph
+
+from import_linter_dependency_graph.required_graph import RequiredGraphContract
+
+
+def load_contract(contract_name: str, config_filename: Optional[str] = None) -> RequiredGraphContract:
+    """
+    Reads the import-linter configuration like lint-imports does and creates the contract of the given name.
+    """
+    from importlinter.application.use_cases import read_user_options
+    from importlinter.configuration import configure
+
+    configure()
+    user_options = read_user_options(config_filename=config_filename)
+    contract_options = next((options for options in user_options.contracts_options if options.get("name") == contract_name), None)
+    if contract_options is None:
+        raise SystemExit(f"No contract named '{contract_name}' in the configuration.")
+    return RequiredGraphContract(contract_name, user_options.session_options, contract_options)
+
+
+def load_graph_contracts(config_filename: Optional[str] = None) -> list[RequiredGraphContract]:
+    """
+    Reads the import-linter configuration like lint-imports does and creates all contracts whose type is a
+    RequiredGraphContract, in the order of the configuration.
+    """
+    from importlinter.application.use_cases import read_user_options
+    from importlinter.configuration import configure
+
+    configure()
+    user_options = read_user_options(config_filename=config_filename)
+    graph_contract_types = set()
+    for contract_type in user_options.session_options.get("contract_types", []):
+        type_name, _, class_path = contract_type.partition(': ')
+        module_path, _, class_name = class_path.rpartition('.')
+        contract_class = getattr(importlib.import_module(module_path), class_name)
+        if isinstance(contract_class, type) and issubclass(contract_class, RequiredGraphContract):
+            graph_contract_types.add(type_name)
+    return [
+        RequiredGraphContract(contract_options["name"], user_options.session_options, contract_options)
+        for contract_options in user_options.contracts_options
+        if contract_options.get("type") in graph_contract_types
+    ]
+
+
+def build_contract_graph(contract: RequiredGraphContract) -> ImportGraph:
+    """
+    The import graph of the top level package containing the root package of the contract, without external packages.
+    """
+    return build_contracts_graph([contract])
+
+
+def build_contracts_graph(contracts: Sequence[RequiredGraphContract]) -> ImportGraph:
+    """
+    The import graph of the top level packages containing the root packages of the contracts, without external packages.
+    """
+    top_level_packages = sorted({contract.root_package.name.split('.')[0] for contract in contracts})
+    return grimp.build_graph(*top_level_packages, include_external_packages=False, cache_dir=None)
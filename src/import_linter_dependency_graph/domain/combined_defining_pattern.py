@@ -0,0 +1,54 @@
+import re
+
+from import_linter_dependency_graph.domain.defining_module_expression import DefiningModuleExpression
+
+
+_NAMED_GROUP_PATTERN = re.compile(r'\(\?P<([A-Za-z0-9_]+)>')
+
+
+class CombinedDefiningPattern:
+    """
+    All defining module expressions of one import direction compiled into a single regular expression.
+
+    Every expression becomes an optional lookahead anchored at the end of the module name, so a single match call
+    tries each expression and reports all that matched, not only the first alternative as a plain alternation would.
+    Named groups are prefixed with the alternative's index, as different expressions may reuse variable names.
+    A lookahead matches exactly like a fullmatch of the expression, so the captured variables are the same.
+    """
+
+    _pattern: re.Pattern[str]
+    _alternatives: tuple[tuple[int, str, tuple[tuple[str, str], ...]], ...]
+
+    def __init__(self, positioned_expressions: list[tuple[int, DefiningModuleExpression]]):
+        regex_parts = []
+        alternatives = []
+        for alternative_index, (position, defining_module_expr) in enumerate(positioned_expressions):
+            prefix = f"a{alternative_index}_"
+            variable_groups = []
+
+            def rename_group(match: re.Match) -> str:
+                variable_groups.append((match.group(1), f"{prefix}{match.group(1)}"))
+                return f"(?P<{prefix}{match.group(1)}>"
+
+            renamed_regex = _NAMED_GROUP_PATTERN.sub(rename_group, defining_module_expr.pattern.pattern)
+            alternative_group = f"alternative{alternative_index}"
+            regex_parts.append(rf"(?:(?=(?P<{alternative_group}>{renamed_regex})\Z))?")
+            alternatives.append((position, alternative_group, tuple(variable_groups)))
+
+        self._pattern = re.compile(''.join(regex_parts))
+        self._alternatives = tuple(alternatives)
+
+    def match_all(self, module: str) -> list[tuple[int, dict[str, str]]]:
+        """
+        Returns the position and captured variables of every matching expression, in configured order.
+        """
+        match = self._pattern.match(module)
+        if match is None:
+            # Not reached, every lookahead is optional, so the pattern matches at least the empty string.
+            return []
+        groups = match.groupdict()
+        return [
+            (position, {variable: groups[group] for variable, group in variable_groups})
+            for position, alternative_group, variable_groups in self._alternatives
+            if groups[alternative_group] is not None
+        ]
@@ -1,18 +1,36 @@
 import re
+from typing import Optional
 
 from importlinter.domain.imports import ValueObject
 
+from import_linter_dependency_graph.domain.segment_pattern import SegmentPattern
+
 class DefiningModuleExpression(ValueObject):
 
     _pattern: re.Pattern[str]
+    _literal_prefix: tuple[str, ...]
+    _segment_pattern: Optional[SegmentPattern]
 
-    def __init__(self, regex_expression: str):
+    def __init__(self, regex_expression: str, literal_prefix: tuple[str, ...] = (), segment_pattern: Optional[SegmentPattern] = None):
         self._pattern = re.compile(regex_expression)
+        self._literal_prefix = literal_prefix
+        self._segment_pattern = segment_pattern
 
     @property
     def pattern(self):
         return self._pattern
 
+    @property
+    def literal_prefix(self) -> tuple[str, ...]:
+        """
+        Leading packages of the expression without any wildcard or variable. Every matching module starts with them.
+        """
+        return self._literal_prefix
+
+    @property
+    def segment_pattern(self) -> Optional[SegmentPattern]:
+        return self._segment_pattern
+
 
     def __str__(self):
-        return str(self._pattern)
\ No newline at end of file
+        return str(self._pattern)
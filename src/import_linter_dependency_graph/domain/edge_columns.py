@@ -0,0 +1,104 @@
+from array import array
+from typing import Iterable, Iterator, Optional, Sequence, overload
+
+
+class ModuleTable:
+    """
+    Interns module names as consecutive integer ids, so every name is held once however many imports refer to it.
+    """
+
+    _ids: dict[str, int]
+    _names: list[str]
+
+    def __init__(self):
+        self._ids = {}
+        self._names = []
+
+    def intern(self, module: str) -> int:
+        module_id = self._ids.get(module, None)
+        if module_id is None:
+            module_id = len(self._names)
+            self._ids[module] = module_id
+            self._names.append(module)
+        return module_id
+
+    def find(self, module: str) -> Optional[int]:
+        return self._ids.get(module, None)
+
+    def name(self, module_id: int) -> str:
+        return self._names[module_id]
+
+    @property
+    def names(self) -> list[str]:
+        return self._names
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+
+class EdgeColumns(Sequence[tuple[str, str]]):
+    """
+    Imports stored as two parallel integer arrays of module ids instead of a list of name tuples, taking 8 bytes per
+    import instead of a tuple object each. Behaves as a sequence of (importer, imported) names, resolved on access.
+    """
+
+    _module_table: ModuleTable
+    _importer_ids: array
+    _imported_ids: array
+
+    def __init__(self, module_table: ModuleTable):
+        self._module_table = module_table
+        self._importer_ids = array('i')
+        self._imported_ids = array('i')
+
+    @classmethod
+    def from_edges(cls, edges: Iterable[tuple[str, str]], module_table: Optional[ModuleTable] = None) -> "EdgeColumns":
+        edge_columns = cls(module_table if module_table is not None else ModuleTable())
+        for importer, imported in edges:
+            edge_columns.append(importer, imported)
+        return edge_columns
+
+    @property
+    def module_table(self) -> ModuleTable:
+        return self._module_table
+
+    @property
+    def importer_ids(self) -> array:
+        return self._importer_ids
+
+    @property
+    def imported_ids(self) -> array:
+        return self._imported_ids
+
+    def append(self, importer: str, imported: str):
+        self.append_ids(self._module_table.intern(importer), self._module_table.intern(imported))
+
+    def append_ids(self, importer_id: int, imported_id: int):
+        self._importer_ids.append(importer_id)
+        self._imported_ids.append(imported_id)
+
+    def iter_ids(self) -> Iterator[tuple[int, int]]:
+        return zip(self._importer_ids, self._imported_ids)
+
+    def __len__(self) -> int:
+        return len(self._importer_ids)
+
+    @overload
+    def __getitem__(self, index: int) -> tuple[str, str]: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[tuple[str, str]]: ...
+
+    def __getitem__(self, index):
+        names = self._module_table.names
+        if isinstance(index, slice):
+            return [
+                (names[importer_id], names[imported_id])
+                for importer_id, imported_id in zip(self._importer_ids[index], self._imported_ids[index])
+            ]
+        return names[self._importer_ids[index]], names[self._imported_ids[index]]
+
+    def __iter__(self) -> Iterator[tuple[str, str]]:
+        names = self._module_table.names
+        for importer_id, imported_id in zip(self._importer_ids, self._imported_ids):
+            yield names[importer_id], names[imported_id]
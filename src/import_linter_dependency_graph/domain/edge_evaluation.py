@@ -0,0 +1,153 @@
+import heapq
+from enum import Enum
+from typing import Generator, Iterable, Iterator, Optional
+
+from import_linter_dependency_graph.domain.edge_columns import EdgeColumns
+from import_linter_dependency_graph.domain.expression_ranking import ExpressionRanking
+from import_linter_dependency_graph.domain.import_expression import ImportExpression, ImportType
+from import_linter_dependency_graph.domain.matching_engine import ImportExpressionMatcher
+
+
+class EvaluationMode(Enum):
+    EDGE = 'edge'
+    GROUPED = 'grouped'
+
+
+class EdgeEvaluator:
+    """
+    Decides which imports conform to none of the import expressions.
+
+    In edge mode every import is checked on its own. In grouped mode imports are grouped by the module defining the
+    variables (importer for '->', imported for '<-'), so the defining module expression is matched and the using module
+    expression compiled only once per (module, expression) pair and then tested against all partner modules. Both
+    modes report the same imports in the same order.
+
+    Given a ranking, expressions are tried by descending number of accepted imports instead of configured order.
+    """
+
+    _import_expressions: list[ImportExpression]
+    _matcher: ImportExpressionMatcher
+    _ranking: Optional[ExpressionRanking]
+
+    def __init__(self, import_expressions: list[ImportExpression], matcher: ImportExpressionMatcher, ranking: Optional[ExpressionRanking] = None):
+        self._import_expressions = import_expressions
+        self._matcher = matcher
+        self._ranking = ranking
+
+    @property
+    def matcher(self) -> ImportExpressionMatcher:
+        return self._matcher
+
+    @property
+    def ranking(self) -> Optional[ExpressionRanking]:
+        return self._ranking
+
+    def is_import_valid(self, importer: str, imported: str) -> bool:
+        if self._ranking is not None:
+            return self._is_import_valid_ranked(importer, imported, self._ranking)
+
+        # Merging by position keeps the configured order of the expressions across both import types.
+        defining_matches = heapq.merge(
+            self._matcher.iter_defining_matches(ImportType.IMPORTING, importer),
+            self._matcher.iter_defining_matches(ImportType.IMPORTED, imported),
+            key=lambda defining_match: defining_match[0],
+        )
+        for position, variables in defining_matches:
+            if self._import_expressions[position].import_type == ImportType.IMPORTING:
+                if self._matcher.match_using_at(position, variables, imported):
+                    return True
+            else:
+                if self._matcher.match_using_at(position, variables, importer):
+                    return True
+
+        return False
+
+    def _is_import_valid_ranked(self, importer: str, imported: str, ranking: ExpressionRanking) -> bool:
+        # Defining module expressions matched per expression are only matched when their turn comes. Matchers matching
+        # all of them in one call are run up front.
+        positions: list[int] = []
+        combined_matches: dict[int, dict[str, str]] = {}
+        for import_type, module in ((ImportType.IMPORTING, importer), (ImportType.IMPORTED, imported)):
+            if self._matcher.combined_defining_positions(import_type) is None:
+                positions.extend(self._matcher.candidate_positions(import_type, module))
+            else:
+                for position, variables in self._matcher.iter_defining_matches(import_type, module):
+                    combined_matches[position] = variables
+                    positions.append(position)
+
+        for position in ranking.order(positions):
+            import_expression = self._import_expressions[position]
+            if import_expression.import_type == ImportType.IMPORTING:
+                defining_module, using_module = importer, imported
+            else:
+                defining_module, using_module = imported, importer
+            defining_variables = combined_matches.get(position, None)
+            if defining_variables is None:
+                defining_variables = self._matcher.match_defining_at(position, defining_module)
+            if defining_variables is not None and self._matcher.match_using_at(position, defining_variables, using_module):
+                ranking.record_hits(position)
+                return True
+
+        return False
+
+    def _iter_ranked(self, defining_matches: Iterator[tuple[int, dict[str, str]]]) -> Iterator[tuple[int, dict[str, str]]]:
+        if self._ranking is None:
+            return defining_matches
+        variables_by_position = dict(defining_matches)
+        return ((position, variables_by_position[position]) for position in self._ranking.order(variables_by_position))
+
+    def iter_invalid_edges(self, edges: Iterable[tuple[str, str]], evaluation_mode: EvaluationMode) -> Generator[tuple[str, str], None, None]:
+        if evaluation_mode == EvaluationMode.GROUPED:
+            return self._iter_invalid_edges_grouped(edges if isinstance(edges, EdgeColumns) else EdgeColumns.from_edges(edges))
+        return (edge for edge in edges if not self.is_import_valid(*edge))
+
+    def _iter_invalid_edges_grouped(self, edges: EdgeColumns) -> Generator[tuple[str, str], None, None]:
+        # Imports are referred to by their index in the edge columns, modules by their id.
+        names = edges.module_table.names
+        importer_ids = edges.importer_ids
+        imported_ids = edges.imported_ids
+        edge_indexes_by_importer: dict[int, list[int]] = {}
+        edge_indexes_by_imported: dict[int, list[int]] = {}
+        for edge_index, (importer_id, imported_id) in enumerate(edges.iter_ids()):
+            edge_indexes_by_importer.setdefault(importer_id, []).append(edge_index)
+            edge_indexes_by_imported.setdefault(imported_id, []).append(edge_index)
+
+        valid_edges = bytearray(len(edges))
+
+        for importer_id, edge_indexes in edge_indexes_by_importer.items():
+            pending = edge_indexes
+            for position, variables in self._iter_ranked(self._matcher.iter_defining_matches(ImportType.IMPORTING, names[importer_id])):
+                using_matches = self._matcher.using_matcher_at(position, variables)
+                remaining = []
+                for edge_index in pending:
+                    if using_matches(names[imported_ids[edge_index]]):
+                        valid_edges[edge_index] = True
+                    else:
+                        remaining.append(edge_index)
+                self._record_hits(position, len(pending) - len(remaining))
+                pending = remaining
+                if not pending:
+                    break
+
+        for imported_id, edge_indexes in edge_indexes_by_imported.items():
+            pending = [edge_index for edge_index in edge_indexes if not valid_edges[edge_index]]
+            if not pending:
+                continue
+            for position, variables in self._iter_ranked(self._matcher.iter_defining_matches(ImportType.IMPORTED, names[imported_id])):
+                using_matches = self._matcher.using_matcher_at(position, variables)
+                remaining = []
+                for edge_index in pending:
+                    if using_matches(names[importer_ids[edge_index]]):
+                        valid_edges[edge_index] = True
+                    else:
+                        remaining.append(edge_index)
+                self._record_hits(position, len(pending) - len(remaining))
+                pending = remaining
+                if not pending:
+                    break
+
+        return (edges[edge_index] for edge_index in range(len(edges)) if not valid_edges[edge_index])
+
+    def _record_hits(self, position: int, count: int):
+        if self._ranking is not None and count:
+            self._ranking.record_hits(position, count)
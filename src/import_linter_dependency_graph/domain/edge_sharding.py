@@ -0,0 +1,52 @@
+import zlib
+
+from importlinter.domain.imports import ValueObject
+
+
+class Shard(ValueObject):
+    """
+    One of several partitions of the imports of a root package, written 'index/count' with index counted from 1.
+
+    Imports are assigned by a stable hash of the subpackage of the root package containing the importer, so every
+    shard gets the same imports on every machine and Python process, and imports of one subpackage stay together.
+    """
+
+    _index: int
+    _count: int
+
+    def __init__(self, index: int, count: int):
+        if count < 1 or not 1 <= index <= count:
+            raise ValueError(f"Shard '{index}/{count}' is invalid, expected 'index/count' with 1 <= index <= count.")
+        self._index = index
+        self._count = count
+
+    @classmethod
+    def parse(cls, text: str) -> "Shard":
+        index, separator, count = text.partition('/')
+        try:
+            return cls(int(index), int(count))
+        except ValueError:
+            raise ValueError(f"Shard '{text}' is invalid, expected 'index/count' with 1 <= index <= count.") from None
+
+    @property
+    def index(self) -> int:
+        return self._index
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    def contains(self, importer: str, root_package: str) -> bool:
+        return shard_index(importer, root_package, self._count) == self._index
+
+    def __str__(self) -> str:
+        return f"{self._index}/{self._count}"
+
+
+def shard_index(module: str, root_package: str, count: int) -> int:
+    """
+    The shard (from 1) of imports by the given module of the root package.
+    """
+    separator_index = module.find('.', len(root_package) + 1)
+    subpackage = module if separator_index == -1 else module[:separator_index]
+    return zlib.crc32(subpackage.encode('utf-8')) % count + 1
@@ -0,0 +1,146 @@
+from functools import cache
+from typing import Optional, Sequence, Union
+
+from import_linter_dependency_graph.domain.import_expression import ImportExpression
+from import_linter_dependency_graph.domain.segment_pattern import SegmentToken, SegmentTokenKind
+
+
+# Package expressions reduced to what decides which modules they match. A package expression referring to a variable
+# is 'bound': its segments are only known per binding, but it spans at least one package.
+_LITERAL = 'literal'
+_ANY = 'any'
+_REGEX = 'regex'
+_CHAIN = 'chain'
+_BOUND = 'bound'
+
+_SINGLE_PACKAGE_KINDS = (_LITERAL, _ANY, _REGEX)
+
+# Literal packages of a bound package expression, each followed by the variable bound after it, if any.
+_BoundParts = tuple[tuple[str, Optional[str]], ...]
+# Kind with the package name (literal), regex (regex), text (chain), parts (bound) or None (any).
+_Symbol = tuple[str, Union[str, None, _BoundParts]]
+
+
+def _defining_symbols(import_expression: ImportExpression) -> Optional[list[_Symbol]]:
+    segment_pattern = import_expression.defining_module_expr.segment_pattern
+    if segment_pattern is None:
+        return None
+    return [_token_symbol(token) for token in segment_pattern.tokens]
+
+
+def _using_symbols(import_expression: ImportExpression) -> Optional[list[_Symbol]]:
+    segment_template = import_expression.using_module_expr.segment_template
+    if segment_template is None:
+        return None
+    return [
+        _token_symbol(package_expr) if isinstance(package_expr, SegmentToken) else (_BOUND, package_expr)
+        for package_expr in segment_template.package_exprs
+    ]
+
+
+def _token_symbol(token: SegmentToken) -> _Symbol:
+    if token.kind == SegmentTokenKind.LITERAL:
+        return _LITERAL, token.literal
+    elif token.kind == SegmentTokenKind.ANY:
+        return _ANY, None
+    elif token.kind == SegmentTokenKind.REGEX:
+        return _REGEX, token.pattern.pattern if token.pattern is not None else None
+    # Chains only keep their text for reports. Eager and lazy chains match the same modules, they only capture differently.
+    return _CHAIN, str(token)
+
+
+def _symbol_text(symbol: _Symbol) -> str:
+    kind, value = symbol
+    if kind == _ANY or value is None:
+        return '*'
+    elif isinstance(value, str):
+        return value
+    return ''.join(f"{literal}[{variable_name}]" if variable_name is not None else literal for literal, variable_name in value)
+
+
+def _covers(covering: Sequence[_Symbol], covered: Sequence[_Symbol]) -> bool:
+    """
+    Whether every module matched by the covered package expressions is matched by the covering ones. Sufficient, not
+    necessary: a chain of the covering side absorbs whole package expressions of the covered side only.
+    """
+    @cache
+    def covers_from(covering_index: int, covered_index: int) -> bool:
+        if covering_index == len(covering):
+            return covered_index == len(covered)
+
+        kind, value = covering[covering_index]
+        if kind == _CHAIN:
+            # Every package expression spans at least one package, so any non-empty run of them fits into the chain.
+            return any(covers_from(covering_index + 1, end) for end in range(covered_index + 1, len(covered) + 1))
+        if covered_index == len(covered):
+            return False
+
+        covered_kind, covered_value = covered[covered_index]
+        if kind == _ANY:
+            symbol_covered = covered_kind in _SINGLE_PACKAGE_KINDS
+        else:
+            symbol_covered = (kind, value) == (covered_kind, covered_value)
+        return symbol_covered and covers_from(covering_index + 1, covered_index + 1)
+
+    return covers_from(0, 0)
+
+
+def is_subsumed(import_expression: ImportExpression, by: ImportExpression) -> bool:
+    """
+    Whether every import conforming to the import expression also conforms to the other one, decided on the
+    expressions alone. Only reports subsumption it can prove, some subsumed expressions go unnoticed.
+    """
+    if import_expression.import_type != by.import_type:
+        return False
+
+    defining_symbols, by_defining_symbols = _defining_symbols(import_expression), _defining_symbols(by)
+    using_symbols, by_using_symbols = _using_symbols(import_expression), _using_symbols(by)
+    if defining_symbols is None or by_defining_symbols is None or using_symbols is None or by_using_symbols is None:
+        return False
+
+    if str(import_expression.defining_module_expr) == str(by.defining_module_expr):
+        # Same defining module expression, so both bind the same variables and bound packages can be compared as is.
+        return _covers(by_using_symbols, using_symbols)
+    if by.using_module_expr.variable_names:
+        return False
+    return _covers(by_defining_symbols, defining_symbols) and _covers(by_using_symbols, using_symbols)
+
+
+def ambiguous_wildcards(symbols: Sequence[_Symbol]) -> list[str]:
+    """
+    Fragments where two multi package wildcards are only separated by single package wildcards. Nothing anchors the
+    split of the packages between them, so a failing match tries every split.
+    """
+    fragments = []
+    previous_chain = None
+    for index, (kind, _) in enumerate(symbols):
+        if kind == _CHAIN:
+            if previous_chain is not None:
+                fragments.append('.'.join(_symbol_text(symbol) for symbol in symbols[previous_chain:index + 1]))
+            previous_chain = index
+        elif kind != _ANY:
+            previous_chain = None
+    return fragments
+
+
+def analyze_import_expressions(import_expressions: Sequence[ImportExpression]) -> list[str]:
+    """
+    Describes ambiguous wildcards and import expressions subsumed by an earlier one.
+    """
+    findings = []
+    for position, import_expression in enumerate(import_expressions):
+        for symbols in (_defining_symbols(import_expression), _using_symbols(import_expression)):
+            for fragment in ambiguous_wildcards(symbols or []):
+                findings.append(
+                    f"Import expression '{import_expression.text}' has ambiguous wildcards '{fragment}'. Matching tries "
+                    f"every split of the packages between them, which is slow on deep modules."
+                )
+
+        for earlier_import_expression in import_expressions[:position]:
+            if is_subsumed(import_expression, by=earlier_import_expression):
+                findings.append(
+                    f"Import expression '{import_expression.text}' is covered by the earlier import expression "
+                    f"'{earlier_import_expression.text}' and never changes the result."
+                )
+                break
+    return findings
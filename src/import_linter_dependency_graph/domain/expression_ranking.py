@@ -0,0 +1,48 @@
+from enum import Enum
+from typing import Iterable, Optional
+
+
+class ExpressionOrder(Enum):
+    CONFIGURED = 'configured'
+    ADAPTIVE = 'adaptive'
+    PERSISTED = 'persisted'
+
+
+class ExpressionRanking:
+    """
+    Counts how many imports every import expression accepted, so the most successful expressions are tried first.
+    As an import is valid if any expression accepts it, the order only changes the cost of a check, not its result.
+    """
+
+    _hits: list[int]
+    _new_hits: list[int]
+
+    def __init__(self, expression_count: int, hits: Optional[list[int]] = None):
+        self._hits = list(hits) if hits is not None and len(hits) == expression_count else [0] * expression_count
+        self._new_hits = [0] * expression_count
+
+    @property
+    def hits(self) -> list[int]:
+        return self._hits
+
+    def order(self, positions: Iterable[int]) -> list[int]:
+        """
+        The positions by descending hits, ties in configured order.
+        """
+        hits = self._hits
+        return sorted(positions, key=lambda position: (-hits[position], position))
+
+    def record_hits(self, position: int, count: int = 1):
+        self._hits[position] += count
+        self._new_hits[position] += count
+
+    def take_new_hits(self) -> list[int]:
+        """
+        Returns the hits recorded since the last call, so workers can report them while keeping their own ranking.
+        """
+        new_hits, self._new_hits = self._new_hits, [0] * len(self._new_hits)
+        return new_hits
+
+    def add_hits(self, hits: list[int]):
+        for position, count in enumerate(hits):
+            self._hits[position] += count
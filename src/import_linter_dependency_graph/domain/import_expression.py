@@ -1,5 +1,6 @@
 from importlinter.domain.imports import ValueObject
 from enum import Enum
+from typing import Optional
 
 from import_linter_dependency_graph.domain.defining_module_expression import DefiningModuleExpression
 from import_linter_dependency_graph.domain.using_module_expression import UsingModuleExpression
@@ -14,11 +15,13 @@ class ImportExpression(ValueObject):
     _import_type: ImportType
     _defining_module_expr: DefiningModuleExpression
     _using_module_expr: UsingModuleExpression
+    _text: Optional[str]
 
-    def __init__(self, import_type: ImportType, defining_module_expr: DefiningModuleExpression, using_module_expr: UsingModuleExpression):
+    def __init__(self, import_type: ImportType, defining_module_expr: DefiningModuleExpression, using_module_expr: UsingModuleExpression, text: Optional[str] = None):
         self._import_type = import_type
         self._defining_module_expr = defining_module_expr
         self._using_module_expr = using_module_expr
+        self._text = text
 
     @property
     def import_type(self)-> ImportType:
@@ -32,6 +35,13 @@ class ImportExpression(ValueObject):
     def using_module_expr(self)-> UsingModuleExpression:
         return self._using_module_expr
 
+    @property
+    def text(self) -> str:
+        """
+        The import expression as configured, for reports. Falls back to the compiled form if not parsed from text.
+        """
+        return self._text if self._text is not None else str(self)
+
     def __str__(self):
         if self._import_type == ImportType.IMPORTING:
             return f"{self._defining_module_expr}{self._import_type}{self._using_module_expr}"
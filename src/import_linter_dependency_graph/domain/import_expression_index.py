@@ -0,0 +1,53 @@
+from import_linter_dependency_graph.domain.import_expression import ImportExpression, ImportType
+
+
+class _PrefixTrieNode:
+
+    children: dict[str, "_PrefixTrieNode"]
+    positions: list[int]
+
+    def __init__(self):
+        self.children = {}
+        self.positions = []
+
+
+class ImportExpressionIndex:
+    """
+    Dispatch index over the literal prefixes of the defining module expressions.
+
+    For a given module it returns the positions of all import expressions of one import type whose defining module
+    expression could match the module, in their configured order. Expressions starting with a wildcard or variable
+    have an empty literal prefix and are candidates for every module.
+    """
+
+    _roots: dict[ImportType, _PrefixTrieNode]
+    _candidates_by_module: dict[tuple[ImportType, str], tuple[int, ...]]
+
+    def __init__(self, import_expressions: list[ImportExpression]):
+        self._roots = {import_type: _PrefixTrieNode() for import_type in ImportType}
+        self._candidates_by_module = {}
+
+        for position, import_expression in enumerate(import_expressions):
+            node = self._roots[import_expression.import_type]
+            for package in import_expression.defining_module_expr.literal_prefix:
+                node = node.children.setdefault(package, _PrefixTrieNode())
+            node.positions.append(position)
+
+    def candidates(self, import_type: ImportType, module: str) -> tuple[int, ...]:
+        key = (import_type, module)
+        candidates = self._candidates_by_module.get(key, None)
+        if candidates is None:
+            candidates = self._lookup(import_type, module)
+            self._candidates_by_module[key] = candidates
+        return candidates
+
+    def _lookup(self, import_type: ImportType, module: str) -> tuple[int, ...]:
+        node = self._roots[import_type]
+        positions = list(node.positions)
+        for package in module.split('.'):
+            child = node.children.get(package, None)
+            if child is None:
+                break
+            node = child
+            positions.extend(node.positions)
+        return tuple(sorted(positions))
@@ -0,0 +1,170 @@
+import time
+from typing import Any, Callable, Iterable, Iterator, Optional
+
+from import_linter_dependency_graph.domain.import_expression import ImportExpression, ImportType
+from import_linter_dependency_graph.domain.matching_engine import ImportExpressionMatcher
+
+
+class ExpressionStatistics:
+    """
+    Counters of one import expression. Attempts count the modules tested, hits the modules that matched.
+    """
+
+    __slots__ = ('defining_attempts', 'defining_hits', 'using_attempts', 'using_hits', 'match_seconds')
+
+    defining_attempts: int
+    defining_hits: int
+    using_attempts: int
+    using_hits: int
+    match_seconds: float
+
+    def __init__(self):
+        self.defining_attempts = 0
+        self.defining_hits = 0
+        self.using_attempts = 0
+        self.using_hits = 0
+        self.match_seconds = 0.0
+
+    def merge(self, other: "ExpressionStatistics"):
+        self.defining_attempts += other.defining_attempts
+        self.defining_hits += other.defining_hits
+        self.using_attempts += other.using_attempts
+        self.using_hits += other.using_hits
+        self.match_seconds += other.match_seconds
+
+    def as_dict(self) -> dict[str, Any]:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+class MatchStatistics:
+    """
+    Statistics of one check: counters per import expression (by position) and the number of imports evaluated.
+    """
+
+    _expressions: list[ExpressionStatistics]
+    _edges_scanned: int
+
+    def __init__(self, expression_count: int):
+        self._expressions = [ExpressionStatistics() for _ in range(expression_count)]
+        self._edges_scanned = 0
+
+    @property
+    def expressions(self) -> list[ExpressionStatistics]:
+        return self._expressions
+
+    @property
+    def edges_scanned(self) -> int:
+        return self._edges_scanned
+
+    def count_edges(self, edges: Iterable[tuple[str, str]]) -> Iterator[tuple[str, str]]:
+        for edge in edges:
+            self._edges_scanned += 1
+            yield edge
+
+    def add_edges_scanned(self, count: int):
+        self._edges_scanned += count
+
+    def merge(self, other: "MatchStatistics"):
+        for statistics, other_statistics in zip(self._expressions, other._expressions):
+            statistics.merge(other_statistics)
+        self._edges_scanned += other._edges_scanned
+
+    def take(self) -> "MatchStatistics":
+        """
+        Returns the statistics collected so far and starts counting from zero, so workers can report increments.
+        """
+        taken = MatchStatistics(0)
+        taken._expressions, taken._edges_scanned = self._expressions, self._edges_scanned
+        self._expressions = [ExpressionStatistics() for _ in taken._expressions]
+        self._edges_scanned = 0
+        return taken
+
+
+class InstrumentedMatcher(ImportExpressionMatcher):
+    """
+    Matcher counting attempts, hits and match time per import expression of the wrapped matcher.
+
+    If the wrapped matcher matches the defining module expressions of one import type together, every such call counts
+    as an attempt of each of them, and its time is split evenly between them. Measuring adds a clock read per match,
+    so instrumentation is only enabled on request.
+    """
+
+    _matcher: ImportExpressionMatcher
+    _statistics: MatchStatistics
+
+    def __init__(self, matcher: ImportExpressionMatcher):
+        super().__init__(matcher._import_expressions, matcher._expression_index)
+        self._matcher = matcher
+        self._statistics = MatchStatistics(len(self._import_expressions))
+
+    @property
+    def statistics(self) -> MatchStatistics:
+        return self._statistics
+
+    def match_defining(self, import_expression: ImportExpression, module: str) -> Optional[dict[str, str]]:
+        return self._matcher.match_defining(import_expression, module)
+
+    def match_defining_at(self, position: int, module: str) -> Optional[dict[str, str]]:
+        statistics = self._statistics.expressions[position]
+        start = time.perf_counter()
+        variables = self._matcher.match_defining_at(position, module)
+        statistics.match_seconds += time.perf_counter() - start
+        statistics.defining_attempts += 1
+        if variables is not None:
+            statistics.defining_hits += 1
+        return variables
+
+    def iter_defining_matches(self, import_type: ImportType, module: str) -> Iterator[tuple[int, dict[str, str]]]:
+        positions = self._matcher.combined_defining_positions(import_type)
+        if positions is None:
+            # Candidates are looked up here, so every match_defining call of the wrapped matcher passes this matcher.
+            return super().iter_defining_matches(import_type, module)
+        if not positions:
+            return iter(())
+
+        start = time.perf_counter()
+        defining_matches = list(self._matcher.iter_defining_matches(import_type, module))
+        seconds_per_expression = (time.perf_counter() - start) / len(positions)
+        for position in positions:
+            statistics = self._statistics.expressions[position]
+            statistics.defining_attempts += 1
+            statistics.match_seconds += seconds_per_expression
+        for position, _ in defining_matches:
+            self._statistics.expressions[position].defining_hits += 1
+        return iter(defining_matches)
+
+    def combined_defining_positions(self, import_type: ImportType) -> Optional[tuple[int, ...]]:
+        return self._matcher.combined_defining_positions(import_type)
+
+    def match_using(self, import_expression: ImportExpression, variables: dict[str, str], module: str) -> bool:
+        return self._matcher.match_using(import_expression, variables, module)
+
+    def match_using_at(self, position: int, variables: dict[str, str], module: str) -> bool:
+        statistics = self._statistics.expressions[position]
+        start = time.perf_counter()
+        matches = self._matcher.match_using_at(position, variables, module)
+        statistics.match_seconds += time.perf_counter() - start
+        statistics.using_attempts += 1
+        if matches:
+            statistics.using_hits += 1
+        return matches
+
+    def using_matcher(self, import_expression: ImportExpression, variables: dict[str, str]) -> Callable[[str], bool]:
+        return self._matcher.using_matcher(import_expression, variables)
+
+    def using_matcher_at(self, position: int, variables: dict[str, str]) -> Callable[[str], bool]:
+        statistics = self._statistics.expressions[position]
+        start = time.perf_counter()
+        using_matches = self._matcher.using_matcher_at(position, variables)
+        statistics.match_seconds += time.perf_counter() - start
+
+        def instrumented_using_matches(module: str) -> bool:
+            start = time.perf_counter()
+            matches = using_matches(module)
+            statistics.match_seconds += time.perf_counter() - start
+            statistics.using_attempts += 1
+            if matches:
+                statistics.using_hits += 1
+            return matches
+
+        return instrumented_using_matches
@@ -0,0 +1,181 @@
+import copy
+from abc import ABC, abstractmethod
+from enum import Enum
+from typing import Callable, Iterator, Optional
+
+from import_linter_dependency_graph.domain.combined_defining_pattern import CombinedDefiningPattern
+from import_linter_dependency_graph.domain.import_expression import ImportExpression, ImportType
+from import_linter_dependency_graph.domain.import_expression_index import ImportExpressionIndex
+
+
+class MatchingEngine(Enum):
+    REGEX = 'regex'
+    COMBINED_REGEX = 'combined-regex'
+    SEGMENT = 'segment'
+
+
+class ImportExpressionMatcher(ABC):
+    """
+    Matches modules against the defining and using module expressions of import expressions.
+    """
+
+    _import_expressions: list[ImportExpression]
+    _expression_index: ImportExpressionIndex
+
+    def __init__(self, import_expressions: list[ImportExpression], expression_index: ImportExpressionIndex):
+        self._import_expressions = import_expressions
+        self._expression_index = expression_index
+
+    def with_import_expressions(self, import_expressions: list[ImportExpression]) -> "ImportExpressionMatcher":
+        """
+        A copy of this matcher for other import expressions of the same texts, like the configured ones after loading
+        the matcher from an artifact. Everything built from the expressions is shared with this matcher.
+        """
+        matcher = copy.copy(self)
+        matcher._import_expressions = import_expressions
+        return matcher
+
+    @abstractmethod
+    def match_defining(self, import_expression: ImportExpression, module: str) -> Optional[dict[str, str]]:
+        """
+        Returns the variables captured by the defining module expression, or None if the module does not match.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def match_using(self, import_expression: ImportExpression, variables: dict[str, str], module: str) -> bool:
+        raise NotImplementedError
+
+    @abstractmethod
+    def using_matcher(self, import_expression: ImportExpression, variables: dict[str, str]) -> Callable[[str], bool]:
+        """
+        Returns a predicate matching modules against the using module expression bound to the given variables,
+        compiling the bound expression only once for all modules tested with it.
+        """
+        raise NotImplementedError
+
+    def iter_defining_matches(self, import_type: ImportType, module: str) -> Iterator[tuple[int, dict[str, str]]]:
+        """
+        Yields position and captured variables of every import expression of the given type whose defining module
+        expression matches the module, in configured order. Lazily evaluated, so consumers can stop at the first
+        sufficient match.
+        """
+        for position in self.candidate_positions(import_type, module):
+            variables = self.match_defining_at(position, module)
+            if variables is not None:
+                yield position, variables
+
+    def match_defining_at(self, position: int, module: str) -> Optional[dict[str, str]]:
+        """
+        Like match_defining, for the import expression at the given position. Import expressions of the same text are
+        one object, so only the position tells them apart.
+        """
+        return self.match_defining(self._import_expressions[position], module)
+
+    def match_using_at(self, position: int, variables: dict[str, str], module: str) -> bool:
+        return self.match_using(self._import_expressions[position], variables, module)
+
+    def using_matcher_at(self, position: int, variables: dict[str, str]) -> Callable[[str], bool]:
+        return self.using_matcher(self._import_expressions[position], variables)
+
+    def candidate_positions(self, import_type: ImportType, module: str) -> tuple[int, ...]:
+        """
+        Positions of the import expressions of the given type whose defining module expression can match the module.
+        """
+        return self._expression_index.candidates(import_type, module)
+
+    def combined_defining_positions(self, import_type: ImportType) -> Optional[tuple[int, ...]]:
+        """
+        Positions of the import expressions matched together by a single iter_defining_matches call, or None if
+        iter_defining_matches calls match_defining per import expression.
+        """
+        return None
+
+
+class RegexMatcher(ImportExpressionMatcher):
+
+    def match_defining(self, import_expression: ImportExpression, module: str) -> Optional[dict[str, str]]:
+        match = import_expression.defining_module_expr.pattern.fullmatch(module)
+        return match.groupdict() if match is not None else None
+
+    def match_using(self, import_expression: ImportExpression, variables: dict[str, str], module: str) -> bool:
+        return import_expression.using_module_expr.compile(variables).fullmatch(module) is not None
+
+    def using_matcher(self, import_expression: ImportExpression, variables: dict[str, str]) -> Callable[[str], bool]:
+        pattern = import_expression.using_module_expr.compile(variables)
+        return lambda module: pattern.fullmatch(module) is not None
+
+
+class CombinedRegexMatcher(RegexMatcher):
+    """
+    Regex matcher running all defining module expressions of one import type in a single match call.
+    """
+
+    _positions: dict[ImportType, tuple[int, ...]]
+    _combined_patterns: dict[ImportType, CombinedDefiningPattern]
+
+    def __init__(self, import_expressions: list[ImportExpression], expression_index: ImportExpressionIndex):
+        super().__init__(import_expressions, expression_index)
+        self._positions = {
+            import_type: tuple(
+                position
+                for position, import_expression in enumerate(import_expressions)
+                if import_expression.import_type == import_type
+            )
+            for import_type in ImportType
+        }
+        self._combined_patterns = {
+            import_type: CombinedDefiningPattern([
+                (position, import_expressions[position].defining_module_expr)
+                for position in positions
+            ])
+            for import_type, positions in self._positions.items()
+        }
+
+    def iter_defining_matches(self, import_type: ImportType, module: str) -> Iterator[tuple[int, dict[str, str]]]:
+        return iter(self._combined_patterns[import_type].match_all(module))
+
+    def combined_defining_positions(self, import_type: ImportType) -> Optional[tuple[int, ...]]:
+        return self._positions[import_type]
+
+
+class SegmentMatcher(ImportExpressionMatcher):
+    """
+    Matches pre-split module segments instead of module names. Every module is split only once.
+    """
+
+    _segments_by_module: dict[str, tuple[str, ...]]
+
+    def __init__(self, import_expressions: list[ImportExpression], expression_index: ImportExpressionIndex):
+        super().__init__(import_expressions, expression_index)
+        self._segments_by_module = {}
+
+    def segments(self, module: str) -> tuple[str, ...]:
+        segments = self._segments_by_module.get(module, None)
+        if segments is None:
+            segments = tuple(module.split('.'))
+            self._segments_by_module[module] = segments
+        return segments
+
+    def match_defining(self, import_expression: ImportExpression, module: str) -> Optional[dict[str, str]]:
+        segment_pattern = import_expression.defining_module_expr.segment_pattern
+        if segment_pattern is None:
+            # Defining module expressions not parsed from text have no segment pattern, only their regex.
+            match = import_expression.defining_module_expr.pattern.fullmatch(module)
+            return match.groupdict() if match is not None else None
+        return segment_pattern.match(self.segments(module))
+
+    def match_using(self, import_expression: ImportExpression, variables: dict[str, str], module: str) -> bool:
+        return import_expression.using_module_expr.compile_segments(variables).match(self.segments(module)) is not None
+
+    def using_matcher(self, import_expression: ImportExpression, variables: dict[str, str]) -> Callable[[str], bool]:
+        segment_pattern = import_expression.using_module_expr.compile_segments(variables)
+        return lambda module: segment_pattern.match(self.segments(module)) is not None
+
+
+def create_matcher(matching_engine: MatchingEngine, import_expressions: list[ImportExpression], expression_index: ImportExpressionIndex) -> ImportExpressionMatcher:
+    if matching_engine == MatchingEngine.SEGMENT:
+        return SegmentMatcher(import_expressions, expression_index)
+    elif matching_engine == MatchingEngine.COMBINED_REGEX:
+        return CombinedRegexMatcher(import_expressions, expression_index)
+    return RegexMatcher(import_expressions, expression_index)
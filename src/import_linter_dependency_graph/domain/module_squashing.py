@@ -0,0 +1,96 @@
+from typing import Optional, Sequence
+
+from import_linter_dependency_graph.domain.import_expression import ImportExpression, ImportType
+from import_linter_dependency_graph.domain.segment_pattern import SegmentToken, SegmentTokenKind
+
+
+# What a package expression tells about the segments it matches.
+_SINGLE = 'single'          # exactly one segment, decided by that segment alone
+_CHAIN = 'chain'            # any number of segments, all accepted
+_UNBOUNDED = 'unbounded'    # segments the verdict depends on, at any depth
+
+
+def _depth(kinds: Sequence[str]) -> Optional[int]:
+    """
+    Number of leading segments deciding whether a module matches, or None if there is no such number. Leading single
+    package expressions decide as many segments, and one more segment tells apart modules ending there (no trailing
+    chain) or continuing below (trailing chain).
+    """
+    leading = 0
+    while leading < len(kinds) and kinds[leading] == _SINGLE:
+        leading += 1
+    if leading == len(kinds) or (leading == len(kinds) - 1 and kinds[leading] == _CHAIN):
+        return leading + 1
+    return None
+
+
+def _defining_kinds(import_expression: ImportExpression) -> Optional[list[str]]:
+    segment_pattern = import_expression.defining_module_expr.segment_pattern
+    if segment_pattern is None:
+        return None
+    used_variable_names = set(import_expression.using_module_expr.variable_names)
+    kinds = []
+    for token in segment_pattern.tokens:
+        if token.kind != SegmentTokenKind.CHAIN:
+            kinds.append(_SINGLE)
+        elif token.variable is not None and token.variable in used_variable_names:
+            # Where the captured packages end decides the verdict.
+            kinds.append(_UNBOUNDED)
+        else:
+            kinds.append(_CHAIN)
+    return kinds
+
+
+def _using_kinds(import_expression: ImportExpression) -> Optional[list[str]]:
+    segment_pattern = import_expression.defining_module_expr.segment_pattern
+    segment_template = import_expression.using_module_expr.segment_template
+    if segment_pattern is None or segment_template is None:
+        return None
+    # Variables captured within a single package never contain a dot, so they bind to a single package again.
+    single_package_variable_names = {
+        variable_name
+        for token in segment_pattern.tokens if token.kind == SegmentTokenKind.REGEX and token.pattern is not None
+        for variable_name in token.pattern.groupindex
+    }
+    kinds = []
+    for package_expr in segment_template.package_exprs:
+        if isinstance(package_expr, SegmentToken):
+            kinds.append(_CHAIN if package_expr.kind == SegmentTokenKind.CHAIN else _SINGLE)
+        elif all(variable_name is None or variable_name in single_package_variable_names for _, variable_name in package_expr):
+            kinds.append(_SINGLE)
+        else:
+            kinds.append(_UNBOUNDED)
+    return kinds
+
+
+def squash_depths(import_expressions: Sequence[ImportExpression]) -> Optional[tuple[int, int]]:
+    """
+    Numbers of leading segments of importer and imported deciding the verdict of an import under all the import
+    expressions, or None if a verdict can depend on segments at any depth. Imports whose modules agree in these
+    segments get the same verdict, so only one of them needs to be evaluated.
+    """
+    importer_depth = imported_depth = 1
+    for import_expression in import_expressions:
+        defining_kinds, using_kinds = _defining_kinds(import_expression), _using_kinds(import_expression)
+        if defining_kinds is None or using_kinds is None:
+            return None
+        defining_depth, using_depth = _depth(defining_kinds), _depth(using_kinds)
+        if defining_depth is None or using_depth is None:
+            return None
+        if import_expression.import_type == ImportType.IMPORTING:
+            importer_depth, imported_depth = max(importer_depth, defining_depth), max(imported_depth, using_depth)
+        else:
+            importer_depth, imported_depth = max(importer_depth, using_depth), max(imported_depth, defining_depth)
+    return importer_depth, imported_depth
+
+
+def squash_module(module: str, depth: int) -> str:
+    """
+    The module cut to its leading segments.
+    """
+    separator_index = -1
+    for _ in range(depth):
+        separator_index = module.find('.', separator_index + 1)
+        if separator_index == -1:
+            return module
+    return module[:separator_index]
@@ -0,0 +1,179 @@
+import re
+from enum import Enum
+from typing import Optional, Sequence
+
+
+class SegmentTokenKind(Enum):
+    LITERAL = 'literal'      # exactly one package with the given name
+    ANY = 'any'              # exactly one arbitrary package
+    REGEX = 'regex'          # exactly one package matching a regular expression, possibly capturing variables
+    CHAIN = 'chain'          # at least one arbitrary package, eager or lazy, possibly captured in a variable
+
+
+class SegmentToken:
+    """
+    One package expression of a module expression, matched against one (or for chains several) module segments.
+    """
+
+    __slots__ = ('kind', 'literal', 'pattern', 'lazy', 'variable')
+
+    kind: SegmentTokenKind
+    literal: Optional[str]
+    pattern: Optional[re.Pattern[str]]
+    lazy: bool
+    variable: Optional[str]
+
+    def __init__(self, kind: SegmentTokenKind, literal: Optional[str] = None, pattern: Optional[re.Pattern[str]] = None, lazy: bool = False, variable: Optional[str] = None):
+        self.kind = kind
+        self.literal = literal
+        self.pattern = pattern
+        self.lazy = lazy
+        self.variable = variable
+
+    @classmethod
+    def literal_package(cls, name: str) -> "SegmentToken":
+        return cls(SegmentTokenKind.LITERAL, literal=name)
+
+    @classmethod
+    def any_package(cls) -> "SegmentToken":
+        return cls(SegmentTokenKind.ANY)
+
+    @classmethod
+    def package_regex(cls, regex: str) -> "SegmentToken":
+        return cls(SegmentTokenKind.REGEX, pattern=re.compile(regex))
+
+    @classmethod
+    def package_chain(cls, lazy: bool, variable: Optional[str] = None) -> "SegmentToken":
+        return cls(SegmentTokenKind.CHAIN, lazy=lazy, variable=variable)
+
+    def __str__(self):
+        if self.kind == SegmentTokenKind.LITERAL:
+            return self.literal
+        elif self.kind == SegmentTokenKind.ANY:
+            return '*'
+        elif self.kind == SegmentTokenKind.REGEX:
+            return self.pattern.pattern
+        chain = '**?' if self.lazy else '**'
+        return f"[{chain}{self.variable}]" if self.variable else chain
+
+
+class SegmentPattern:
+    """
+    Module expression matched against pre-split module segments instead of the dotted module name.
+
+    Matching is a depth first search over (token, segment) positions, trying the package counts of chains in the same
+    order as the regular expression engine would (eager: most packages first, lazy: fewest packages first). Thus the
+    first successful match captures the same variables as the regular expression. Failed positions are memoized, so
+    every position is explored at most once and deep modules cannot cause exponential backtracking.
+    """
+
+    _tokens: tuple[SegmentToken, ...]
+    _min_remaining: tuple[int, ...]
+    _is_fixed_length: bool
+
+    def __init__(self, tokens: Sequence[SegmentToken]):
+        self._tokens = tuple(tokens)
+        # Every token consumes at least one segment, so the tokens from index i on need at least len(tokens) - i segments.
+        self._min_remaining = tuple(range(len(self._tokens), -1, -1))
+        self._is_fixed_length = all(token.kind != SegmentTokenKind.CHAIN for token in self._tokens)
+
+    @property
+    def tokens(self) -> tuple[SegmentToken, ...]:
+        return self._tokens
+
+    @property
+    def literal_prefix(self) -> tuple[str, ...]:
+        """
+        Leading literal packages. Every matching module starts with them.
+        """
+        literal_prefix = []
+        for token in self._tokens:
+            if token.kind != SegmentTokenKind.LITERAL or token.literal is None:
+                break
+            literal_prefix.append(token.literal)
+        return tuple(literal_prefix)
+
+    def match(self, segments: Sequence[str]) -> Optional[dict[str, str]]:
+        """
+        Returns the captured variables if the whole module matches, None otherwise.
+        """
+        if len(segments) < len(self._tokens) or (self._is_fixed_length and len(segments) != len(self._tokens)):
+            return None
+
+        captures: dict[str, str] = {}
+        failed: set[tuple[int, int]] = set()
+        tokens = self._tokens
+        min_remaining = self._min_remaining
+        segment_count = len(segments)
+
+        def match_from(token_index: int, segment_index: int) -> bool:
+            if token_index == len(tokens):
+                return segment_index == segment_count
+            if (token_index, segment_index) in failed:
+                return False
+
+            token = tokens[token_index]
+            if token.kind == SegmentTokenKind.CHAIN:
+                max_taken = segment_count - segment_index - min_remaining[token_index + 1]
+                taken_counts = range(1, max_taken + 1) if token.lazy else range(max_taken, 0, -1)
+                for taken in taken_counts:
+                    if match_from(token_index + 1, segment_index + taken):
+                        if token.variable is not None:
+                            captures[token.variable] = '.'.join(segments[segment_index:segment_index + taken])
+                        return True
+            elif segment_index < segment_count:
+                segment = segments[segment_index]
+                if token.kind == SegmentTokenKind.LITERAL:
+                    segment_matches, segment_captures = token.literal == segment, None
+                elif token.kind == SegmentTokenKind.ANY:
+                    segment_matches, segment_captures = True, None
+                else:
+                    segment_match = token.pattern.fullmatch(segment) if token.pattern is not None else None
+                    segment_matches, segment_captures = segment_match is not None, segment_match
+                if segment_matches and match_from(token_index + 1, segment_index + 1):
+                    if segment_captures is not None:
+                        captures.update(segment_captures.groupdict())
+                    return True
+
+            failed.add((token_index, segment_index))
+            return False
+
+        return captures if match_from(0, 0) else None
+
+    def __str__(self):
+        return '.'.join(str(token) for token in self._tokens)
+
+
+class UsingSegmentTemplate:
+    """
+    Using module expression in segment form. Package expressions referring to variables are kept as text parts and
+    only turned into literal packages when bound, as a captured variable may span several packages.
+    """
+
+    # Each package expression is either a token or a list of (literal text, variable name) parts.
+    _package_exprs: tuple[SegmentToken | tuple[tuple[str, Optional[str]], ...], ...]
+
+    def __init__(self, package_exprs: Sequence[SegmentToken | tuple[tuple[str, Optional[str]], ...]]):
+        self._package_exprs = tuple(package_exprs)
+
+    @property
+    def package_exprs(self) -> tuple[SegmentToken | tuple[tuple[str, Optional[str]], ...], ...]:
+        return self._package_exprs
+
+    def bind(self, variables: dict[str, str]) -> SegmentPattern:
+        tokens: list[SegmentToken] = []
+        for package_expr in self._package_exprs:
+            if isinstance(package_expr, SegmentToken):
+                tokens.append(package_expr)
+                continue
+
+            text = []
+            for literal, variable_name in package_expr:
+                text.append(literal)
+                if variable_name is not None:
+                    value = variables.get(variable_name, None)
+                    if value is None:
+                        raise ValueError(f"Requiring variable '{variable_name}'")
+                    text.append(value)
+            tokens.extend(SegmentToken.literal_package(package) for package in ''.join(text).split('.'))
+        return SegmentPattern(tokens)
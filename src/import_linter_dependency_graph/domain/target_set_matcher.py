@@ -0,0 +1,90 @@
+import bisect
+from typing import Callable, Iterable, Iterator, Optional
+
+from import_linter_dependency_graph.domain.import_expression import ImportExpression, ImportType
+from import_linter_dependency_graph.domain.matching_engine import ImportExpressionMatcher
+
+
+DEFAULT_TARGET_SET_MEMORY_CAP = 1_000_000
+
+# Sorts directly after '.', so all descendants of a package lie in the range [package + '.', package + '/').
+_AFTER_SEPARATOR = '/'
+
+
+class TargetSetMatcher(ImportExpressionMatcher):
+    """
+    Matcher resolving every distinct (using module expression, variable binding) only once against the known modules.
+
+    The matching modules are kept as a frozenset, so testing an import becomes a membership test. Only modules below
+    the literal prefix of the bound expression are scanned, found by bisecting the sorted module names. The total
+    number of modules held in all sets is capped; bindings whose set would exceed the remaining capacity fall back to
+    the wrapped matcher.
+    """
+
+    _matcher: ImportExpressionMatcher
+    _sorted_modules: list[str]
+    _memory_cap: int
+    _memory_used: int
+    _target_sets: dict[tuple[int, tuple[Optional[str], ...]], Optional[frozenset[str]]]
+
+    def __init__(self, matcher: ImportExpressionMatcher, modules: Iterable[str], memory_cap: int = DEFAULT_TARGET_SET_MEMORY_CAP):
+        super().__init__(matcher._import_expressions, matcher._expression_index)
+        self._matcher = matcher
+        self._sorted_modules = sorted(modules)
+        self._memory_cap = memory_cap
+        self._memory_used = 0
+        self._target_sets = {}
+
+    @property
+    def memory_used(self) -> int:
+        return self._memory_used
+
+    def match_defining(self, import_expression: ImportExpression, module: str) -> Optional[dict[str, str]]:
+        return self._matcher.match_defining(import_expression, module)
+
+    def iter_defining_matches(self, import_type: ImportType, module: str) -> Iterator[tuple[int, dict[str, str]]]:
+        return self._matcher.iter_defining_matches(import_type, module)
+
+    def combined_defining_positions(self, import_type: ImportType) -> Optional[tuple[int, ...]]:
+        return self._matcher.combined_defining_positions(import_type)
+
+    def match_using(self, import_expression: ImportExpression, variables: dict[str, str], module: str) -> bool:
+        return self.using_matcher(import_expression, variables)(module)
+
+    def using_matcher(self, import_expression: ImportExpression, variables: dict[str, str]) -> Callable[[str], bool]:
+        target_set = self._target_set(import_expression, variables)
+        if target_set is None:
+            return self._matcher.using_matcher(import_expression, variables)
+        return target_set.__contains__
+
+    def _target_set(self, import_expression: ImportExpression, variables: dict[str, str]) -> Optional[frozenset[str]]:
+        using_module_expr = import_expression.using_module_expr
+        key = (id(import_expression), tuple(variables.get(variable_name, None) for variable_name in using_module_expr.variable_names))
+        if key in self._target_sets:
+            return self._target_sets[key]
+
+        target_set = None
+        remaining_capacity = self._memory_cap - self._memory_used
+        if remaining_capacity > 0:
+            using_matches = self._matcher.using_matcher(import_expression, variables)
+            matching_modules = []
+            for module in self._modules_below(using_module_expr.compile_segments(variables).literal_prefix):
+                if using_matches(module):
+                    matching_modules.append(module)
+                    if len(matching_modules) > remaining_capacity:
+                        break
+            else:
+                target_set = frozenset(matching_modules)
+                self._memory_used += len(target_set)
+
+        self._target_sets[key] = target_set
+        return target_set
+
+    def _modules_below(self, literal_prefix: tuple[str, ...]) -> list[str]:
+        if not literal_prefix:
+            return self._sorted_modules
+
+        package = '.'.join(literal_prefix)
+        start = bisect.bisect_left(self._sorted_modules, package)
+        end = bisect.bisect_left(self._sorted_modules, f"{package}{_AFTER_SEPARATOR}", lo=start)
+        return self._sorted_modules[start:end]
@@ -1,18 +1,91 @@
 import re
+from typing import Optional
 
 from importlinter.domain.imports import ValueObject
 
+from import_linter_dependency_graph.domain.segment_pattern import SegmentPattern, UsingSegmentTemplate
+from import_linter_dependency_graph.helpers.lru_cache import LruCache
+
 
 _REPLACE_VARIABLE_PATTERN = re.compile(r'\(\?=[A-Za-z0-9-_]+?\)')
 
+DEFAULT_COMPILE_CACHE_SIZE = 1024
+
 class UsingModuleExpression(ValueObject):
 
     _regex_template: str
+    _variable_names: tuple[str, ...]
+    _static_pattern: Optional[re.Pattern[str]]
+    _compile_cache: LruCache[tuple[Optional[str], ...], re.Pattern[str]]
+    _segment_template: Optional[UsingSegmentTemplate]
+    _static_segment_pattern: Optional[SegmentPattern]
+    _segment_compile_cache: LruCache[tuple[Optional[str], ...], SegmentPattern]
+    _reserved_compile_cache_size: Optional[int]
 
-    def __init__(self, regex_template: str):
+    def __init__(self, regex_template: str, compile_cache_size: int = DEFAULT_COMPILE_CACHE_SIZE, segment_template: Optional[UsingSegmentTemplate] = None):
         self._regex_template = regex_template
+        self._variable_names = tuple(dict.fromkeys(match.group(0)[3:-1] for match in _REPLACE_VARIABLE_PATTERN.finditer(regex_template)))
+        # Templates without variables compile to the same pattern for every binding.
+        self._static_pattern = re.compile(regex_template) if not self._variable_names else None
+        self._compile_cache = LruCache(compile_cache_size)
+        self._segment_template = segment_template
+        self._static_segment_pattern = segment_template.bind({}) if segment_template is not None and not self._variable_names else None
+        self._segment_compile_cache = LruCache(compile_cache_size)
+        self._reserved_compile_cache_size = None
+
+    @property
+    def variable_names(self) -> tuple[str, ...]:
+        return self._variable_names
+
+    @property
+    def segment_template(self) -> Optional[UsingSegmentTemplate]:
+        return self._segment_template
+
+    @property
+    def compile_cache(self) -> LruCache[tuple[Optional[str], ...], re.Pattern[str]]:
+        return self._compile_cache
+
+    @property
+    def segment_compile_cache(self) -> LruCache[tuple[Optional[str], ...], SegmentPattern]:
+        return self._segment_compile_cache
+
+    def reserve_compile_cache_size(self, compile_cache_size: int):
+        """
+        Sizes both compile caches for one user of the expression. An expression shared by several contracts keeps the
+        largest size any of them reserved.
+        """
+        if self._reserved_compile_cache_size is not None:
+            compile_cache_size = max(compile_cache_size, self._reserved_compile_cache_size)
+        self._reserved_compile_cache_size = compile_cache_size
+        self._compile_cache.resize(compile_cache_size)
+        self._segment_compile_cache.resize(compile_cache_size)
+
+    def compile(self, variables: dict[str,str]) -> re.Pattern[str]:
+        if self._static_pattern is not None:
+            return self._static_pattern
+
+        # Only the used variables are part of the key, so bindings differing in unused variables share a pattern.
+        binding = tuple(variables.get(variable_name, None) for variable_name in self._variable_names)
+        pattern = self._compile_cache.get(binding)
+        if pattern is None:
+            pattern = self._compile_uncached(variables)
+            self._compile_cache.put(binding, pattern)
+        return pattern
+
+    def compile_segments(self, variables: dict[str,str]) -> SegmentPattern:
+        if self._segment_template is None:
+            raise ValueError(f"Using module expression '{self}' has no segment template")
+        if self._static_segment_pattern is not None:
+            return self._static_segment_pattern
+
+        binding = tuple(variables.get(variable_name, None) for variable_name in self._variable_names)
+        segment_pattern = self._segment_compile_cache.get(binding)
+        if segment_pattern is None:
+            segment_pattern = self._segment_template.bind(variables)
+            self._segment_compile_cache.put(binding, segment_pattern)
+        return segment_pattern
 
-    def compile(self, variables: dict[str,str]):
+    def _compile_uncached(self, variables: dict[str,str]) -> re.Pattern[str]:
 
         def replace_variable(match: re.Match):
             variable_name = match.group(0)[3:-1]
@@ -25,4 +98,4 @@ class UsingModuleExpression(ValueObject):
         return re.compile(_REPLACE_VARIABLE_PATTERN.sub(replace_variable, self._regex_template))
 
     def __str__(self):
-        return self._regex_template
\ No newline at end of file
+        return self._regex_template
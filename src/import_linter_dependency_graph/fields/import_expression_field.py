@@ -10,12 +10,46 @@ from import_linter_dependency_graph.fields.module_expression_field import Defini
     UsingModuleExpressionField
 
 
+# Parsed import expressions by normalized text, shared by all contracts of the process. Parsing compiles every pattern
+# of an expression, and sharing also shares the compile caches of identical expressions.
+_interned_import_expressions: dict[str, ImportExpression] = {}
+
+
+def clear_interned_import_expressions():
+    _interned_import_expressions.clear()
+
+
+def intern_import_expressions(import_expressions: List[ImportExpression]):
+    """
+    Registers already parsed import expressions (e.g. loaded from a matcher artifact), so parsing their text returns
+    them. Expressions parsed before are kept.
+    """
+    for import_expression in import_expressions:
+        _interned_import_expressions.setdefault(import_expression.text, import_expression)
+
+
 class ImportExpressionField(Field[ImportExpression]):
 
-   def parse(self, expression: Union[str, List[str]]) -> ImportExpression:
+    def parse(self, expression: Union[str, List[str]]) -> ImportExpression:
         if isinstance(expression, list):
            raise ValidationError('Import Expression only allows single values')
 
+        for import_type in ImportType:
+            if import_type.value in expression:
+                left, _, right = expression.partition(import_type.value)
+                normalized_expression = f"{left.strip()} {import_type.value} {right.strip()}"
+                break
+        else:
+            raise ValidationError('')
+
+        import_expression = _interned_import_expressions.get(normalized_expression, None)
+        if import_expression is None:
+            import_expression = self._parse_normalized(normalized_expression)
+            _interned_import_expressions[normalized_expression] = import_expression
+        return import_expression
+
+    @staticmethod
+    def _parse_normalized(expression: str) -> ImportExpression:
         if '->' in expression:
 
             importer, _, imported = expression.partition('->')
@@ -23,18 +57,15 @@ class ImportExpressionField(Field[ImportExpression]):
             return ImportExpression(
                 import_type= ImportType.IMPORTING,
                 defining_module_expr=DefiningModuleExpressionField().parse(importer.strip()),
-                using_module_expr=UsingModuleExpressionField().parse(imported.strip())
+                using_module_expr=UsingModuleExpressionField().parse(imported.strip()),
+                text=expression,
             )
 
+        imported, _, importer = expression.partition('<-')
 
-        elif '<-' in expression:
-            imported, _, importer = expression.partition('<-')
-
-            return ImportExpression(
-                import_type= ImportType.IMPORTED,
-                defining_module_expr=DefiningModuleExpressionField().parse(imported.strip()),
-                using_module_expr=UsingModuleExpressionField().parse(importer.strip())
-            )
-
-        else:
-            raise ValidationError('')
\ No newline at end of file
+        return ImportExpression(
+            import_type= ImportType.IMPORTED,
+            defining_module_expr=DefiningModuleExpressionField().parse(imported.strip()),
+            using_module_expr=UsingModuleExpressionField().parse(importer.strip()),
+            text=expression,
+        )
\ No newline at end of file
@@ -0,0 +1,23 @@
+from typing import Union, List, Optional
+
+from importlinter.domain.fields import Field, ValidationError
+
+
+class IntegerField(Field[int]):
+
+    def __init__(self, *args, minimum: Optional[int] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.minimum = minimum
+
+    def parse(self, raw_data: Union[str, List[str]]) -> int:
+        if isinstance(raw_data, list):
+            raise ValidationError('Integer field only allows single values')
+
+        try:
+            value = int(raw_data)
+        except ValueError:
+            raise ValidationError(f"'{raw_data}' is not an integer.")
+
+        if self.minimum is not None and value < self.minimum:
+            raise ValidationError(f"'{raw_data}' must be at least {self.minimum}.")
+        return value
@@ -4,6 +4,7 @@ import re
 from importlinter.domain.fields import Field, FieldValue, ValidationError
 
 from import_linter_dependency_graph.domain.defining_module_expression import DefiningModuleExpression
+from import_linter_dependency_graph.domain.segment_pattern import SegmentPattern, SegmentToken, UsingSegmentTemplate
 from import_linter_dependency_graph.domain.using_module_expression import UsingModuleExpression
 
 # In contrast to the Python name definition, we:
@@ -28,6 +29,14 @@ _ANY_PACKAGE_REGEX=r"[^\.]+"
 _ANY_PACKAGE_CHAIN_GREEDY_REGEX=r"[^\.]+(?:\.[^\.]+)*"
 _ANY_PACKAGE_CHAIN_LAZY_REGEX=r"[^\.]+(?:\.[^\.]+)*?"
 
+def _literal_prefix(package_exprs: List[str]) -> tuple[str, ...]:
+    literal_prefix = []
+    for package_expr in package_exprs:
+        if '*' in package_expr or '[' in package_expr:
+            break
+        literal_prefix.append(package_expr)
+    return tuple(literal_prefix)
+
 class DefiningModuleExpressionField(Field[DefiningModuleExpression]):
 
     def parse(self, module_expr: Union[str, List[str]]) -> DefiningModuleExpression:
@@ -60,9 +69,28 @@ class DefiningModuleExpressionField(Field[DefiningModuleExpression]):
             else:
                 return parse_defining_non_wildcard_package(package_expr)
 
-        parsed_module_expr = r'\.'.join([parse_defining_package_expression(package_expr) for package_expr in module_expr.split('.')])
+        def parse_defining_segment_token(package_expr: str, package_regex: str) -> SegmentToken:
+            if package_expr == '*':
+                return SegmentToken.any_package()
+            elif package_expr == '**?':
+                return SegmentToken.package_chain(lazy=True)
+            elif package_expr == '**':
+                return SegmentToken.package_chain(lazy=False)
+            elif package_expr.startswith('[**?'):
+                return SegmentToken.package_chain(lazy=True, variable=_normalize_name(package_expr[4:-1]))
+            elif package_expr.startswith('[**'):
+                return SegmentToken.package_chain(lazy=False, variable=_normalize_name(package_expr[3:-1]))
+            elif '[' in package_expr:
+                return SegmentToken.package_regex(package_regex)
+            else:
+                return SegmentToken.literal_package(package_expr)
 
-        return DefiningModuleExpression(regex_expression=parsed_module_expr)
+        package_exprs = module_expr.split('.')
+        package_regexes = [parse_defining_package_expression(package_expr) for package_expr in package_exprs]
+        parsed_module_expr = r'\.'.join(package_regexes)
+        segment_pattern = SegmentPattern([parse_defining_segment_token(package_expr, package_regex) for package_expr, package_regex in zip(package_exprs, package_regexes)])
+
+        return DefiningModuleExpression(regex_expression=parsed_module_expr, literal_prefix=_literal_prefix(package_exprs), segment_pattern=segment_pattern)
 
 
 
@@ -88,6 +116,25 @@ class UsingModuleExpressionField(Field[UsingModuleExpression]):
             else:
                 return parse_using_non_wildcard_package(package_expr)
 
-        parsed_module_expr = r'\.'.join([parse_using_package_expression(package_expr) for package_expr in module_expr.split('.')])
+        def parse_using_segment_package_expression(package_expr: str):
+            if package_expr == '*':
+                return SegmentToken.any_package()
+            elif package_expr == '**?':
+                return SegmentToken.package_chain(lazy=True)
+            elif package_expr == '**':
+                return SegmentToken.package_chain(lazy=False)
+            elif '[' in package_expr:
+                # Splitting at the variables yields alternating literal texts and variable names, ending with a literal text.
+                parts = re.split(_REPLACE_VARIABLE_PATTERN, package_expr)
+                return tuple(
+                    (parts[index], _normalize_name(parts[index + 1]) if index + 1 < len(parts) else None)
+                    for index in range(0, len(parts), 2)
+                )
+            else:
+                return SegmentToken.literal_package(package_expr)
+
+        package_exprs = module_expr.split('.')
+        parsed_module_expr = r'\.'.join([parse_using_package_expression(package_expr) for package_expr in package_exprs])
+        segment_template = UsingSegmentTemplate([parse_using_segment_package_expression(package_expr) for package_expr in package_exprs])
 
-        return UsingModuleExpression(regex_template=parsed_module_expr)
\ No newline at end of file
+        return UsingModuleExpression(regex_template=parsed_module_expr, segment_template=segment_template)
\ No newline at end of file
@@ -0,0 +1,23 @@
+import json
+from typing import Optional
+
+from import_linter_dependency_graph.helpers.verdict_cache import cache_file_path
+
+
+def load_expression_hits(cache_dir: str, fingerprint: str) -> Optional[list[int]]:
+    """
+    Accepted imports per import expression persisted by an earlier run, or None if there are none or they are unreadable.
+    """
+    try:
+        with open(cache_file_path(cache_dir, fingerprint, 'hits.json'), encoding='utf-8') as hits_file:
+            hits = json.load(hits_file)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(hits, list) or not all(isinstance(count, int) for count in hits):
+        return None
+    return hits
+
+
+def store_expression_hits(cache_dir: str, fingerprint: str, hits: list[int]):
+    with open(cache_file_path(cache_dir, fingerprint, 'hits.json'), 'w', encoding='utf-8') as hits_file:
+        json.dump(hits, hits_file)
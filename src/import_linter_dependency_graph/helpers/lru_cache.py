@@ -0,0 +1,66 @@
+from collections import OrderedDict
+from typing import Generic, Hashable, Optional, TypeVar
+
+K = TypeVar('K', bound=Hashable)
+V = TypeVar('V')
+
+
+class LruCache(Generic[K, V]):
+    """
+    Bounded mapping evicting the least recently used entry once maxsize is exceeded.
+    Counts hits and misses of get, so the size can be tuned from the outside.
+    """
+
+    _entries: OrderedDict[K, V]
+    _maxsize: int
+    _hits: int
+    _misses: int
+
+    def __init__(self, maxsize: int):
+        if maxsize < 0:
+            raise ValueError(f"Cache size must not be negative, got {maxsize}")
+        self._entries = OrderedDict()
+        self._maxsize = maxsize
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def maxsize(self) -> int:
+        return self._maxsize
+
+    @property
+    def hits(self) -> int:
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        return self._misses
+
+    def get(self, key: K) -> Optional[V]:
+        value = self._entries.get(key, None)
+        if value is None:
+            self._misses += 1
+            return None
+
+        self._hits += 1
+        self._entries.move_to_end(key)
+        return value
+
+    def put(self, key: K, value: V):
+        if self._maxsize == 0:
+            return
+
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+
+    def resize(self, maxsize: int):
+        if maxsize < 0:
+            raise ValueError(f"Cache size must not be negative, got {maxsize}")
+        self._maxsize = maxsize
+        while len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+
+    def __len__(self):
+        return len(self._entries)
@@ -0,0 +1,86 @@
+import os
+import pickle
+from typing import Optional
+
+from import_linter_dependency_graph.domain.import_expression import ImportExpression
+from import_linter_dependency_graph.domain.import_expression_index import ImportExpressionIndex
+from import_linter_dependency_graph.domain.matching_engine import ImportExpressionMatcher, MatchingEngine
+
+
+# Increased whenever a pickled class changes, so artifacts written by other versions are ignored instead of unpickled
+# into incompatible objects.
+_ARTIFACT_VERSION = 1
+
+
+class MatcherArtifact:
+    """
+    Parsed import expressions of a contract with their expression index, matcher and analysis findings, as exported for
+    its fingerprint. Loading an artifact replaces parsing and analyzing the expressions and building the index and the
+    matcher.
+
+    Artifacts are pickles, so like the configuration they are loaded from, they must come from a trusted source.
+    """
+
+    _fingerprint: str
+    _matching_engine: MatchingEngine
+    _import_expressions: list[ImportExpression]
+    _expression_index: ImportExpressionIndex
+    _matcher: ImportExpressionMatcher
+    _expression_findings: list[str]
+
+    def __init__(self, fingerprint: str, matching_engine: MatchingEngine, import_expressions: list[ImportExpression], expression_index: ImportExpressionIndex, matcher: ImportExpressionMatcher, expression_findings: list[str]):
+        self._fingerprint = fingerprint
+        self._matching_engine = matching_engine
+        self._import_expressions = import_expressions
+        self._expression_index = expression_index
+        self._matcher = matcher
+        self._expression_findings = expression_findings
+
+    @property
+    def fingerprint(self) -> str:
+        return self._fingerprint
+
+    @property
+    def matching_engine(self) -> MatchingEngine:
+        return self._matching_engine
+
+    @property
+    def import_expressions(self) -> list[ImportExpression]:
+        return self._import_expressions
+
+    @property
+    def expression_index(self) -> ImportExpressionIndex:
+        return self._expression_index
+
+    @property
+    def matcher(self) -> ImportExpressionMatcher:
+        return self._matcher
+
+    @property
+    def expression_findings(self) -> list[str]:
+        return self._expression_findings
+
+    def write(self, path: str):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        # Written next to the target and renamed, so jobs loading the artifact never see a partial file.
+        temporary_path = f"{path}.{os.getpid()}.tmp"
+        with open(temporary_path, 'wb') as artifact_file:
+            pickle.dump(_ARTIFACT_VERSION, artifact_file, protocol=pickle.HIGHEST_PROTOCOL)
+            pickle.dump(self, artifact_file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temporary_path, path)
+
+    @classmethod
+    def read(cls, path: str) -> Optional["MatcherArtifact"]:
+        """
+        The artifact stored at the path, or None if there is none or it was written by another artifact version.
+        """
+        try:
+            with open(path, 'rb') as artifact_file:
+                if pickle.load(artifact_file) != _ARTIFACT_VERSION:
+                    return None
+                artifact = pickle.load(artifact_file)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+            return None
+        return artifact if isinstance(artifact, cls) else None
@@ -0,0 +1,82 @@
+import ast
+import importlib.util
+import os
+from typing import Collection, Optional
+
+
+def module_name(path: str, package_directory: str, package: str) -> Optional[str]:
+    """
+    The module defined by a Python file inside the directory of the given package, or None for other files.
+    """
+    relative_path = os.path.relpath(os.path.abspath(path), os.path.abspath(package_directory))
+    if relative_path.startswith(os.pardir) or not relative_path.endswith('.py'):
+        return None
+
+    parts = relative_path[:-len('.py')].split(os.sep)
+    if parts[-1] == '__init__':
+        parts.pop()
+    return '.'.join([package, *parts])
+
+
+def module_path(module: str, package_directory: str, package: str) -> Optional[str]:
+    """
+    The Python file defining a module of the given package inside its directory, or None if there is none.
+    """
+    if module != package and not module.startswith(package + '.'):
+        return None
+    base_path = os.path.join(package_directory, *module.split('.')[package.count('.') + 1:])
+    for path in (base_path + '.py', os.path.join(base_path, '__init__.py')):
+        if os.path.isfile(path):
+            return path
+    return None
+
+
+def package_directory(package: str) -> Optional[str]:
+    """
+    The directory of an importable package, or None if it cannot be found.
+    """
+    try:
+        spec = importlib.util.find_spec(package)
+    except (ImportError, ValueError):
+        return None
+    if spec is None or not spec.submodule_search_locations:
+        return None
+    return list(spec.submodule_search_locations)[0]
+
+
+def scan_imports(source: str, module: str, is_package: bool, known_modules: Collection[str]) -> set[str]:
+    """
+    Modules directly imported by the source of a module. Like grimp, an imported name resolves to the longest known
+    module containing it, so 'from a.b import c' imports 'a.b.c' if that is a module and 'a.b' otherwise. Names
+    outside the known modules are ignored.
+    """
+    # Relative imports are resolved against the package containing the module, which for a package is itself.
+    package_parts = module.split('.') if is_package else module.split('.')[:-1]
+
+    imported_names: list[str] = []
+    for node in ast.walk(ast.parse(source)):
+        if isinstance(node, ast.Import):
+            imported_names.extend(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom):
+            if node.level:
+                base_parts = package_parts[:len(package_parts) - node.level + 1]
+                base = '.'.join([*base_parts, node.module] if node.module else base_parts)
+            else:
+                # Only relative imports can leave out the module.
+                base = node.module or ''
+            imported_names.extend(f"{base}.{alias.name}" for alias in node.names)
+
+    imported_modules = set()
+    for imported_name in imported_names:
+        imported_module = _longest_known_module(imported_name, known_modules)
+        if imported_module is not None and imported_module != module:
+            imported_modules.add(imported_module)
+    return imported_modules
+
+
+def _longest_known_module(name: str, known_modules: Collection[str]) -> Optional[str]:
+    while name:
+        if name in known_modules:
+            return name
+        name = name.rpartition('.')[0]
+    return None
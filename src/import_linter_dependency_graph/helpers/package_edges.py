@@ -0,0 +1,45 @@
+from typing import Iterable, Iterator
+
+from grimp import ImportGraph
+
+
+def is_in_package(module: str, package: str) -> bool:
+    """
+    Whether the module is the package itself or one of its descendants. In contrast to a plain prefix check,
+    sibling packages sharing a name prefix ('rootx' for package 'root') are excluded.
+    """
+    return module == package or module.startswith(f"{package}.")
+
+
+def iter_package_edges(graph: ImportGraph, package: str) -> Iterator[tuple[str, str]]:
+    """
+    Yields every direct import (importer, imported) where the importer is inside the given package and the imported
+    module is one of its descendants. Imports of the package itself are not checked by contracts.
+    Edges are fetched in bulk from the graph instead of querying the importers of every module one by one.
+    """
+    import_expressions = [
+        f"{package}.** -> {package}.**",
+        f"{package} -> {package}.**",
+    ]
+    for import_expression in import_expressions:
+        for direct_import in graph.find_matching_direct_imports(import_expression=import_expression):
+            yield direct_import["importer"], direct_import["imported"]
+
+
+def iter_module_edges(graph: ImportGraph, package: str, modules: Iterable[str]) -> Iterator[tuple[str, str]]:
+    """
+    Yields every import among those of iter_package_edges where either side is one of the modules, each once. Only the
+    imports of these modules are fetched from the graph, so the cost depends on their number.
+    """
+    edges: dict[tuple[str, str], None] = {}
+    for module in sorted(modules):
+        if not is_in_package(module, package) or module not in graph.modules:
+            continue
+        if module != package:
+            for importer in sorted(graph.find_modules_that_directly_import(module)):
+                if is_in_package(importer, package):
+                    edges[(importer, module)] = None
+        for imported in sorted(graph.find_modules_directly_imported_by(module)):
+            if imported != package and is_in_package(imported, package):
+                edges[(module, imported)] = None
+    yield from edges
@@ -0,0 +1,78 @@
+import copy
+import math
+import sys
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Generator, Optional, Sequence
+
+from import_linter_dependency_graph.domain.edge_evaluation import EdgeEvaluator, EvaluationMode
+from import_linter_dependency_graph.domain.instrumented_matcher import InstrumentedMatcher, MatchStatistics
+
+
+# Chunks per worker. More chunks than workers balance uneven chunks, too many add scheduling overhead.
+_CHUNKS_PER_WORKER = 4
+
+_worker_state = threading.local()
+
+
+def is_free_threaded() -> bool:
+    is_gil_enabled = getattr(sys, '_is_gil_enabled', None)
+    return is_gil_enabled is not None and not is_gil_enabled()
+
+
+def _init_worker(evaluator: EdgeEvaluator):
+    # Every worker gets a private copy, as the caches of the matchers are not synchronized.
+    _worker_state.evaluator = copy.deepcopy(evaluator)
+    if isinstance(evaluator.matcher, InstrumentedMatcher):
+        # Counts up to now belong to the caller, workers only report their own.
+        _worker_state.evaluator.matcher.statistics.take()
+
+
+def _find_invalid_edges(chunk: list[tuple[str, str]], evaluation_mode: EvaluationMode) -> tuple[list[tuple[str, str]], Optional[MatchStatistics], Optional[list[int]]]:
+    evaluator: EdgeEvaluator = _worker_state.evaluator
+    invalid_edges = list(evaluator.iter_invalid_edges(chunk, evaluation_mode))
+    # Statistics and hits of the private copy are handed back per chunk, so the caller can add them to its own.
+    statistics = evaluator.matcher.statistics.take() if isinstance(evaluator.matcher, InstrumentedMatcher) else None
+    new_hits = evaluator.ranking.take_new_hits() if evaluator.ranking is not None else None
+    return invalid_edges, statistics, new_hits
+
+
+def iter_invalid_edges_parallel(
+    evaluator: EdgeEvaluator,
+    edges: Sequence[tuple[str, str]],
+    evaluation_mode: EvaluationMode,
+    workers: int,
+    use_threads: Optional[bool] = None,
+) -> Generator[tuple[str, str], None, None]:
+    """
+    Splits the imports into contiguous chunks and evaluates them concurrently. Results are yielded in chunk order,
+    so they are identical to a sequential evaluation. Closing the iterator early cancels all chunks not yet started.
+
+    Threads are used on free-threaded builds. Otherwise, a process pool is used, unpickling the evaluator with its
+    compiled expressions once per worker process.
+    """
+    if not edges:
+        return
+
+    if use_threads is None:
+        use_threads = is_free_threaded()
+
+    chunk_size = math.ceil(len(edges) / (workers * _CHUNKS_PER_WORKER))
+    chunks = [edges[start:start + chunk_size] for start in range(0, len(edges), chunk_size)]
+
+    executor: Executor
+    if use_threads:
+        executor = ThreadPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(evaluator,))
+    else:
+        executor = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(evaluator,))
+
+    matcher = evaluator.matcher
+    try:
+        for invalid_edges, statistics, new_hits in executor.map(_find_invalid_edges, chunks, [evaluation_mode] * len(chunks)):
+            if statistics is not None and isinstance(matcher, InstrumentedMatcher):
+                matcher.statistics.merge(statistics)
+            if new_hits is not None and evaluator.ranking is not None:
+                evaluator.ranking.add_hits(new_hits)
+            yield from invalid_edges
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
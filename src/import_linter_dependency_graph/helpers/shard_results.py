@@ -0,0 +1,74 @@
+import json
+import os
+
+from import_linter_dependency_graph.domain.edge_sharding import Shard
+
+
+_FORMAT_VERSION = 1
+
+
+class ShardResult:
+    """
+    Invalid imports found by one shard of a contract check, with their positions among all imports of the root package,
+    so merging the shards restores the order of a check on a single node.
+    """
+
+    _fingerprint: str
+    _shard: Shard
+    _edge_count: int
+    _invalid_imports: list[tuple[int, str, str]]
+
+    def __init__(self, fingerprint: str, shard: Shard, edge_count: int, invalid_imports: list[tuple[int, str, str]]):
+        self._fingerprint = fingerprint
+        self._shard = shard
+        self._edge_count = edge_count
+        self._invalid_imports = invalid_imports
+
+    @property
+    def fingerprint(self) -> str:
+        return self._fingerprint
+
+    @property
+    def shard(self) -> Shard:
+        return self._shard
+
+    @property
+    def edge_count(self) -> int:
+        """
+        Number of imports of the root package in the graph of all shards, used to detect shards checking other graphs.
+        """
+        return self._edge_count
+
+    @property
+    def invalid_imports(self) -> list[tuple[int, str, str]]:
+        return self._invalid_imports
+
+    def write(self, path: str):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as result_file:
+            json.dump({
+                "version": _FORMAT_VERSION,
+                "fingerprint": self._fingerprint,
+                "shard": str(self._shard),
+                "edge_count": self._edge_count,
+                "invalid_imports": self._invalid_imports,
+            }, result_file)
+
+    @classmethod
+    def read(cls, path: str) -> "ShardResult":
+        with open(path, encoding='utf-8') as result_file:
+            content = json.load(result_file)
+        if not isinstance(content, dict) or content.get("version") != _FORMAT_VERSION:
+            raise ValueError(f"Shard result '{path}' was written by another version.")
+        return cls(
+            content["fingerprint"],
+            Shard.parse(content["shard"]),
+            content["edge_count"],
+            [(position, importer, imported) for position, importer, imported in content["invalid_imports"]],
+        )
+
+
+def shard_result_path(directory: str, shard: Shard) -> str:
+    return os.path.join(directory, f"shard-{shard.index}-of-{shard.count}.json")
@@ -0,0 +1,78 @@
+import hashlib
+import os
+import sqlite3
+from typing import Iterable
+
+from importlinter.application.app_config import settings
+
+
+_FORMAT_VERSION = 1
+_FALLBACK_CACHE_DIR = '.import_linter_cache'
+_SUBDIRECTORY = 'required_graph'
+
+
+def default_cache_dir() -> str:
+    """
+    The cache directory of import-linter, if configured by the running application.
+    """
+    try:
+        return settings.DEFAULT_CACHE_DIR
+    except KeyError:
+        return _FALLBACK_CACHE_DIR
+
+
+def contract_fingerprint(root_package: str, normalized_expressions: Iterable[str]) -> str:
+    """
+    Hash identifying a set of verdicts. Any change to the root package or the expressions yields a new fingerprint.
+    """
+    content = '\n'.join([f"v{_FORMAT_VERSION}", root_package, *normalized_expressions])
+    return hashlib.sha256(content.encode('utf-8')).hexdigest()
+
+
+def cache_file_path(cache_dir: str, fingerprint: str, extension: str) -> str:
+    """
+    Path of a file persisted for the contract fingerprint, creating its directory if needed.
+    """
+    directory = os.path.join(cache_dir, _SUBDIRECTORY)
+    os.makedirs(directory, exist_ok=True)
+    return os.path.join(directory, f"{fingerprint}.{extension}")
+
+
+class VerdictCache:
+    """
+    Verdicts (import valid or not) of previously checked imports, persisted in a sqlite file per contract fingerprint.
+    As the fingerprint covers everything a verdict depends on, changed expressions simply use a new file.
+    """
+
+    _connection: sqlite3.Connection
+
+    def __init__(self, path: str):
+        self._connection = sqlite3.connect(path)
+        self._connection.execute(
+            'CREATE TABLE IF NOT EXISTS verdicts (importer TEXT NOT NULL, imported TEXT NOT NULL, valid INTEGER NOT NULL, '
+            'PRIMARY KEY (importer, imported)) WITHOUT ROWID'
+        )
+
+    @classmethod
+    def open(cls, cache_dir: str, fingerprint: str) -> "VerdictCache":
+        return cls(cache_file_path(cache_dir, fingerprint, 'sqlite'))
+
+    def load(self) -> dict[tuple[str, str], bool]:
+        return {
+            (importer, imported): bool(valid)
+            for importer, imported, valid in self._connection.execute('SELECT importer, imported, valid FROM verdicts')
+        }
+
+    def store(self, verdicts: dict[tuple[str, str], bool]):
+        with self._connection:
+            self._connection.executemany(
+                'INSERT OR REPLACE INTO verdicts (importer, imported, valid) VALUES (?, ?, ?)',
+                ((importer, imported, int(valid)) for (importer, imported), valid in verdicts.items())
+            )
+
+    def remove(self, edges: Iterable[tuple[str, str]]):
+        with self._connection:
+            self._connection.executemany('DELETE FROM verdicts WHERE importer = ? AND imported = ?', edges)
+
+    def close(self):
+        self._connection.close()
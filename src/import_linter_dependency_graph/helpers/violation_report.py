@@ -0,0 +1,69 @@
+from enum import Enum
+from typing import Any, Iterable
+
+
+DEFAULT_REPORT_SAMPLES = 3
+DEFAULT_REPORT_MAX_GROUPS = 50
+
+
+class ReportMode(Enum):
+    EDGES = 'edges'
+    AGGREGATED = 'aggregated'
+
+
+def package_pair(importer: str, imported: str) -> tuple[str, str]:
+    """
+    The packages directly below the deepest package containing both modules, one on each side. A module inside the
+    other one is its own side of the pair.
+    """
+    importer_segments = importer.split('.')
+    imported_segments = imported.split('.')
+    common_length = 0
+    for importer_segment, imported_segment in zip(importer_segments, imported_segments):
+        if importer_segment != imported_segment:
+            break
+        common_length += 1
+
+    return '.'.join(importer_segments[:common_length + 1]), '.'.join(imported_segments[:common_length + 1])
+
+
+class ViolationAggregator:
+    """
+    Rolls invalid imports up to package pairs in a single pass, keeping a count and the first few imports per pair.
+    """
+
+    _sample_size: int
+    _counts: dict[tuple[str, str], int]
+    _samples: dict[tuple[str, str], list[tuple[str, str]]]
+
+    def __init__(self, sample_size: int = DEFAULT_REPORT_SAMPLES):
+        self._sample_size = sample_size
+        self._counts = {}
+        self._samples = {}
+
+    def add(self, importer: str, imported: str):
+        pair = package_pair(importer, imported)
+        self._counts[pair] = self._counts.get(pair, 0) + 1
+        samples = self._samples.setdefault(pair, [])
+        if len(samples) < self._sample_size:
+            samples.append((importer, imported))
+
+    def add_all(self, violations: Iterable[tuple[str, str]]):
+        for importer, imported in violations:
+            self.add(importer, imported)
+
+    def groups(self) -> list[dict[str, Any]]:
+        """
+        Package pairs with their counts and sample imports, most violated pairs first.
+        """
+        counts = sorted(self._counts.items(), key=lambda pair_count: (-pair_count[1], pair_count[0]))
+        return [
+            {"importer_package": importer_package, "imported_package": imported_package, "count": count, "samples": self._samples[(importer_package, imported_package)]}
+            for (importer_package, imported_package), count in counts
+        ]
+
+
+def write_violations(path: str, violations: Iterable[tuple[str, str]]):
+    with open(path, 'w', encoding='utf-8') as violations_file:
+        for importer, imported in violations:
+            violations_file.write(f"{importer} -> {imported}\n")
@@ -1,5 +1,8 @@
+import itertools
+import os
+from array import array
 import re
-from typing import List
+from typing import List, Any, Collection, Generator, Optional, Sequence
 
 from grimp import ImportGraph
 
@@ -8,8 +11,34 @@ from importlinter.domain import fields
 
 from importlinter import Contract, ContractCheck
 
-from import_linter_dependency_graph.domain.import_expression import ImportExpression, ImportType
-from import_linter_dependency_graph.fields.import_expression_field import ImportExpressionField
+from import_linter_dependency_graph.domain.edge_columns import EdgeColumns, ModuleTable
+from import_linter_dependency_graph.domain.edge_evaluation import EdgeEvaluator, EvaluationMode
+from import_linter_dependency_graph.domain.edge_sharding import Shard
+from import_linter_dependency_graph.domain.expression_analysis import analyze_import_expressions
+from import_linter_dependency_graph.domain.expression_ranking import ExpressionOrder, ExpressionRanking
+from import_linter_dependency_graph.domain.import_expression import ImportExpression
+from import_linter_dependency_graph.domain.import_expression_index import ImportExpressionIndex
+from import_linter_dependency_graph.domain.instrumented_matcher import InstrumentedMatcher, MatchStatistics
+from import_linter_dependency_graph.domain.module_squashing import squash_depths, squash_module
+from import_linter_dependency_graph.domain.matching_engine import ImportExpressionMatcher, MatchingEngine, create_matcher
+from import_linter_dependency_graph.domain.target_set_matcher import DEFAULT_TARGET_SET_MEMORY_CAP, TargetSetMatcher
+from import_linter_dependency_graph.domain.using_module_expression import DEFAULT_COMPILE_CACHE_SIZE
+from import_linter_dependency_graph.fields.import_expression_field import ImportExpressionField, intern_import_expressions
+from import_linter_dependency_graph.fields.integer_field import IntegerField
+from import_linter_dependency_graph.helpers.expression_hits import load_expression_hits, store_expression_hits
+from import_linter_dependency_graph.helpers.matcher_artifact import MatcherArtifact
+from import_linter_dependency_graph.helpers.module_imports import module_name, package_directory
+from import_linter_dependency_graph.helpers.package_edges import is_in_package, iter_module_edges, iter_package_edges
+from import_linter_dependency_graph.helpers.parallel_evaluation import iter_invalid_edges_parallel
+from import_linter_dependency_graph.helpers.shard_results import ShardResult
+from import_linter_dependency_graph.helpers.verdict_cache import VerdictCache, contract_fingerprint, default_cache_dir
+from import_linter_dependency_graph.helpers.violation_report import (
+    DEFAULT_REPORT_MAX_GROUPS,
+    DEFAULT_REPORT_SAMPLES,
+    ReportMode,
+    ViolationAggregator,
+    write_violations,
+)
 
 
 class RequiredGraphContract(Contract):
@@ -65,6 +94,62 @@ class RequiredGraphContract(Contract):
     PACKAGE_NAME_PART := regular expression: [^\.]+
     VARIABLE_NAME := regular expression: [a-z_-]+
 
+    Contract options:
+
+    root_package:           The package whose internal imports are checked.
+    required_imports:       List of import expressions. Every import must conform to at least one of them.
+    compile_cache_size:     Number of compiled using module patterns kept per import expression, keyed by variable binding (default 1024).
+                            Identical import expressions are parsed once per process and shared by all contracts, including
+                            their compile caches, which keep the largest size configured by any of them.
+    matching_engine:        'regex' (default) matches module names with regular expressions. 'combined-regex' runs all
+                            defining module expressions of one direction in a single regular expression per module.
+                            'segment' matches pre-split module segments with a memoized search, which cannot
+                            backtrack exponentially on deep modules or expressions combining several multi package
+                            wildcards. All engines capture the same variables.
+    evaluation_mode:        'edge' (default) checks every import on its own. 'grouped' groups imports by the module
+                            defining the variables, so every defining match is computed once per module and expression.
+    materialize_target_sets: If 'true', every distinct bound using module expression is resolved once against the modules
+                            of the root package, and imports are checked by set membership (default false).
+    target_set_memory_cap:  Maximum number of modules held in all materialized sets together (default 1000000). Bindings
+                            whose set does not fit anymore are matched with the matching engine instead.
+    verdict_cache:          If 'true', the verdict of every checked import is persisted, and later runs only check imports
+                            without a stored verdict (default false). Verdicts are stored per fingerprint of the root
+                            package and the required imports, so changing any expression starts from scratch.
+    cache_dir:              Directory for persisted data (default: the cache directory of import-linter).
+    workers:                Number of workers evaluating imports concurrently (default 1). Uses threads on free-threaded
+                            Python builds and processes otherwise. Results are identical to a sequential run.
+    max_violations:         Report at most this many invalid imports and stop checking at the next one (default: no
+                            limit). The check is only reported as truncated if an invalid import was left out.
+    fail_fast:              If 'true', report only the first invalid import (default false).
+    instrumentation:        If 'true', count attempts, hits and match time per import expression, reported in the
+                            check metadata (default false). Always enabled when running verbose.
+    report_mode:            'edges' (default) prints every invalid import. 'aggregated' rolls them up to the packages
+                            directly below their deepest common package, printing a count and sample imports per pair.
+    report_samples:         Sample imports printed per package pair in aggregated mode (default 3).
+    report_max_groups:      Package pairs printed in aggregated mode, most violated first (default 50).
+    violations_file:        If set, every invalid import is written to this file, one per line.
+    expression_order:       'configured' (default) tries the import expressions in configured order. 'adaptive' tries
+                            the expressions that accepted most imports so far first. 'persisted' does the same, starting
+                            from the counts of the previous run stored in the cache directory. Reported imports are the same
+                            in every order.
+    squash_modules:         If 'true' and the import expressions only look at the leading packages of the modules (as in
+                            'root.*.[x] -> root.*.[x].**'), modules are cut to these packages and every distinct cut import
+                            is evaluated once. Its verdict applies to all imports it stands for (default false). Has no
+                            effect if some expression looks at packages at any depth, as '[**parent].*' does.
+    matcher_artifact:       Path of a matcher artifact exported for this contract (see export_matcher_artifact). If its
+                            import expressions, root package and matching engine are the configured ones, the parsed and
+                            analyzed expressions, the expression index and the matcher are loaded from it instead of
+                            being built. Otherwise it is ignored with a warning.
+    changed_modules:        List of changed modules or Python files (paths ending in '.py', relative to the working
+                            directory). If set, only imports from or to these modules are checked, fetched from the graph
+                            module by module, so the cost of a check depends on the size of a change instead of the
+                            root package. Scoped checks report a warning saying so.
+    changed_modules_file:   File listing changed modules or Python files, one per line (e.g. the output of
+                            'git diff --name-only'), added to changed_modules.
+
+    Import expressions are analyzed when the contract is loaded. Ambiguous wildcards ('**.**', '**.*.**') and import
+    expressions covered by an earlier one are reported as warnings.
+
     TODO:
 
     - use already captured variable inside a defining module expression
@@ -77,43 +162,450 @@ class RequiredGraphContract(Contract):
 
     required_imports: List[ImportExpression] = fields.ListField(subfield=ImportExpressionField())
     root_package: fields.Module = fields.ModuleField()
+    compile_cache_size: int = IntegerField(minimum=0, default=DEFAULT_COMPILE_CACHE_SIZE)
+    matching_engine: MatchingEngine = fields.EnumField(MatchingEngine, default=MatchingEngine.REGEX)
+    evaluation_mode: EvaluationMode = fields.EnumField(EvaluationMode, default=EvaluationMode.EDGE)
+    materialize_target_sets: bool = fields.BooleanField(default=False)
+    target_set_memory_cap: int = IntegerField(minimum=0, default=DEFAULT_TARGET_SET_MEMORY_CAP)
+    verdict_cache: bool = fields.BooleanField(default=False)
+    cache_dir: str = fields.StringField(default=None)
+    workers: int = IntegerField(minimum=1, default=1)
+    max_violations: int = IntegerField(minimum=1, default=None)
+    fail_fast: bool = fields.BooleanField(default=False)
+    instrumentation: bool = fields.BooleanField(default=False)
+    report_mode: ReportMode = fields.EnumField(ReportMode, default=ReportMode.EDGES)
+    report_samples: int = IntegerField(minimum=0, default=DEFAULT_REPORT_SAMPLES)
+    report_max_groups: int = IntegerField(minimum=1, default=DEFAULT_REPORT_MAX_GROUPS)
+    violations_file: str = fields.StringField(default=None)
+    expression_order: ExpressionOrder = fields.EnumField(ExpressionOrder, default=ExpressionOrder.CONFIGURED)
+    squash_modules: bool = fields.BooleanField(default=False)
+    matcher_artifact: str = fields.StringField(default=None)
+    changed_modules: List[str] = fields.ListField(subfield=fields.StringField(), default=None)
+    changed_modules_file: str = fields.StringField(default=None)
+
+    _fingerprint: str
+    _expression_index: ImportExpressionIndex
+    _loaded_matcher: Optional[ImportExpressionMatcher]
+    _expression_findings: list[str]
+    _squash_depths: Optional[tuple[int, int]]
+
+    def __init__(self, name: str, session_options: dict[str, Any], contract_options: dict[str, Any]):
+        artifact = MatcherArtifact.read(contract_options["matcher_artifact"]) if contract_options.get("matcher_artifact") else None
+        if artifact is not None:
+            # Parsing the configured expressions returns the loaded ones for every expression not parsed before.
+            intern_import_expressions(artifact.import_expressions)
+
+        super().__init__(name, session_options, contract_options)
 
-    def check(self, graph: ImportGraph, verbose: bool) -> ContractCheck:
-        modules = graph.find_matching_modules(f"{self.root_package.name}.**")
-        invalid_imports = []
-
-        for imported in modules:
-            for importer in [importer for importer in graph.find_modules_that_directly_import(imported) if importer.startswith(self.root_package.name)]:
-                if not self._is_import_valid(importer, imported):
-                    invalid_imports.append(f"{importer} -> {imported}")
-        return ContractCheck(kept=len(invalid_imports) == 0, metadata= {"invalid_imports": invalid_imports})
-
-    def _is_import_valid(self, importer: str, imported: str):
         for import_expression in self.required_imports:
-            if import_expression.import_type == ImportType.IMPORTING:
-                importer_match = import_expression.defining_module_expr.pattern.fullmatch(importer)
-                if importer_match is not None:
-                    variable_dict = importer_match.groupdict()
-
-                    imported_match = import_expression.using_module_expr.compile(variable_dict).fullmatch(imported)
-                    if imported_match is not None:
-                        return True
-            else:
-                imported_match = import_expression.defining_module_expr.pattern.fullmatch(imported)
-                if imported_match is not None:
-                    variable_dict = imported_match.groupdict()
-
-                    importer_match = import_expression.using_module_expr.compile(variable_dict).fullmatch(importer)
-                    if importer_match is not None:
-                        return True
-
-        return False
+            import_expression.using_module_expr.reserve_compile_cache_size(self.compile_cache_size)
+
+        self._fingerprint = contract_fingerprint(self.root_package.name, [str(import_expression) for import_expression in self.required_imports])
+        if artifact is not None and self._matches_artifact(artifact):
+            self._expression_index = artifact.expression_index
+            self._loaded_matcher = artifact.matcher.with_import_expressions(self.required_imports)
+            self._expression_findings = list(artifact.expression_findings)
+        else:
+            self._expression_index = ImportExpressionIndex(self.required_imports)
+            self._loaded_matcher = None
+            # Found once when the contract is loaded, reported as warnings of every check.
+            self._expression_findings = analyze_import_expressions(self.required_imports)
+            if self.matcher_artifact:
+                self._expression_findings.append(f"Matcher artifact '{self.matcher_artifact}' is missing or outdated, the matcher was built from the import expressions.")
+        self._squash_depths = squash_depths(self.required_imports) if self.squash_modules else None
+
+    def _matches_artifact(self, artifact: MatcherArtifact) -> bool:
+        return (
+            artifact.fingerprint == self._fingerprint
+            and artifact.matching_engine == self.matching_engine
+            # Expressions of the same text parsed earlier by another contract stay in use instead of the loaded ones,
+            # so expressions are compared by text and the loaded matcher is bound to the configured ones.
+            and [loaded.text for loaded in artifact.import_expressions] == [configured.text for configured in self.required_imports]
+        )
+
+    def export_matcher_artifact(self, path: str):
+        """
+        Writes the parsed import expressions, the expression index, the matcher and the analysis findings to an artifact,
+        which contracts with the same fingerprint and matching engine load instead of building them.
+        """
+        matcher = create_matcher(self.matching_engine, self.required_imports, self._expression_index)
+        expression_findings = analyze_import_expressions(self.required_imports)
+        MatcherArtifact(self._fingerprint, self.matching_engine, self.required_imports, self._expression_index, matcher, expression_findings).write(path)
 
+    def check(self, graph: ImportGraph, verbose: bool) -> ContractCheck:
+        changed_modules = self.find_changed_modules()
+        if changed_modules is None:
+            return self.check_edges(graph, EdgeColumns.from_edges(iter_package_edges(graph, self.root_package.name)), verbose)
+
+        edges = EdgeColumns.from_edges(iter_module_edges(graph, self.root_package.name, changed_modules))
+        output.verbose_print(verbose, f"Scoped to {len(changed_modules)} changed modules: checking {len(edges)} imports.")
+        check = self.check_edges(graph, edges, verbose, all_package_edges=False)
+        check.metadata["scope"] = {"changed_modules": sorted(changed_modules), "imports": len(edges)}
+        check.warnings.append(
+            f"Scoped run: only the {len(edges)} imports from or to {len(changed_modules)} changed modules were checked."
+        )
+        return check
+
+    def find_changed_modules(self) -> Optional[set[str]]:
+        """
+        The modules of the root package given by changed_modules and changed_modules_file, or None if the check is not
+        scoped. Paths are converted to the modules they define, other files and modules outside the root package are
+        ignored.
+        """
+        if self.changed_modules is None and self.changed_modules_file is None:
+            return None
+
+        entries = list(self.changed_modules or [])
+        if self.changed_modules_file is not None:
+            with open(self.changed_modules_file, encoding='utf-8') as changed_modules_file:
+                entries.extend(line.strip() for line in changed_modules_file)
+
+        root_package = self.root_package.name
+        directory = None
+        changed_modules = set()
+        for entry in entries:
+            if not entry.endswith('.py') and '/' not in entry and os.sep not in entry:
+                if is_in_package(entry, root_package):
+                    changed_modules.add(entry)
+                continue
+            if directory is None:
+                directory = package_directory(root_package)
+                if directory is None:
+                    continue
+            module = module_name(entry, directory, root_package)
+            if module is not None:
+                changed_modules.add(module)
+        return changed_modules
+
+    def check_edges(self, graph: ImportGraph, edges: EdgeColumns, verbose: bool, all_package_edges: bool = True) -> ContractCheck:
+        """
+        Checks the given imports of the root package instead of fetching them from the graph, so several contracts can
+        share one traversal of the graph (see check_contracts). Unless all_package_edges is False, the imports are all
+        imports of the root package and cached verdicts of other imports are removed.
+        """
+        invalid_imports, metadata = self._find_violations(graph, edges, verbose, all_package_edges)
+        return self._build_check(invalid_imports, metadata)
+
+    def check_shard(self, graph: ImportGraph, shard: Shard, verbose: bool = False) -> ShardResult:
+        """
+        Checks only the imports of the given shard, for merging with the results of the other shards (see
+        merge_shard_results). Running all shards on different machines checks every import once.
+        """
+        root_package = self.root_package.name
+        edges = EdgeColumns.from_edges(iter_package_edges(graph, root_package))
+        module_table = edges.module_table
+        shard_edges = EdgeColumns(module_table)
+        positions: dict[tuple[str, str], int] = {}
+        # Modules are hashed once, not once per import.
+        in_shard_by_module: dict[int, bool] = {}
+        for position, (importer_id, imported_id) in enumerate(edges.iter_ids()):
+            in_shard = in_shard_by_module.get(importer_id, None)
+            if in_shard is None:
+                in_shard = in_shard_by_module[importer_id] = shard.contains(module_table.name(importer_id), root_package)
+            if in_shard:
+                shard_edges.append_ids(importer_id, imported_id)
+                positions[(module_table.name(importer_id), module_table.name(imported_id))] = position
+
+        output.verbose_print(verbose, f"Shard {shard}: checking {len(shard_edges)} of {len(edges)} imports.")
+        invalid_imports, _ = self._find_violations(graph, shard_edges, verbose, all_package_edges=False)
+        return ShardResult(
+            self._fingerprint, shard, len(edges),
+            [(positions[(importer, imported)], importer, imported) for importer, imported in invalid_imports],
+        )
+
+    def merge_shard_results(self, results: Sequence[ShardResult]) -> ContractCheck:
+        """
+        Combines the results of all shards into the check a single node would have made, with the invalid imports in
+        the same order and the same violation limit, aggregation and violations file.
+        """
+        if not results:
+            raise ValueError("No shard results to merge.")
+        for result in results:
+            if result.fingerprint != self._fingerprint:
+                raise ValueError(f"Shard {result.shard} was checked with another root package or other import expressions.")
+            if result.edge_count != results[0].edge_count:
+                raise ValueError(f"Shard {result.shard} checked another graph than shard {results[0].shard}.")
+        shard_count = results[0].shard.count
+        shard_indexes = sorted(result.shard.index for result in results)
+        if any(result.shard.count != shard_count for result in results) or shard_indexes != list(range(1, shard_count + 1)):
+            raise ValueError(f"Shard results {', '.join(str(result.shard) for result in results)} are not all shards of one check.")
+
+        violation_limit = self._violation_limit()
+        # Every shard kept its first invalid imports up to one beyond the limit, so the first ones of all shards are
+        # among them.
+        positioned_imports = sorted(positioned_import for result in results for positioned_import in result.invalid_imports)
+        if violation_limit is not None:
+            positioned_imports = positioned_imports[:violation_limit + 1]
+        invalid_imports = [(importer, imported) for _, importer, imported in positioned_imports]
+        return self._build_check(invalid_imports, {"shards": shard_count})
+
+    def _find_violations(self, graph: ImportGraph, edges: EdgeColumns, verbose: bool, all_package_edges: bool = True) -> tuple[list[tuple[str, str]], dict[str, Any]]:
+        evaluator = self._create_evaluator(graph, instrumented=self.instrumentation or verbose)
+        statistics = evaluator.matcher.statistics if isinstance(evaluator.matcher, InstrumentedMatcher) else None
+        ranking = evaluator.ranking
+        compile_cache_counters = self._compile_cache_counters()
+
+        metadata: dict[str, Any] = {}
+        if self.squash_modules:
+            if self._squash_depths is None:
+                output.verbose_print(verbose, "Modules not squashed, the import expressions look at packages at any depth.")
+            else:
+                output.verbose_print(verbose, f"Squashing importers to {self._squash_depths[0]} and imported modules to {self._squash_depths[1]} packages.")
+
+        if self.verdict_cache:
+            invalid_edges = self._iter_invalid_edges_cached(evaluator, edges, metadata, statistics, all_package_edges)
+        else:
+            invalid_edges = self._iter_invalid_edges(evaluator, edges, statistics)
+
+        violation_limit = self._violation_limit()
+        try:
+            # Violations are kept as (importer, imported) tuples and only formatted when rendered. One invalid import
+            # beyond the limit tells whether the limit left anything unchecked, _build_check drops it.
+            invalid_imports = list(itertools.islice(invalid_edges, None if violation_limit is None else violation_limit + 1))
+        finally:
+            # Stops a partially consumed evaluation, cancelling pending parallel chunks and storing cached verdicts.
+            invalid_edges.close()
+
+        if ranking is not None:
+            metadata["expression_hits"] = ranking.hits
+            if self.expression_order == ExpressionOrder.PERSISTED:
+                store_expression_hits(self.cache_dir or default_cache_dir(), self._fingerprint, ranking.hits)
+
+        if self.verdict_cache:
+            output.verbose_print(verbose, f"Verdict cache: {metadata['verdict_cache']['hits']} hits, {metadata['verdict_cache']['misses']} misses.")
+        metadata["compile_cache"] = compile_cache_stats = self._compile_cache_stats(compile_cache_counters)
+        output.verbose_print(verbose, f"Compile cache: {compile_cache_stats['hits']} hits, {compile_cache_stats['misses']} misses (size {self.compile_cache_size}).")
+        if statistics is not None:
+            metadata["instrumentation"] = self._instrumentation_report(statistics, compile_cache_counters)
+            self._print_instrumentation_report(verbose, metadata["instrumentation"])
+        return invalid_imports, metadata
+
+    def _violation_limit(self) -> Optional[int]:
+        return 1 if self.fail_fast else self.max_violations
+
+    def _build_check(self, invalid_imports: list[tuple[str, str]], metadata: dict[str, Any]) -> ContractCheck:
+        warnings = list(self._expression_findings)
+        violation_limit = self._violation_limit()
+        if violation_limit is not None and len(invalid_imports) > violation_limit:
+            invalid_imports = invalid_imports[:violation_limit]
+            metadata["truncated"] = True
+            warnings.append(f"Stopped after {violation_limit} invalid imports, further imports were not checked.")
+
+        if self.report_mode == ReportMode.AGGREGATED:
+            aggregator = ViolationAggregator(self.report_samples)
+            aggregator.add_all(invalid_imports)
+            metadata["violation_groups"] = aggregator.groups()
+        if self.violations_file:
+            write_violations(self.violations_file, invalid_imports)
+
+        return ContractCheck(
+            kept=len(invalid_imports) == 0,
+            metadata= {"invalid_imports": invalid_imports, **metadata},
+            warnings=warnings,
+        )
+
+    def find_invalid_imports(self, graph: ImportGraph, edges: EdgeColumns) -> list[tuple[str, str]]:
+        """
+        All invalid imports among the given ones, regardless of violation limits and without the verdict cache. Used to
+        re-check single imports of a changed graph.
+        """
+        return list(self._iter_invalid_edges(self._create_evaluator(graph, instrumented=False), edges, None))
+
+    def _create_evaluator(self, graph: ImportGraph, instrumented: bool) -> EdgeEvaluator:
+        matcher = self._loaded_matcher if self._loaded_matcher is not None else create_matcher(self.matching_engine, self.required_imports, self._expression_index)
+        if self.materialize_target_sets:
+            modules: Collection[str] = [module for module in graph.modules if is_in_package(module, self.root_package.name)]
+            if self._squash_depths is not None:
+                # Squashed imports are checked against the squashed names of the imported modules.
+                modules = {squash_module(module, self._squash_depths[1]) for module in modules}
+            matcher = TargetSetMatcher(matcher, modules, memory_cap=self.target_set_memory_cap)
+        if instrumented:
+            matcher = InstrumentedMatcher(matcher)
+        ranking = None
+        if self.expression_order == ExpressionOrder.PERSISTED:
+            ranking = ExpressionRanking(len(self.required_imports), load_expression_hits(self.cache_dir or default_cache_dir(), self._fingerprint))
+        elif self.expression_order == ExpressionOrder.ADAPTIVE:
+            ranking = ExpressionRanking(len(self.required_imports))
+        return EdgeEvaluator(self.required_imports, matcher, ranking)
+
+    def _iter_invalid_edges(self, evaluator: EdgeEvaluator, edges: EdgeColumns, statistics: Optional[MatchStatistics]) -> Generator[tuple[str, str], None, None]:
+        if self._squash_depths is not None:
+            return self._iter_invalid_edges_squashed(evaluator, edges, statistics, self._squash_depths)
+        return self._evaluate_edges(evaluator, edges, statistics)
+
+    def _iter_invalid_edges_squashed(self, evaluator: EdgeEvaluator, edges: EdgeColumns, statistics: Optional[MatchStatistics], squash_depths: tuple[int, int]) -> Generator[tuple[str, str], None, None]:
+        importer_depth, imported_depth = squash_depths
+        names = edges.module_table.names
+        squashed_edges = EdgeColumns(ModuleTable())
+        squashed_table = squashed_edges.module_table
+        squashed_importer_ids: dict[int, int] = {}
+        squashed_imported_ids: dict[int, int] = {}
+        squashed_edge_indexes: dict[tuple[int, int], int] = {}
+        # Index of the squashed import of every import.
+        edge_squashed_indexes = array('i')
+        for importer_id, imported_id in edges.iter_ids():
+            squashed_importer_id = squashed_importer_ids.get(importer_id, None)
+            if squashed_importer_id is None:
+                squashed_importer_id = squashed_table.intern(squash_module(names[importer_id], importer_depth))
+                squashed_importer_ids[importer_id] = squashed_importer_id
+            squashed_imported_id = squashed_imported_ids.get(imported_id, None)
+            if squashed_imported_id is None:
+                squashed_imported_id = squashed_table.intern(squash_module(names[imported_id], imported_depth))
+                squashed_imported_ids[imported_id] = squashed_imported_id
+
+            squashed_edge = (squashed_importer_id, squashed_imported_id)
+            squashed_index = squashed_edge_indexes.get(squashed_edge, None)
+            if squashed_index is None:
+                squashed_index = len(squashed_edges)
+                squashed_edge_indexes[squashed_edge] = squashed_index
+                squashed_edges.append_ids(*squashed_edge)
+            edge_squashed_indexes.append(squashed_index)
+
+        invalid_squashed_edges = bytearray(len(squashed_edges))
+        invalid_edges = self._evaluate_edges(evaluator, squashed_edges, statistics)
+        try:
+            for squashed_importer, squashed_imported in invalid_edges:
+                # Both modules are interned already, interning them again only looks up their ids.
+                invalid_squashed_edges[squashed_edge_indexes[(squashed_table.intern(squashed_importer), squashed_table.intern(squashed_imported))]] = True
+        finally:
+            invalid_edges.close()
+
+        for edge_index, squashed_index in enumerate(edge_squashed_indexes):
+            if invalid_squashed_edges[squashed_index]:
+                yield edges[edge_index]
+
+    def _evaluate_edges(self, evaluator: EdgeEvaluator, edges: EdgeColumns, statistics: Optional[MatchStatistics]) -> Generator[tuple[str, str], None, None]:
+        if self.workers > 1 or self.evaluation_mode == EvaluationMode.GROUPED:
+            # Both evaluate all imports up front.
+            if statistics is not None:
+                statistics.add_edges_scanned(len(edges))
+            if self.workers > 1:
+                return iter_invalid_edges_parallel(evaluator, edges, self.evaluation_mode, self.workers)
+            return evaluator.iter_invalid_edges(edges, self.evaluation_mode)
+
+        if statistics is not None:
+            return evaluator.iter_invalid_edges(statistics.count_edges(edges), self.evaluation_mode)
+        return evaluator.iter_invalid_edges(edges, self.evaluation_mode)
+
+    def _iter_invalid_edges_cached(self, evaluator: EdgeEvaluator, edges: EdgeColumns, metadata: dict[str, Any], statistics: Optional[MatchStatistics], all_package_edges: bool) -> Generator[tuple[str, str], None, None]:
+        verdict_cache = VerdictCache.open(self.cache_dir or default_cache_dir(), self._fingerprint)
+        module_table = edges.module_table
+        new_verdicts: dict[tuple[int, int], bool] = {}
+        try:
+            # Verdicts are keyed by module ids. Verdicts of imports no longer in the graph are removed, which only a
+            # check of all imports of the root package can tell.
+            current_edges = set(edges.iter_ids())
+            cached_verdicts: dict[tuple[int, int], bool] = {}
+            stale_edges = []
+            for (importer, imported), valid in verdict_cache.load().items():
+                edge_ids = (module_table.find(importer), module_table.find(imported))
+                if edge_ids in current_edges:
+                    cached_verdicts[edge_ids] = valid
+                else:
+                    stale_edges.append((importer, imported))
+
+            unknown_edges = EdgeColumns(module_table)
+            for edge_ids in edges.iter_ids():
+                if edge_ids not in cached_verdicts:
+                    unknown_edges.append_ids(*edge_ids)
+            metadata["verdict_cache"] = {"hits": len(edges) - len(unknown_edges), "misses": len(unknown_edges)}
+
+            # Unknown imports are evaluated lazily in order, so their invalid ones arrive in the same order as in edges.
+            newly_invalid_edges = self._iter_invalid_edges(evaluator, unknown_edges, statistics)
+            next_invalid_edge = next(newly_invalid_edges, None)
+            for edge_ids, edge in zip(edges.iter_ids(), edges):
+                if edge_ids in cached_verdicts:
+                    valid = cached_verdicts[edge_ids]
+                else:
+                    valid = edge != next_invalid_edge
+                    if not valid:
+                        next_invalid_edge = next(newly_invalid_edges, None)
+                    new_verdicts[edge_ids] = valid
+                if not valid:
+                    yield edge
+
+            if all_package_edges:
+                verdict_cache.remove(stale_edges)
+        finally:
+            names = module_table.names
+            verdict_cache.store({(names[importer_id], names[imported_id]): valid for (importer_id, imported_id), valid in new_verdicts.items()})
+            verdict_cache.close()
+
+    def _compile_cache_counters(self) -> list[tuple[int, int]]:
+        """
+        Hits and misses of the compile caches of every import expression. The caches are shared by all contracts using
+        an expression, so a check reports the difference to the counters at its start.
+        """
+        counters = []
+        for import_expression in self.required_imports:
+            using_module_expr = import_expression.using_module_expr
+            counters.append((
+                using_module_expr.compile_cache.hits + using_module_expr.segment_compile_cache.hits,
+                using_module_expr.compile_cache.misses + using_module_expr.segment_compile_cache.misses,
+            ))
+        return counters
+
+    def _compile_cache_stats(self, counters_before: list[tuple[int, int]]) -> dict[str, int]:
+        hits = misses = 0
+        counted = set()
+        for import_expression, (hits_before, misses_before), (hits_after, misses_after) in zip(self.required_imports, counters_before, self._compile_cache_counters()):
+            # Identical expressions are one object sharing its caches.
+            if id(import_expression) in counted:
+                continue
+            counted.add(id(import_expression))
+            hits += hits_after - hits_before
+            misses += misses_after - misses_before
+        return {"hits": hits, "misses": misses}
+
+    def _instrumentation_report(self, statistics: MatchStatistics, compile_cache_counters: list[tuple[int, int]]) -> dict[str, Any]:
+        expressions = []
+        for import_expression, expression_statistics, (hits_before, misses_before), (hits_after, misses_after) in zip(
+            self.required_imports, statistics.expressions, compile_cache_counters, self._compile_cache_counters()
+        ):
+            expressions.append({
+                "expression": import_expression.text,
+                **expression_statistics.as_dict(),
+                "compile_cache_hits": hits_after - hits_before,
+                "compile_cache_misses": misses_after - misses_before,
+            })
+        return {"edges_scanned": statistics.edges_scanned, "expressions": expressions}
+
+    @staticmethod
+    def _print_instrumentation_report(verbose: bool, report: dict[str, Any]):
+        output.verbose_print(verbose, f"Imports evaluated: {report['edges_scanned']}.")
+        # Slowest expressions first, as they are the ones worth reordering or rewriting.
+        for expression in sorted(report["expressions"], key=lambda expression: expression["match_seconds"], reverse=True):
+            output.verbose_print(
+                verbose,
+                f"{expression['expression']}: {expression['match_seconds'] * 1000:.1f} ms, "
+                f"defining {expression['defining_hits']}/{expression['defining_attempts']} matched, "
+                f"using {expression['using_hits']}/{expression['using_attempts']} matched, "
+                f"compile cache {expression['compile_cache_hits']} hits, {expression['compile_cache_misses']} misses."
+            )
 
     def render_broken_contract(self, check: ContractCheck) -> None:
+        if "violation_groups" in check.metadata:
+            self._render_violation_groups(check)
+            return
 
-        for invalid_import in check.metadata["invalid_imports"]:
-            output.print_error(invalid_import)
+        for importer, imported in check.metadata["invalid_imports"]:
+            output.print_error(f"{importer} -> {imported}")
             output.new_line()
 
+    def _render_violation_groups(self, check: ContractCheck):
+        groups = check.metadata["violation_groups"]
+        for group in groups[:self.report_max_groups]:
+            output.print_error(f"{group['importer_package']} -> {group['imported_package']}: {group['count']} invalid imports")
+            for importer, imported in group["samples"]:
+                output.print_error(f"    {importer} -> {imported}")
+            output.new_line()
 
+        omitted_groups = groups[self.report_max_groups:]
+        if omitted_groups:
+            output.print_error(
+                f"... and {sum(group['count'] for group in omitted_groups)} invalid imports in {len(omitted_groups)} more package pairs."
+            )
+            output.new_line()
+        if self.violations_file:
+            output.print(f"All {len(check.metadata['invalid_imports'])} invalid imports were written to {self.violations_file}.")
+            output.new_line()
@@ -0,0 +1,69 @@
+"""
+Splits the check of a contract across several CI nodes and merges their results.
+
+Usage:
+
+    python -m import_linter_dependency_graph.shard check --contract "My contract" --shard 2/4 --output results/ [--config .importlinter]
+    python -m import_linter_dependency_graph.shard merge --contract "My contract" results/ [--config .importlinter]
+
+Every node checks the imports of one shard and writes its invalid imports to a file in the output directory. Once
+the files of all shards are collected in one directory, merge prints the result like a check on a single node and
+exits with 1 if the contract is broken.
+"""
+import argparse
+import glob
+import os
+import sys
+
+from importlinter.application import output
+from importlinter.application.rendering import render_contract_result_line
+
+from import_linter_dependency_graph.configuration import build_contract_graph, load_contract
+from import_linter_dependency_graph.domain.edge_sharding import Shard
+from import_linter_dependency_graph.helpers.shard_results import ShardResult, shard_result_path
+
+
+def main(argv: list[str]) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    check_parser = subparsers.add_parser('check', help='Check the imports of one shard.')
+    check_parser.add_argument('--contract', required=True, help='Name of the import_graph contract.')
+    check_parser.add_argument('--shard', required=True, help="Shard to check, as 'index/count' with index from 1.")
+    check_parser.add_argument('--output', required=True, help='Directory of the shard results.')
+    check_parser.add_argument('--config', help='import-linter configuration file (default: found like lint-imports does).')
+    check_parser.add_argument('--verbose', action='store_true')
+    merge_parser = subparsers.add_parser('merge', help='Merge the results of all shards and print the contract check.')
+    merge_parser.add_argument('--contract', required=True, help='Name of the import_graph contract.')
+    merge_parser.add_argument('--config', help='import-linter configuration file (default: found like lint-imports does).')
+    merge_parser.add_argument('results', help='Directory of the shard results.')
+    arguments = parser.parse_args(argv)
+
+    contract = load_contract(arguments.contract, arguments.config)
+
+    if arguments.command == 'check':
+        try:
+            shard = Shard.parse(arguments.shard)
+        except ValueError as error:
+            raise SystemExit(str(error))
+        result = contract.check_shard(build_contract_graph(contract), shard, arguments.verbose)
+        result.write(shard_result_path(arguments.output, shard))
+        print(f"Shard {shard}: {len(result.invalid_imports)} invalid imports.")
+        return 0
+
+    results = [ShardResult.read(path) for path in sorted(glob.glob(os.path.join(arguments.results, 'shard-*-of-*.json')))]
+    try:
+        check = contract.merge_shard_results(results)
+    except ValueError as error:
+        raise SystemExit(str(error))
+
+    render_contract_result_line(contract, check, duration=None)
+    for warning in check.warnings:
+        output.print_warning(warning)
+    if not check.kept:
+        output.new_line()
+        contract.render_broken_contract(check)
+    return 0 if check.kept else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,240 @@
+"""
+Keeps a contract, its import graph and the verdicts of all imports in a long-running local process, re-checking only
+the imports of changed modules.
+
+Usage:
+
+    python -m import_linter_dependency_graph.watch serve --contract "My contract" [--config .importlinter] [--port 47800]
+    python -m import_linter_dependency_graph.watch check [--port 47800] [CHANGED_FILE ...]
+
+The server builds the graph once. Every check request re-scans the imports of the given files, re-checks the imports
+that were added by them and answers with all invalid imports. Imports resolve to the longest known module, so adding
+or deleting a module also re-scans the unchanged modules importing its parent package or the module itself. Files
+that cannot be read or parsed keep their previous imports until they can. The client prints them and exits with 1 if the contract
+is broken. The server only listens on the loopback interface.
+"""
+import argparse
+import json
+import os
+import socket
+import socketserver
+import sys
+from typing import Any, Optional
+
+from grimp import ImportGraph
+from importlinter import ContractCheck
+
+from import_linter_dependency_graph.configuration import build_contract_graph, load_contract
+from import_linter_dependency_graph.domain.edge_columns import EdgeColumns
+from import_linter_dependency_graph.helpers.module_imports import module_name, module_path, package_directory, scan_imports
+from import_linter_dependency_graph.helpers.package_edges import is_in_package, iter_package_edges
+from import_linter_dependency_graph.required_graph import RequiredGraphContract
+
+
+DEFAULT_PORT = 47800
+
+
+class WatchSession:
+    """
+    A contract with its graph and the verdict of every import of the root package. Verdicts only depend on the names
+    of the modules, so updating the imports of a module re-checks just its added imports.
+    """
+
+    _contract: RequiredGraphContract
+    _graph: ImportGraph
+    _verdicts: dict[tuple[str, str], bool]
+
+    def __init__(self, contract: RequiredGraphContract, graph: ImportGraph):
+        self._contract = contract
+        self._graph = graph
+        self._verdicts = {}
+        self._check_edges(list(iter_package_edges(graph, contract.root_package.name)))
+
+    @property
+    def graph(self) -> ImportGraph:
+        return self._graph
+
+    def update_imports(self, imports_by_module: dict[str, Optional[set[str]]]) -> int:
+        """
+        Replaces the imports of the given modules (None removes the module) and returns the number of imports checked.
+        """
+        added_edges = []
+        for module, imported_modules in imports_by_module.items():
+            if imported_modules is None:
+                if module in self._graph.modules:
+                    self._graph.remove_module(module)
+                self._verdicts = {edge: valid for edge, valid in self._verdicts.items() if module not in edge}
+                continue
+
+            self._graph.add_module(module)
+            previously_imported_modules = self._graph.find_modules_directly_imported_by(module)
+            for imported_module in previously_imported_modules - imported_modules:
+                self._graph.remove_import(importer=module, imported=imported_module)
+                self._verdicts.pop((module, imported_module), None)
+            for imported_module in imported_modules - previously_imported_modules:
+                self._graph.add_import(importer=module, imported=imported_module)
+                added_edges.append((module, imported_module))
+
+        root_package = self._contract.root_package.name
+        self._check_edges([
+            (importer, imported) for importer, imported in added_edges
+            if is_in_package(importer, root_package) and imported != root_package and is_in_package(imported, root_package)
+        ])
+        return len(added_edges)
+
+    def check(self) -> ContractCheck:
+        invalid_imports = [edge for edge, valid in self._verdicts.items() if not valid]
+        return ContractCheck(kept=not invalid_imports, metadata={"invalid_imports": invalid_imports})
+
+    def _check_edges(self, edges: list[tuple[str, str]]):
+        invalid_edges = set(self._contract.find_invalid_imports(self._graph, EdgeColumns.from_edges(edges)))
+        for edge in edges:
+            self._verdicts[edge] = edge not in invalid_edges
+
+
+class FileWatchSession(WatchSession):
+    """
+    Watch session updating modules from their changed source files.
+    """
+
+    _package_directory: str
+
+    def __init__(self, contract: RequiredGraphContract, graph: ImportGraph, package_directory: str):
+        super().__init__(contract, graph)
+        self._package_directory = package_directory
+
+    def update_files(self, paths: list[str]) -> int:
+        root_package = self._contract.root_package.name
+        modules_by_path: dict[str, str] = {}
+        for path in paths:
+            module = module_name(path, self._package_directory, root_package)
+            # Files outside the package directory define no module of the root package.
+            if module is not None:
+                modules_by_path[path] = module
+        deleted_modules = {module for path, module in modules_by_path.items() if not os.path.exists(path)}
+        added_modules = {module for module in modules_by_path.values() if module not in deleted_modules and module not in self._graph.modules}
+        known_modules = (set(self._graph.modules) | added_modules) - deleted_modules
+
+        # Unchanged modules importing a name of an added module resolved it to its package, those importing a deleted
+        # module resolve it to its package from now on.
+        changed_modules = set(modules_by_path.values())
+        resolved_modules = {module.rpartition('.')[0] for module in added_modules} | deleted_modules
+        for resolved_module in resolved_modules & set(self._graph.modules):
+            for importer in self._graph.find_modules_that_directly_import(resolved_module) - changed_modules:
+                importer_path = module_path(importer, self._package_directory, root_package)
+                if importer_path is not None:
+                    modules_by_path[importer_path] = importer
+
+        imports_by_module: dict[str, Optional[set[str]]] = {}
+        for path, module in modules_by_path.items():
+            if not os.path.exists(path):
+                imports_by_module[module] = None
+                continue
+            try:
+                with open(path, encoding='utf-8') as source_file:
+                    source = source_file.read()
+                imports_by_module[module] = scan_imports(source, module, os.path.basename(path) == '__init__.py', known_modules)
+            except (OSError, UnicodeDecodeError, SyntaxError):
+                # Files are often saved half edited, their previous imports stay until they can be read and parsed again.
+                continue
+        return self.update_imports(imports_by_module)
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+
+    server: "WatchServer"
+
+    def handle(self) -> None:
+        try:
+            request = json.loads(self.rfile.readline())
+            session = self.server.session
+            if request.get("command") == "stop":
+                response: dict[str, Any] = {"stopped": True}
+                self.server.stopping = True
+            else:
+                rechecked = session.update_files(request.get("changed", []))
+                check = session.check()
+                response = {"kept": check.kept, "invalid_imports": check.metadata["invalid_imports"], "rechecked": rechecked}
+        except Exception as error:
+            # The client is answered either way, the server keeps the session for the next request.
+            response = {"error": f"{type(error).__name__}: {error}"}
+        self.wfile.write(json.dumps(response).encode('utf-8') + b'\n')
+
+
+class WatchServer(socketserver.TCPServer):
+    """
+    Answers one JSON line request per connection, one request at a time, so the session needs no locking.
+    """
+
+    allow_reuse_address = True
+
+    session: FileWatchSession
+    stopping: bool
+
+    def __init__(self, session: FileWatchSession, port: int = DEFAULT_PORT):
+        super().__init__(('127.0.0.1', port), _RequestHandler)
+        self.session = session
+        self.stopping = False
+
+    def serve_until_stopped(self):
+        while not self.stopping:
+            self.handle_request()
+
+
+def request(payload: dict[str, Any], port: int = DEFAULT_PORT) -> dict[str, Any]:
+    with socket.create_connection(('127.0.0.1', port)) as connection:
+        connection.sendall(json.dumps(payload).encode('utf-8') + b'\n')
+        with connection.makefile('rb') as response_file:
+            response_line = response_file.readline()
+    if not response_line:
+        raise ConnectionError(f"The watch server on port {port} closed the connection without answering.")
+    return json.loads(response_line)
+
+
+def _load_session(contract_name: str, config_filename: Optional[str]) -> FileWatchSession:
+    contract = load_contract(contract_name, config_filename)
+    graph = build_contract_graph(contract)
+    root_package = contract.root_package.name
+
+    directory = package_directory(root_package)
+    if directory is None:
+        raise SystemExit(f"Package '{root_package}' cannot be found.")
+    return FileWatchSession(contract, graph, directory)
+
+
+def main(argv: list[str]) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    serve_parser = subparsers.add_parser('serve', help='Build the graph and answer check requests.')
+    serve_parser.add_argument('--contract', required=True, help='Name of the import_graph contract.')
+    serve_parser.add_argument('--config', help='import-linter configuration file (default: found like lint-imports does).')
+    serve_parser.add_argument('--port', type=int, default=DEFAULT_PORT)
+    check_parser = subparsers.add_parser('check', help='Report changed files and print the invalid imports.')
+    check_parser.add_argument('--port', type=int, default=DEFAULT_PORT)
+    check_parser.add_argument('changed', nargs='*', help='Changed, added or deleted Python files.')
+    stop_parser = subparsers.add_parser('stop', help='Stop the server.')
+    stop_parser.add_argument('--port', type=int, default=DEFAULT_PORT)
+    arguments = parser.parse_args(argv)
+
+    if arguments.command == 'serve':
+        with WatchServer(_load_session(arguments.contract, arguments.config), arguments.port) as server:
+            print(f"Watching on port {arguments.port}.")
+            server.serve_until_stopped()
+        return 0
+
+    try:
+        if arguments.command == 'stop':
+            request({"command": "stop"}, arguments.port)
+            return 0
+        response = request({"changed": [os.path.abspath(path) for path in arguments.changed]}, arguments.port)
+    except OSError as error:
+        raise SystemExit(str(error))
+    if "error" in response:
+        raise SystemExit(f"The watch server failed: {response['error']}")
+    for importer, imported in response["invalid_imports"]:
+        print(f"{importer} -> {imported}")
+    return 0 if response["kept"] else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,83 @@
+import pytest
+
+from import_linter_dependency_graph.batch import check_contracts
+from import_linter_dependency_graph.configuration import load_graph_contracts
+
+
+IMPORTS = [
+    ('root.foo.a', 'root.foo.b'),
+    ('root.foo.a', 'root.bar.b'),
+    ('root.foo.b.c', 'root.foo.a'),
+    ('root.foo', 'root.foo.b.c'),
+    ('root.bar', 'root'),
+    ('other.a', 'other.b.c'),
+    ('rootx.a', 'root.foo.a'),
+]
+
+
+def test_check_contracts__equals_checking_contracts_one_by_one(make_graph, make_contract):
+    contracts = [
+        make_contract(["[**parent].* -> [parent].**"], name='root'),
+        make_contract(["[**parent].* -> **"], name='root again'),
+        make_contract(["[**parent].* -> [parent].*"], name='nested', root_package='root.foo'),
+        make_contract(["[**parent].* -> [parent].*"], name='other', root_package='other'),
+    ]
+
+    checks = check_contracts(contracts, make_graph(IMPORTS))
+
+    for contract, check in zip(contracts, checks):
+        expected = contract.check(make_graph(IMPORTS), verbose=False)
+        assert check.metadata["invalid_imports"] == expected.metadata["invalid_imports"], contract.name
+        assert check.kept == expected.kept
+    assert [check.kept for check in checks] == [False, True, False, False]
+
+
+@pytest.mark.parametrize('options', [
+    {"fail_fast": 'true'},
+    {"max_violations": '2'},
+])
+def test_check_contracts__reports_violations_of_nested_roots_in_their_own_order(make_graph, make_contract, options):
+    imports = [
+        ('root.a', 'root.a.b.c'),
+        ('root.a.x', 'root.a.b.c'),
+        ('root.a.x', 'root.a'),
+        ('root.a.y', 'root.a.b.c'),
+        ('root.z', 'root.a.b.c'),
+    ]
+    contracts = [
+        make_contract(["[**parent].* -> [parent].*"], name='root', **options),
+        make_contract(["[**parent].* -> [parent].*"], name='nested', root_package='root.a', **options),
+    ]
+
+    checks = check_contracts(contracts, make_graph(imports))
+
+    for contract, check in zip(contracts, checks):
+        expected = contract.check(make_graph(imports), verbose=False)
+        assert check.metadata["invalid_imports"] == expected.metadata["invalid_imports"], contract.name
+    assert checks[1].metadata["invalid_imports"][0] == ('root.a.x', 'root.a.b.c')
+
+
+def test_load_graph_contracts__loads_contracts_of_graph_contract_types(tmp_path):
+    config_file = tmp_path / '.importlinter'
+    config_file.write_text(
+        "[importlinter]\n"
+        "root_packages =\n    root\n"
+        "contract_types =\n    import_graph: import_linter_dependency_graph.required_graph.RequiredGraphContract\n"
+        "\n"
+        "[importlinter:contract:graph]\n"
+        "name = Graph\n"
+        "type = import_graph\n"
+        "root_package = root\n"
+        "required_imports =\n    [**parent].* -> [parent].**\n"
+        "\n"
+        "[importlinter:contract:forbidden]\n"
+        "name = Forbidden\n"
+        "type = forbidden\n"
+        "source_modules =\n    root.foo\n"
+        "forbidden_modules =\n    root.bar\n"
+    )
+
+    contracts = load_graph_contracts(str(config_file))
+
+    assert [contract.name for contract in contracts] == ['Graph']
+    assert contracts[0].root_package.name == 'root'
@@ -0,0 +1,39 @@
+from benchmarks.graph_generator import GraphShape, generate_graph
+from benchmarks.run import OPTION_SETS, RULE_SETS, compare, run_benchmark
+
+
+def test_generate_graph__is_reproducible():
+    shape = GraphShape(module_count=200, seed=3)
+
+    first = generate_graph(shape)
+    second = generate_graph(shape)
+
+    assert len(first.modules) == 200
+    assert first.modules == second.modules
+    assert first.find_matching_direct_imports(import_expression="root.** -> root.**") == \
+        second.find_matching_direct_imports(import_expression="root.** -> root.**")
+
+
+def test_run_benchmark__reports_phases_and_throughput():
+    shape = GraphShape(module_count=200)
+    graph = generate_graph(shape)
+
+    for rule_set in RULE_SETS:
+        for option_set in OPTION_SETS:
+            result = run_benchmark(graph, shape, rule_set, option_set)
+
+            assert result["edge_count"] > 0
+            assert result["invalid_import_count"] > 0
+            assert set(result["phases"]) == {"contract_load_seconds", "edge_enumeration_seconds", "check_seconds"}
+            assert result["peak_memory_bytes"] > 0
+
+
+def test_compare__reports_slowdowns_above_threshold():
+    def report(check_seconds: float) -> dict:
+        return {"results": [{
+            "shape": {"module_count": 10}, "rule_set": "same-package", "option_set": "default",
+            "phases": {"check_seconds": check_seconds},
+        }]}
+
+    assert compare(report(1.0), report(1.05), threshold=0.1) == []
+    assert len(compare(report(1.0), report(1.2), threshold=0.1)) == 1
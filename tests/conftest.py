@@ -0,0 +1,52 @@
+from typing import Any, Iterable, Optional
+
+import pytest
+from grimp.adaptors.graph import ImportGraph
+
+from importlinter.application.app_config import settings
+from importlinter.application.ports.printing import Printer
+
+from import_linter_dependency_graph.required_graph import RequiredGraphContract
+
+
+class _CapturingPrinter(Printer):
+
+    def __init__(self):
+        self.lines: list[str] = []
+
+    def print(self, text: str = "", bold: bool = False, color: Optional[str] = None, newline: bool = True) -> None:
+        self.lines.append(text)
+
+
+@pytest.fixture
+def printed_lines():
+    original_settings = settings.copy()
+    printer = _CapturingPrinter()
+    settings.configure(PRINTER=printer)
+    yield printer.lines
+    settings._config = original_settings._config
+
+
+@pytest.fixture
+def make_graph():
+    """
+    Builds an import graph from (importer, imported) pairs.
+    """
+    def make_graph(imports: Iterable[tuple[str, str]]) -> ImportGraph:
+        import_graph = ImportGraph()
+        for importer, imported in imports:
+            import_graph.add_import(importer=importer, imported=imported)
+        return import_graph
+
+    return make_graph
+
+
+@pytest.fixture
+def make_contract():
+    """
+    Builds a contract of the root package 'root' (unless given) from required imports and further contract options.
+    """
+    def make_contract(required_imports: list[str], name: str = 'contract', **options: Any) -> RequiredGraphContract:
+        return RequiredGraphContract(name, {}, {"root_package": 'root', "required_imports": required_imports, **options})
+
+    return make_contract
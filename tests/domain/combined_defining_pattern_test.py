@@ -0,0 +1,37 @@
+from import_linter_dependency_graph.domain.combined_defining_pattern import CombinedDefiningPattern
+from import_linter_dependency_graph.fields.module_expression_field import DefiningModuleExpressionField
+
+
+def _combined(*expressions: str) -> CombinedDefiningPattern:
+    return CombinedDefiningPattern([
+        (position, DefiningModuleExpressionField().parse(expression))
+        for position, expression in enumerate(expressions)
+    ])
+
+
+def test_match_all__reports_every_matching_expression_in_order():
+    combined = _combined('[**parent].*', 'root.other.*', '[**?parent].*.*', 'root.**')
+
+    assert combined.match_all('root.foo.bar') == [
+        (0, {"parent": "root.foo"}),
+        (2, {"parent": "root"}),
+        (3, {}),
+    ]
+
+
+def test_match_all__captures_same_variables_as_fullmatch():
+    expressions = ['[**?a].[**b]', '[**a].[**?b]', 'root.[**?parent].shared.**', '[**parent].[name]_port']
+    combined = _combined(*expressions)
+
+    for module in ['root.foo.shared.bar.database_port', 'root.shared.shared.x', 'root.a']:
+        expected = []
+        for position, expression in enumerate(expressions):
+            match = DefiningModuleExpressionField().parse(expression).pattern.fullmatch(module)
+            if match is not None:
+                expected.append((position, match.groupdict()))
+
+        assert combined.match_all(module) == expected
+
+
+def test_match_all__without_expressions_matches_nothing():
+    assert _combined().match_all('root.foo') == []
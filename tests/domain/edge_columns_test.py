@@ -0,0 +1,30 @@
+from import_linter_dependency_graph.domain.edge_columns import EdgeColumns, ModuleTable
+
+
+_EDGES = [('root.a', 'root.b'), ('root.b', 'root.c'), ('root.a', 'root.c')]
+
+
+def test_module_table__interns_every_name_once():
+    module_table = ModuleTable()
+
+    assert [module_table.intern(module) for module in ['root.a', 'root.b', 'root.a']] == [0, 1, 0]
+    assert module_table.find('root.b') == 1
+    assert module_table.find('root.x') is None
+    assert module_table.name(1) == 'root.b'
+    assert len(module_table) == 2
+
+
+def test_edge_columns__behave_as_sequence_of_names():
+    edge_columns = EdgeColumns.from_edges(_EDGES)
+
+    assert list(edge_columns) == _EDGES
+    assert len(edge_columns) == 3
+    assert edge_columns[1] == ('root.b', 'root.c')
+    assert edge_columns[1:] == _EDGES[1:]
+
+
+def test_edge_columns__store_module_ids():
+    edge_columns = EdgeColumns.from_edges(_EDGES)
+
+    assert list(edge_columns.iter_ids()) == [(0, 1), (1, 2), (0, 2)]
+    assert len(edge_columns.module_table) == 3
@@ -0,0 +1,57 @@
+import pytest
+
+from import_linter_dependency_graph.domain.edge_evaluation import EdgeEvaluator, EvaluationMode
+from import_linter_dependency_graph.domain.expression_ranking import ExpressionRanking
+from import_linter_dependency_graph.domain.import_expression_index import ImportExpressionIndex
+from import_linter_dependency_graph.domain.matching_engine import MatchingEngine, create_matcher
+from import_linter_dependency_graph.fields.import_expression_field import ImportExpressionField
+
+
+_EXPRESSIONS = [
+    '[**parent].* -> [parent].**',
+    '[**?shared_parent].shared.** <- [shared_parent].**',
+    'root.[**parent].ports.[port_name]_port <- root.[parent].adapters.[port_name]_adapter',
+]
+
+_EDGES = [
+    ('root.foo.b', 'root.foo.bar.d'),
+    ('root.foo.b', 'root.shared.a'),
+    ('root.foo.b', 'root.bar.e'),
+    ('root.shared.a', 'root.foo.shared.c'),
+    ('root.foo.bar.d', 'root.foo.b'),
+    ('root.foo.bar.d', 'root.foo.shared.c'),
+    ('root.x.adapters.db_adapter', 'root.x.ports.db_port'),
+    ('root.x.adapters.fs_adapter', 'root.x.ports.db_port'),
+]
+
+
+def _evaluator(matching_engine: MatchingEngine, ranking: ExpressionRanking = None) -> EdgeEvaluator:
+    import_expressions = [ImportExpressionField().parse(expression) for expression in _EXPRESSIONS]
+    matcher = create_matcher(matching_engine, import_expressions, ImportExpressionIndex(import_expressions))
+    return EdgeEvaluator(import_expressions, matcher, ranking)
+
+
+@pytest.mark.parametrize('matching_engine', list(MatchingEngine))
+@pytest.mark.parametrize('evaluation_mode', list(EvaluationMode))
+@pytest.mark.parametrize('ranking_hits', [None, [0, 5, 1]])
+def test_iter_invalid_edges(matching_engine, evaluation_mode, ranking_hits):
+    ranking = ExpressionRanking(len(_EXPRESSIONS), hits=ranking_hits) if ranking_hits is not None else None
+
+    invalid_edges = list(_evaluator(matching_engine, ranking).iter_invalid_edges(_EDGES, evaluation_mode))
+
+    assert invalid_edges == [
+        ('root.foo.b', 'root.bar.e'),
+        ('root.shared.a', 'root.foo.shared.c'),
+        ('root.foo.bar.d', 'root.foo.b'),
+        ('root.x.adapters.fs_adapter', 'root.x.ports.db_port'),
+    ]
+
+
+@pytest.mark.parametrize('evaluation_mode', list(EvaluationMode))
+def test_iter_invalid_edges__counts_hits_of_ranking(evaluation_mode):
+    ranking = ExpressionRanking(len(_EXPRESSIONS))
+
+    list(_evaluator(MatchingEngine.REGEX, ranking).iter_invalid_edges(_EDGES, evaluation_mode))
+
+    assert sum(ranking.hits) == 4
+    assert ranking.hits[2] == 1
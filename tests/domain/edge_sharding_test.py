@@ -0,0 +1,29 @@
+import pytest
+
+from import_linter_dependency_graph.domain.edge_sharding import Shard, shard_index
+
+
+def test_parse():
+    shard = Shard.parse('2/4')
+
+    assert (shard.index, shard.count) == (2, 4)
+    assert str(shard) == '2/4'
+
+
+@pytest.mark.parametrize('text', ['0/4', '5/4', '1/0', '1', 'a/b'])
+def test_parse__rejects_invalid_shards(text):
+    with pytest.raises(ValueError):
+        Shard.parse(text)
+
+
+def test_shard_index__keeps_modules_of_one_subpackage_together():
+    assert shard_index('root.foo.a.b', 'root', 7) == shard_index('root.foo', 'root', 7)
+    # crc32, so the shard is the same in every process regardless of hash randomization.
+    assert [shard_index(module, 'root', 4) for module in ('root', 'root.foo', 'root.bar')] == [4, 3, 2]
+
+
+def test_contains__assigns_every_module_to_one_shard():
+    shards = [Shard(index, 3) for index in range(1, 4)]
+
+    for module in ('root', 'root.a', 'root.b.c', 'root.c.d.e', 'root.d'):
+        assert sum(shard.contains(module, 'root') for shard in shards) == 1
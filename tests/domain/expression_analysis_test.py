@@ -0,0 +1,70 @@
+import pytest
+
+from import_linter_dependency_graph.domain.expression_analysis import analyze_import_expressions, is_subsumed
+from import_linter_dependency_graph.fields.import_expression_field import ImportExpressionField
+
+
+def _parse(expression: str):
+    return ImportExpressionField().parse(expression)
+
+
+@pytest.mark.parametrize('expression, by', [
+    ('root.foo.* -> root.bar.baz', 'root.foo.* -> root.bar.baz'),
+    ('root.foo.a -> root.bar.baz', 'root.** -> root.bar.*'),
+    ('root.foo.a.b -> root.bar', 'root.**.b -> root.*'),
+    ('root.foo.[x]_port -> root.bar', 'root.** -> root.bar'),
+    ('root.[**parent].* -> root.[parent].foo', 'root.[**parent].* -> root.[parent].**'),
+    ('root.[**parent].* -> root.[parent].foo', 'root.[**parent].* -> root.**'),
+    ('root.[**?parent].shared.** <- root.[parent].a', 'root.[**?parent].shared.** <- root.[parent].**'),
+])
+def test_is_subsumed(expression, by):
+    assert is_subsumed(_parse(expression), by=_parse(by))
+
+
+@pytest.mark.parametrize('expression, by', [
+    ('root.foo.* -> root.bar.baz', 'root.foo.* <- root.bar.baz'),
+    ('root.** -> root.bar.*', 'root.foo.a -> root.bar.baz'),
+    ('root.[x].a -> root.bar', 'root.* -> root.bar'),
+    ('root.foo.[**parent].* -> root.[parent].foo', 'root.[**parent].* -> root.[parent].**'),
+    ('root.[**parent].* -> root.[parent].**', 'root.[**parent].* -> root.[parent].*'),
+    ('root.[**parent].* -> root.**', 'root.[**parent].* -> root.[parent].**'),
+])
+def test_is_not_subsumed(expression, by):
+    assert not is_subsumed(_parse(expression), by=_parse(by))
+
+
+@pytest.mark.parametrize('expression, fragment', [
+    ('root.[**?a].[**b].* -> root', '[**?a].[**b]'),
+    ('root.**.*.** -> root', '**.*.**'),
+    ('root -> root.**.**', '**.**'),
+])
+def test_analyze_import_expressions__reports_ambiguous_wildcards(expression, fragment):
+    [finding] = analyze_import_expressions([_parse(expression)])
+
+    assert f"ambiguous wildcards '{fragment}'" in finding
+
+
+def test_analyze_import_expressions__reports_every_ambiguous_pair():
+    findings = analyze_import_expressions([_parse('**.[**?a].**.[**b].* -> root')])
+
+    assert [finding.split("'")[3] for finding in findings] == ['**.[**?a]', '[**?a].**', '**.[**b]']
+
+
+def test_analyze_import_expressions__reports_expressions_covered_by_earlier_ones():
+    findings = analyze_import_expressions([
+        _parse('root.[**parent].* -> root.[parent].**'),
+        _parse('root.[**parent].* -> root.[parent].foo'),
+        _parse('root.foo.a <- root.bar.b'),
+    ])
+
+    assert findings == [
+        "Import expression 'root.[**parent].* -> root.[parent].foo' is covered by the earlier import expression "
+        "'root.[**parent].* -> root.[parent].**' and never changes the result."
+    ]
+
+
+def test_analyze_import_expressions__accepts_anchored_wildcards():
+    assert analyze_import_expressions([
+        _parse('root.[**parent].* -> root.[parent].**'),
+        _parse('root.[**?shared_parent].shared.** <- root.[shared_parent].**'),
+    ]) == []
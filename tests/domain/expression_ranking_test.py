@@ -0,0 +1,20 @@
+from import_linter_dependency_graph.domain.expression_ranking import ExpressionRanking
+
+
+def test_order__by_descending_hits_then_configured_order():
+    ranking = ExpressionRanking(4, hits=[1, 3, 0, 3])
+
+    assert ranking.order([0, 1, 2, 3]) == [1, 3, 0, 2]
+
+
+def test_init__ignores_hits_of_another_expression_count():
+    assert ExpressionRanking(2, hits=[1, 2, 3]).hits == [0, 0]
+
+
+def test_take_new_hits__returns_hits_since_last_call():
+    ranking = ExpressionRanking(2, hits=[5, 0])
+    ranking.record_hits(1, 2)
+
+    assert ranking.take_new_hits() == [0, 2]
+    assert ranking.take_new_hits() == [0, 0]
+    assert ranking.hits == [5, 2]
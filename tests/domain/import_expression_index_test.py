@@ -0,0 +1,40 @@
+from import_linter_dependency_graph.domain.import_expression import ImportType
+from import_linter_dependency_graph.domain.import_expression_index import ImportExpressionIndex
+from import_linter_dependency_graph.fields.import_expression_field import ImportExpressionField
+
+
+def _index(*expressions: str) -> ImportExpressionIndex:
+    return ImportExpressionIndex([ImportExpressionField().parse(expression) for expression in expressions])
+
+
+def test_candidates__only_contain_expressions_with_matching_literal_prefix():
+    index = _index(
+        'root.billing.ports.* -> root.billing.**',
+        'root.shipping.* -> root.shipping.**',
+        'root.billing.* -> root.**',
+    )
+
+    assert index.candidates(ImportType.IMPORTING, 'root.billing.ports.db') == (0, 2)
+    assert index.candidates(ImportType.IMPORTING, 'root.shipping.db') == (1,)
+    assert index.candidates(ImportType.IMPORTING, 'root.other.db') == ()
+
+
+def test_candidates__contain_wildcard_led_expressions_for_every_module():
+    index = _index(
+        'root.billing.* -> root.billing.**',
+        '[**parent].* -> [parent].**',
+        '*.shipping.* -> root.**',
+    )
+
+    assert index.candidates(ImportType.IMPORTING, 'root.billing.db') == (0, 1, 2)
+    assert index.candidates(ImportType.IMPORTING, 'root.other.db') == (1, 2)
+
+
+def test_candidates__are_separated_by_import_type():
+    index = _index(
+        'root.billing.* -> root.**',
+        'root.billing.* <- root.**',
+    )
+
+    assert index.candidates(ImportType.IMPORTING, 'root.billing.db') == (0,)
+    assert index.candidates(ImportType.IMPORTED, 'root.billing.db') == (1,)
@@ -0,0 +1,65 @@
+import pytest
+
+from import_linter_dependency_graph.domain.edge_evaluation import EdgeEvaluator, EvaluationMode
+from import_linter_dependency_graph.domain.import_expression_index import ImportExpressionIndex
+from import_linter_dependency_graph.domain.instrumented_matcher import InstrumentedMatcher
+from import_linter_dependency_graph.domain.matching_engine import MatchingEngine, create_matcher
+from import_linter_dependency_graph.fields.import_expression_field import ImportExpressionField
+
+
+_EXPRESSIONS = [
+    'root.[**parent].* -> root.[parent].**',
+    'root.[**?shared_parent].shared.** <- root.[shared_parent].**',
+]
+
+_EDGES = [
+    ('root.foo.a', 'root.foo.b'),
+    ('root.foo.bar.a', 'root.foo.shared.x'),
+    ('root.foo.a', 'root.bar.b'),
+]
+
+
+def _instrumented_evaluator(matching_engine: MatchingEngine, expressions: list[str] = _EXPRESSIONS) -> tuple[EdgeEvaluator, InstrumentedMatcher]:
+    import_expressions = [ImportExpressionField().parse(expression) for expression in expressions]
+    matcher = InstrumentedMatcher(create_matcher(matching_engine, import_expressions, ImportExpressionIndex(import_expressions)))
+    return EdgeEvaluator(import_expressions, matcher), matcher
+
+
+@pytest.mark.parametrize('matching_engine', list(MatchingEngine))
+@pytest.mark.parametrize('evaluation_mode', list(EvaluationMode))
+def test_statistics__count_attempts_and_hits_per_expression(matching_engine, evaluation_mode):
+    evaluator, matcher = _instrumented_evaluator(matching_engine)
+
+    invalid_edges = list(evaluator.iter_invalid_edges(_EDGES, evaluation_mode))
+
+    assert invalid_edges == [('root.foo.a', 'root.bar.b')]
+    same_package, shared = matcher.statistics.expressions
+    assert same_package.defining_hits > 0
+    assert same_package.using_hits == 1
+    assert same_package.using_attempts >= 2
+    assert shared.defining_hits == 1
+    assert shared.using_hits == 1
+    assert same_package.match_seconds > 0
+
+
+@pytest.mark.parametrize('matching_engine', [MatchingEngine.REGEX, MatchingEngine.SEGMENT])
+def test_statistics__count_repeated_expressions_at_their_own_position(matching_engine):
+    # Parsing interns both to one object.
+    evaluator, matcher = _instrumented_evaluator(matching_engine, [_EXPRESSIONS[0], _EXPRESSIONS[0]])
+
+    list(evaluator.iter_invalid_edges([('root.foo.a', 'root.bar.b')], EvaluationMode.EDGE))
+
+    assert [statistics.defining_attempts for statistics in matcher.statistics.expressions] == [1, 1]
+    assert [statistics.using_attempts for statistics in matcher.statistics.expressions] == [1, 1]
+
+
+def test_statistics__take_returns_counters_and_resets_them():
+    evaluator, matcher = _instrumented_evaluator(MatchingEngine.REGEX)
+    list(evaluator.iter_invalid_edges(_EDGES, EvaluationMode.EDGE))
+
+    taken = matcher.statistics.take()
+
+    assert taken.expressions[0].defining_attempts == 3
+    assert matcher.statistics.expressions[0].defining_attempts == 0
+    matcher.statistics.merge(taken)
+    assert matcher.statistics.expressions[0].defining_attempts == 3
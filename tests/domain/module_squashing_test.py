@@ -0,0 +1,26 @@
+import pytest
+
+from import_linter_dependency_graph.domain.module_squashing import squash_depths, squash_module
+from import_linter_dependency_graph.fields.import_expression_field import ImportExpressionField
+
+
+@pytest.mark.parametrize('expressions, expected', [
+    (['root.* -> root.*.**'], (3, 3)),
+    (['root.[x] -> root.[x].**'], (3, 3)),
+    (['root.[x].** -> root.[x].**', 'root.shared.** <- root.*.*'], (4, 3)),
+    (['root.[**unused] -> root.foo'], (2, 3)),
+    (['[**parent].* -> [parent].**'], None),
+    (['root.[**x] -> root.[x].foo'], None),
+    (['root.*.** -> root.**.foo'], None),
+])
+def test_squash_depths(expressions, expected):
+    assert squash_depths([ImportExpressionField().parse(expression) for expression in expressions]) == expected
+
+
+@pytest.mark.parametrize('module, depth, expected', [
+    ('root.foo.bar', 2, 'root.foo'),
+    ('root.foo', 2, 'root.foo'),
+    ('root', 3, 'root'),
+])
+def test_squash_module(module, depth, expected):
+    assert squash_module(module, depth) == expected
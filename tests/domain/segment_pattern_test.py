@@ -0,0 +1,64 @@
+import pytest
+
+from import_linter_dependency_graph.fields.module_expression_field import DefiningModuleExpressionField, \
+    UsingModuleExpressionField
+
+
+_MODULES = [
+    'root',
+    'root.foo',
+    'root.foo.bar',
+    'root.foo.shared.bar',
+    'root.shared.foo.shared.bar',
+    'root.a.b.c.d.e.f',
+    'root.ports.database_port',
+    'root.foo.ports.database_port',
+    'root.adapters.database_adapter',
+]
+
+
+@pytest.mark.parametrize('expression', [
+    'root.foo.bar',
+    'root.*.bar',
+    'root.**',
+    'root.**?',
+    '[**parent].*',
+    '[**?parent].*',
+    '[**?shared_parent].shared.**',
+    '[**shared_parent].shared.**',
+    '**.[**?a].**.[**b].*',
+    '[**?a].[**b]',
+    'root.[**parent].ports.[port_name]_port',
+    'root.[name].**',
+])
+def test_defining_segment_pattern__captures_same_variables_as_regex(expression):
+    defining_module_expression = DefiningModuleExpressionField().parse(expression)
+
+    for module in _MODULES:
+        regex_match = defining_module_expression.pattern.fullmatch(module)
+        expected = regex_match.groupdict() if regex_match is not None else None
+
+        assert defining_module_expression.segment_pattern.match(module.split('.')) == expected, module
+
+
+@pytest.mark.parametrize('expression, variables', [
+    ('[parent].**', {"parent": "root.foo"}),
+    ('[parent].*', {"parent": "root"}),
+    ('root.[parent]', {"parent": "foo.bar"}),
+    ('root.**?.[port_name]_adapter', {"port_name": "database"}),
+    ('root.[a]_[b]', {"a": "adapters.database", "b": "adapter"}),
+])
+def test_using_segment_pattern__matches_same_modules_as_regex(expression, variables):
+    using_module_expression = UsingModuleExpressionField().parse(expression)
+
+    for module in _MODULES:
+        expected = using_module_expression.compile(variables).fullmatch(module) is not None
+
+        assert (using_module_expression.compile_segments(variables).match(module.split('.')) is not None) == expected, module
+
+
+def test_defining_segment_pattern__matches_deep_module_without_exponential_backtracking():
+    defining_module_expression = DefiningModuleExpressionField().parse('**.[**?a].**.[**b].**.x')
+    module = '.'.join(['p'] * 200)
+
+    assert defining_module_expression.segment_pattern.match(module.split('.')) is None
@@ -0,0 +1,40 @@
+from import_linter_dependency_graph.domain.import_expression_index import ImportExpressionIndex
+from import_linter_dependency_graph.domain.matching_engine import MatchingEngine, create_matcher
+from import_linter_dependency_graph.domain.target_set_matcher import TargetSetMatcher
+from import_linter_dependency_graph.fields.import_expression_field import ImportExpressionField
+
+
+_MODULES = ['root', 'root.foo', 'root.foo.a', 'root.foo.b', 'root.foobar', 'root.foobar.c', 'root.bar.d']
+
+
+def _target_set_matcher(expression: str, memory_cap: int) -> tuple[TargetSetMatcher, object]:
+    import_expressions = [ImportExpressionField().parse(expression)]
+    matcher = create_matcher(MatchingEngine.REGEX, import_expressions, ImportExpressionIndex(import_expressions))
+    return TargetSetMatcher(matcher, _MODULES, memory_cap=memory_cap), import_expressions[0]
+
+
+def test_using_matcher__tests_membership_of_materialized_set():
+    matcher, import_expression = _target_set_matcher('[**parent].* -> [parent].**', memory_cap=100)
+
+    using_matches = matcher.using_matcher(import_expression, {"parent": "root.foo"})
+
+    assert [module for module in _MODULES if using_matches(module)] == ['root.foo.a', 'root.foo.b']
+    assert matcher.memory_used == 2
+
+
+def test_using_matcher__resolves_each_binding_once():
+    matcher, import_expression = _target_set_matcher('[**parent].* -> [parent].**', memory_cap=100)
+
+    matcher.using_matcher(import_expression, {"parent": "root.foo"})
+    matcher.using_matcher(import_expression, {"parent": "root.foo", "other": "x"})
+
+    assert matcher.memory_used == 2
+
+
+def test_using_matcher__falls_back_to_matching_engine_if_set_exceeds_memory_cap():
+    matcher, import_expression = _target_set_matcher('[**parent].* -> root.**', memory_cap=3)
+
+    using_matches = matcher.using_matcher(import_expression, {"parent": "root.foo"})
+
+    assert matcher.memory_used == 0
+    assert [module for module in _MODULES if using_matches(module)] == _MODULES[1:]
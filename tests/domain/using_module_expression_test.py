@@ -22,4 +22,37 @@ def test_compile_escapes_special_characters():
 def test_compile__fails__if_variable_is_missing():
     using_module_expression = UsingModuleExpressionField().parse('foo.[bar].[baz]')
     with pytest.raises(ValueError):
-        using_module_expression.compile({"bar":"(bar_value)"})
\ No newline at end of file
+        using_module_expression.compile({"bar":"(bar_value)"})
+
+def test_compile__without_variables__returns_pattern_compiled_at_parse_time():
+    using_module_expression = UsingModuleExpressionField().parse('foo.**')
+
+    assert using_module_expression.compile({}) is using_module_expression.compile({"bar": "bar_value"})
+    assert using_module_expression.compile_cache.misses == 0
+
+
+def test_compile__caches_pattern_per_binding():
+    using_module_expression = UsingModuleExpressionField().parse('foo.[bar]')
+
+    first = using_module_expression.compile({"bar": "bar_value", "unused": "a"})
+    second = using_module_expression.compile({"bar": "bar_value", "unused": "b"})
+    using_module_expression.compile({"bar": "other_value"})
+
+    assert first is second
+    assert using_module_expression.compile_cache.hits == 1
+    assert using_module_expression.compile_cache.misses == 2
+
+
+def test_compile__evicts_least_recently_used_binding():
+    using_module_expression = UsingModuleExpressionField().parse('foo.[bar]')
+    using_module_expression.compile_cache.resize(2)
+
+    using_module_expression.compile({"bar": "a"})
+    using_module_expression.compile({"bar": "b"})
+    using_module_expression.compile({"bar": "a"})
+    using_module_expression.compile({"bar": "c"})
+    using_module_expression.compile({"bar": "b"})
+
+    assert len(using_module_expression.compile_cache) == 2
+    assert using_module_expression.compile_cache.hits == 1
+    assert using_module_expression.compile_cache.misses == 4
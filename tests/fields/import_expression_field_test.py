@@ -32,4 +32,22 @@ def test_validation_error__if_malformed_direction():
 
 def test_validation_error__if_multiple_direction():
     with pytest.raises(ValidationError):
-        ImportExpressionField().parse('foo.bar -> foobar -> baz')
\ No newline at end of file
+        ImportExpressionField().parse('foo.bar -> foobar -> baz')
+
+def test_parse__shares_identical_expressions():
+    first = ImportExpressionField().parse('foo.[**a].* -> foo.[a].**')
+    second = ImportExpressionField().parse('  foo.[**a].*->foo.[a].** ')
+
+    assert second is first
+    assert second.text == 'foo.[**a].* -> foo.[a].**'
+    assert ImportExpressionField().parse('foo.[**a].* <- foo.[a].**') is not first
+
+
+def test_reserve_compile_cache_size__keeps_largest_size_of_shared_expression():
+    using_module_expr = ImportExpressionField().parse('foo.[**b].* -> foo.[b].bar').using_module_expr
+
+    using_module_expr.reserve_compile_cache_size(10)
+    using_module_expr.reserve_compile_cache_size(5)
+
+    assert using_module_expr.compile_cache.maxsize == 10
+    assert using_module_expr.segment_compile_cache.maxsize == 10
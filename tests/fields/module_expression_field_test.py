@@ -100,3 +100,14 @@ class TestUsingModuleExpressionField:
         actual = UsingModuleExpressionField().parse('foo.baz.[foo]_some_[bar]-other_[baz]')
         assert actual == UsingModuleExpression(r'foo\.baz\.(?=foo)_some_(?=bar)-other_(?=baz)')
 
+
+class TestDefiningModuleExpressionFieldLiteralPrefix:
+
+    def test_literal_prefix__stops_at_first_wildcard(self):
+        assert DefiningModuleExpressionField().parse('foo.bar.*.baz').literal_prefix == ('foo', 'bar')
+
+    def test_literal_prefix__stops_at_first_variable(self):
+        assert DefiningModuleExpressionField().parse('foo.[bar]_port.baz').literal_prefix == ('foo',)
+
+    def test_literal_prefix__is_empty_for_wildcard_led_expression(self):
+        assert DefiningModuleExpressionField().parse('[**parent].foo').literal_prefix == ()
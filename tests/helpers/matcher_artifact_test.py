@@ -0,0 +1,42 @@
+import pickle
+
+from import_linter_dependency_graph.domain.import_expression_index import ImportExpressionIndex
+from import_linter_dependency_graph.domain.matching_engine import CombinedRegexMatcher, MatchingEngine
+from import_linter_dependency_graph.fields.import_expression_field import ImportExpressionField
+from import_linter_dependency_graph.helpers.matcher_artifact import MatcherArtifact
+
+
+def _artifact() -> MatcherArtifact:
+    import_expressions = [ImportExpressionField().parse("root.[**parent].* -> root.[parent].*")]
+    expression_index = ImportExpressionIndex(import_expressions)
+    matcher = CombinedRegexMatcher(import_expressions, expression_index)
+    return MatcherArtifact('fingerprint', MatchingEngine.COMBINED_REGEX, import_expressions, expression_index, matcher, ["finding"])
+
+
+def test_read__returns_written_artifact(tmp_path):
+    path = str(tmp_path / 'artifacts' / 'matcher.pickle')
+    _artifact().write(path)
+
+    artifact = MatcherArtifact.read(path)
+
+    assert artifact.fingerprint == 'fingerprint'
+    assert artifact.matching_engine == MatchingEngine.COMBINED_REGEX
+    assert artifact.import_expressions[0].text == "root.[**parent].* -> root.[parent].*"
+    import_type = artifact.import_expressions[0].import_type
+    assert list(artifact.matcher.iter_defining_matches(import_type, 'root.foo.a')) == [(0, {"parent": "foo"})]
+    assert artifact.expression_index.candidates(import_type, 'other.a') == ()
+    assert artifact.expression_findings == ["finding"]
+
+
+def test_read__ignores_missing_and_other_version_artifacts(tmp_path):
+    path = str(tmp_path / 'matcher.pickle')
+    assert MatcherArtifact.read(path) is None
+
+    with open(path, 'wb') as artifact_file:
+        pickle.dump(0, artifact_file)
+        pickle.dump(_artifact(), artifact_file)
+    assert MatcherArtifact.read(path) is None
+
+    with open(path, 'wb') as artifact_file:
+        artifact_file.write(b'not a pickle')
+    assert MatcherArtifact.read(path) is None
@@ -0,0 +1,37 @@
+import os
+
+import pytest
+
+from import_linter_dependency_graph.helpers.module_imports import module_name, scan_imports
+
+
+@pytest.mark.parametrize("relative_path, expected", [
+    ('a.py', 'root.a'),
+    ('sub/__init__.py', 'root.sub'),
+    ('sub/b.py', 'root.sub.b'),
+    ('__init__.py', 'root'),
+    ('notes.txt', None),
+    ('../elsewhere.py', None),
+])
+def test_module_name(relative_path, expected):
+    package_directory = os.path.join('project', 'root')
+
+    assert module_name(os.path.join(package_directory, relative_path), package_directory, 'root') == expected
+
+
+KNOWN_MODULES = {'root', 'root.a', 'root.sub', 'root.sub.b', 'root.sub.c', 'other'}
+
+
+@pytest.mark.parametrize("source, module, is_package, expected", [
+    ("import root.a", 'root.sub.b', False, {'root.a'}),
+    ("import os\nimport root.a.missing", 'root.sub.b', False, {'root.a'}),
+    ("from root.sub import c, helper", 'root.a', False, {'root.sub.c', 'root.sub'}),
+    ("from . import c", 'root.sub.b', False, {'root.sub.c'}),
+    ("from . import c", 'root.sub', True, {'root.sub.c'}),
+    ("from ..a import name", 'root.sub.b', False, {'root.a'}),
+    ("from .b import *", 'root.sub.c', False, {'root.sub.b'}),
+    ("def f():\n    import other", 'root.a', False, {'other'}),
+    ("from . import b", 'root.sub.b', False, set()),
+])
+def test_scan_imports(source, module, is_package, expected):
+    assert scan_imports(source, module, is_package, KNOWN_MODULES) == expected
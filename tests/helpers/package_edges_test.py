@@ -0,0 +1,44 @@
+from grimp.adaptors.graph import ImportGraph
+
+from import_linter_dependency_graph.helpers.package_edges import is_in_package, iter_module_edges, iter_package_edges
+
+
+def test_is_in_package():
+    assert is_in_package('root', 'root')
+    assert is_in_package('root.foo.bar', 'root')
+    assert not is_in_package('rootx', 'root')
+    assert not is_in_package('rootx.foo', 'root')
+    assert not is_in_package('other.root', 'root')
+
+
+def test_iter_package_edges__only_yields_edges_inside_package_except_to_package():
+    import_graph = ImportGraph()
+    import_graph.add_import(importer='root', imported='root.foo')
+    import_graph.add_import(importer='root.foo', imported='root.bar.baz')
+    import_graph.add_import(importer='root.bar.baz', imported='root')
+    import_graph.add_import(importer='rootx.foo', imported='root.foo')
+    import_graph.add_import(importer='root.foo', imported='rootx')
+    import_graph.add_import(importer='other', imported='root.foo')
+
+    assert set(iter_package_edges(import_graph, 'root')) == {
+        ('root', 'root.foo'),
+        ('root.foo', 'root.bar.baz'),
+    }
+
+
+def test_iter_module_edges__only_yields_edges_touching_modules():
+    import_graph = ImportGraph()
+    import_graph.add_import(importer='root.a', imported='root.b')
+    import_graph.add_import(importer='root.b', imported='root.c')
+    import_graph.add_import(importer='root.c', imported='root.a')
+    import_graph.add_import(importer='root.c', imported='root.d')
+    import_graph.add_import(importer='other', imported='root.a')
+    import_graph.add_import(importer='root.a', imported='rootx')
+    import_graph.add_import(importer='root.a', imported='root')
+
+    assert list(iter_module_edges(import_graph, 'root', ['root', 'root.a', 'root.c', 'root.missing', 'other'])) == [
+        ('root.c', 'root.a'),
+        ('root.a', 'root.b'),
+        ('root.b', 'root.c'),
+        ('root.c', 'root.d'),
+    ]
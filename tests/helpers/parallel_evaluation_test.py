@@ -0,0 +1,44 @@
+import pytest
+
+from import_linter_dependency_graph.domain.edge_evaluation import EdgeEvaluator, EvaluationMode
+from import_linter_dependency_graph.domain.import_expression_index import ImportExpressionIndex
+from import_linter_dependency_graph.domain.matching_engine import MatchingEngine, create_matcher
+from import_linter_dependency_graph.fields.import_expression_field import ImportExpressionField
+from import_linter_dependency_graph.helpers.parallel_evaluation import iter_invalid_edges_parallel
+
+
+def _evaluator(matching_engine: MatchingEngine) -> EdgeEvaluator:
+    import_expressions = [ImportExpressionField().parse('[**parent].* -> [parent].**')]
+    matcher = create_matcher(matching_engine, import_expressions, ImportExpressionIndex(import_expressions))
+    return EdgeEvaluator(import_expressions, matcher)
+
+
+_EDGES = [
+    (f"root.p{importer % 7}.m{importer}", f"root.p{imported % 5}.m{imported}")
+    for importer in range(30)
+    for imported in range(0, 30, 4)
+]
+
+
+@pytest.mark.parametrize('use_threads', [True, False])
+@pytest.mark.parametrize('matching_engine', list(MatchingEngine))
+def test_iter_invalid_edges_parallel__matches_sequential_evaluation(use_threads, matching_engine):
+    expected = list(_evaluator(matching_engine).iter_invalid_edges(_EDGES, EvaluationMode.EDGE))
+
+    actual = list(iter_invalid_edges_parallel(_evaluator(matching_engine), _EDGES, EvaluationMode.GROUPED, workers=3, use_threads=use_threads))
+
+    assert expected
+    assert actual == expected
+
+
+def test_iter_invalid_edges_parallel__without_edges():
+    assert list(iter_invalid_edges_parallel(_evaluator(MatchingEngine.REGEX), [], EvaluationMode.EDGE, workers=2)) == []
+
+
+def test_iter_invalid_edges_parallel__can_be_closed_early():
+    invalid_edges = iter_invalid_edges_parallel(_evaluator(MatchingEngine.REGEX), _EDGES, EvaluationMode.EDGE, workers=2, use_threads=True)
+
+    first = next(invalid_edges)
+    invalid_edges.close()
+
+    assert first == next(_evaluator(MatchingEngine.REGEX).iter_invalid_edges(_EDGES, EvaluationMode.EDGE))
@@ -0,0 +1,38 @@
+import pytest
+
+from import_linter_dependency_graph.helpers.violation_report import ViolationAggregator, package_pair, write_violations
+
+
+@pytest.mark.parametrize('importer, imported, expected', [
+    ('root.foo.a', 'root.bar.b', ('root.foo', 'root.bar')),
+    ('root.foo.a.x', 'root.foo.b.y', ('root.foo.a', 'root.foo.b')),
+    ('root.foo', 'root.foo.a.b', ('root.foo', 'root.foo.a')),
+    ('root.foo.a.b', 'root', ('root.foo', 'root')),
+    ('root.foo', 'other.foo', ('root', 'other')),
+])
+def test_package_pair(importer, imported, expected):
+    assert package_pair(importer, imported) == expected
+
+
+def test_groups__counts_and_samples_per_package_pair_most_violated_first():
+    aggregator = ViolationAggregator(sample_size=2)
+
+    aggregator.add_all([
+        ('root.foo.a', 'root.bar.a'),
+        ('root.baz.a', 'root.bar.a'),
+        ('root.foo.b', 'root.bar.b'),
+        ('root.foo.c', 'root.bar.c'),
+    ])
+
+    assert aggregator.groups() == [
+        {"importer_package": 'root.foo', "imported_package": 'root.bar', "count": 3, "samples": [('root.foo.a', 'root.bar.a'), ('root.foo.b', 'root.bar.b')]},
+        {"importer_package": 'root.baz', "imported_package": 'root.bar', "count": 1, "samples": [('root.baz.a', 'root.bar.a')]},
+    ]
+
+
+def test_write_violations(tmp_path):
+    path = tmp_path / 'violations.txt'
+
+    write_violations(str(path), [('root.foo.a', 'root.bar.a'), ('root.foo.b', 'root.bar.b')])
+
+    assert path.read_text() == "root.foo.a -> root.bar.a\nroot.foo.b -> root.bar.b\n"
@@ -0,0 +1,41 @@
+from import_linter_dependency_graph.batch import check_contracts
+
+
+REQUIRED_IMPORTS = ["root.[**parent].* -> root.[parent].*"]
+IMPORTS = [('root.foo.a', 'root.bar.a'), ('root.foo.b', 'root.bar.b'), ('root.bar.c', 'root.foo.a'), ('root.bar.c', 'root.bar.a')]
+
+
+def test_check__only_checks_imports_of_changed_modules(make_graph, make_contract):
+    result = make_contract(REQUIRED_IMPORTS, changed_modules=['root.foo.a', 'other.module']).check(make_graph(IMPORTS), verbose=False)
+
+    assert result.metadata["invalid_imports"] == [('root.bar.c', 'root.foo.a'), ('root.foo.a', 'root.bar.a')]
+    assert result.metadata["scope"] == {"changed_modules": ['root.foo.a'], "imports": 2}
+    assert result.warnings == ["Scoped run: only the 2 imports from or to 1 changed modules were checked."]
+
+
+def test_check__reads_changed_modules_and_paths_from_file(make_graph, make_contract, tmp_path, monkeypatch):
+    package_directory = tmp_path / 'src' / 'root'
+    (package_directory / 'bar').mkdir(parents=True)
+    (package_directory / '__init__.py').write_text('')
+    (package_directory / 'bar' / '__init__.py').write_text('')
+    monkeypatch.syspath_prepend(str(tmp_path / 'src'))
+    monkeypatch.chdir(tmp_path)
+    changed_modules_file = tmp_path / 'changed.txt'
+    changed_modules_file.write_text("README.md\nsrc/root/bar/b.py\nroot.foo.a\n")
+
+    contract = make_contract(REQUIRED_IMPORTS, changed_modules_file=str(changed_modules_file))
+    result = contract.check(make_graph(IMPORTS), verbose=False)
+
+    assert contract.find_changed_modules() == {'root.bar.b', 'root.foo.a'}
+    assert result.metadata["invalid_imports"] == [
+        ('root.foo.b', 'root.bar.b'), ('root.bar.c', 'root.foo.a'), ('root.foo.a', 'root.bar.a'),
+    ]
+
+
+def test_check_contracts__checks_scoped_contracts_on_their_own(make_graph, make_contract):
+    contracts = [make_contract(REQUIRED_IMPORTS), make_contract(REQUIRED_IMPORTS, changed_modules=['root.bar.c'])]
+
+    checks = check_contracts(contracts, make_graph(IMPORTS))
+
+    assert len(checks[0].metadata["invalid_imports"]) == 3
+    assert checks[1].metadata["invalid_imports"] == [('root.bar.c', 'root.foo.a')]
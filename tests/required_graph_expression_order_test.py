@@ -0,0 +1,31 @@
+import pytest
+
+
+REQUIRED_IMPORTS = [
+    "root.[**parent].* -> root.[parent].*",
+    "root.[**?shared_parent].shared.** <- root.[shared_parent].**",
+]
+IMPORTS = [(f"root.foo.m{index}", f"root.foo.shared.m{index}") for index in range(5)] + [('root.foo.a', 'root.bar.b')]
+
+
+@pytest.mark.parametrize('options', [
+    {"expression_order": 'adaptive'},
+    {"expression_order": 'adaptive', "evaluation_mode": 'grouped'},
+    {"expression_order": 'adaptive', "workers": '2'},
+    {"expression_order": 'persisted'},
+])
+def test_check__reports_same_violations_in_every_order(make_graph, make_contract, tmp_path, options):
+    expected = make_contract(REQUIRED_IMPORTS, cache_dir=str(tmp_path)).check(graph=make_graph(IMPORTS), verbose=False)
+
+    result = make_contract(REQUIRED_IMPORTS, cache_dir=str(tmp_path), **options).check(graph=make_graph(IMPORTS), verbose=False)
+
+    assert result.metadata["invalid_imports"] == expected.metadata["invalid_imports"]
+    assert result.metadata["expression_hits"] == [0, 5]
+
+
+def test_check__continues_from_persisted_hits(make_graph, make_contract, tmp_path):
+    make_contract(REQUIRED_IMPORTS, cache_dir=str(tmp_path), expression_order='persisted').check(graph=make_graph(IMPORTS), verbose=False)
+
+    result = make_contract(REQUIRED_IMPORTS, cache_dir=str(tmp_path), expression_order='persisted').check(graph=make_graph(IMPORTS), verbose=False)
+
+    assert result.metadata["expression_hits"] == [0, 10]
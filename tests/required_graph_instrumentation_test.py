@@ -0,0 +1,49 @@
+import pytest
+
+
+REQUIRED_IMPORTS = ["root.[**parent].* -> root.[parent].**"]
+IMPORTS = [('root.foo.a', 'root.foo.b'), ('root.foo.a', 'root.bar.b')]
+
+
+def test_check__collects_no_instrumentation_by_default(make_graph, make_contract):
+    result = make_contract(REQUIRED_IMPORTS).check(graph=make_graph(IMPORTS), verbose=False)
+
+    assert "instrumentation" not in result.metadata
+
+
+@pytest.mark.parametrize('options', [
+    {},
+    {"workers": '2'},
+])
+def test_check__reports_statistics_per_expression(make_graph, make_contract, options):
+    result = make_contract(REQUIRED_IMPORTS, instrumentation='true', **options).check(graph=make_graph(IMPORTS), verbose=False)
+
+    instrumentation = result.metadata["instrumentation"]
+    assert instrumentation["edges_scanned"] == 2
+    [expression] = instrumentation["expressions"]
+    assert expression["expression"] == "root.[**parent].* -> root.[parent].**"
+    assert expression["defining_attempts"] == 2
+    assert expression["defining_hits"] == 2
+    assert expression["using_attempts"] == 2
+    assert expression["using_hits"] == 1
+
+
+def test_check__prints_statistics_when_verbose(make_graph, make_contract, printed_lines):
+    result = make_contract(REQUIRED_IMPORTS).check(graph=make_graph(IMPORTS), verbose=True)
+
+    assert "instrumentation" in result.metadata
+    assert "Imports evaluated: 2." in printed_lines
+    assert any(line.startswith("root.[**parent].* -> root.[parent].**: ") for line in printed_lines)
+
+
+def test_check__reports_compile_cache_use_of_its_own_check(make_graph, make_contract):
+    graph = make_graph(IMPORTS)
+    first = make_contract(REQUIRED_IMPORTS, instrumentation='true').check(graph=graph, verbose=False)
+    # The second contract shares the parsed expression and its warm compile cache.
+    second = make_contract(REQUIRED_IMPORTS, instrumentation='true').check(graph=graph, verbose=False)
+
+    first_cache, second_cache = first.metadata["compile_cache"], second.metadata["compile_cache"]
+    assert second_cache["hits"] + second_cache["misses"] == first_cache["hits"] + first_cache["misses"]
+    assert second_cache["misses"] == 0
+    [expression] = second.metadata["instrumentation"]["expressions"]
+    assert (expression["compile_cache_hits"], expression["compile_cache_misses"]) == (second_cache["hits"], second_cache["misses"])
@@ -0,0 +1,60 @@
+import pytest
+
+from import_linter_dependency_graph.fields.import_expression_field import clear_interned_import_expressions
+
+
+REQUIRED_IMPORTS = ["root.[**parent].* -> root.[parent].*"]
+IMPORTS = [('root.foo.a', 'root.foo.b'), ('root.foo.a', 'root.bar.b')]
+
+
+@pytest.fixture(autouse=True)
+def _fresh_interned_import_expressions():
+    # Loading an artifact in a fresh process is simulated by forgetting the expressions parsed before.
+    clear_interned_import_expressions()
+    yield
+    clear_interned_import_expressions()
+
+
+@pytest.mark.parametrize('matching_engine', ['regex', 'combined-regex', 'segment'])
+def test_check__uses_matcher_loaded_from_artifact(make_graph, make_contract, tmp_path, matching_engine):
+    path = str(tmp_path / 'matcher.pickle')
+    make_contract(REQUIRED_IMPORTS, matching_engine=matching_engine).export_matcher_artifact(path)
+    clear_interned_import_expressions()
+
+    contract = make_contract(REQUIRED_IMPORTS, matching_engine=matching_engine, matcher_artifact=path)
+    result = contract.check(graph=make_graph(IMPORTS), verbose=False)
+
+    assert contract._loaded_matcher is not None
+    assert result.metadata["invalid_imports"] == [('root.foo.a', 'root.bar.b')]
+    assert result.warnings == []
+
+
+@pytest.mark.parametrize('options', [
+    {"required_imports": ["root.[**parent].* -> root.[parent].**"]},
+    {"matching_engine": 'segment'},
+])
+def test_check__ignores_outdated_artifact(make_graph, make_contract, tmp_path, options):
+    path = str(tmp_path / 'matcher.pickle')
+    make_contract(REQUIRED_IMPORTS).export_matcher_artifact(path)
+    clear_interned_import_expressions()
+
+    contract = make_contract(**{"required_imports": REQUIRED_IMPORTS, "matcher_artifact": path, **options})
+    result = contract.check(graph=make_graph(IMPORTS), verbose=False)
+
+    assert contract._loaded_matcher is None
+    assert result.metadata["invalid_imports"] == [('root.foo.a', 'root.bar.b')]
+    assert result.warnings == [f"Matcher artifact '{path}' is missing or outdated, the matcher was built from the import expressions."]
+
+
+def test_check__uses_artifact_of_expressions_parsed_by_another_contract(make_graph, make_contract, tmp_path):
+    path = str(tmp_path / 'matcher.pickle')
+    make_contract(["[**parent].* -> [parent].*"], root_package='root').export_matcher_artifact(path)
+    clear_interned_import_expressions()
+    make_contract(["[**parent].* -> [parent].*"], name='other', root_package='other')
+
+    contract = make_contract(["[**parent].* -> [parent].*"], root_package='root', matcher_artifact=path)
+    result = contract.check(graph=make_graph(IMPORTS), verbose=False)
+
+    assert contract._loaded_matcher is not None
+    assert result.metadata["invalid_imports"] == [('root.foo.a', 'root.bar.b')]
+    assert result.warnings == []
@@ -0,0 +1,81 @@
+import pytest
+from grimp.adaptors.graph import ImportGraph
+
+from import_linter_dependency_graph.domain.edge_sharding import Shard
+from import_linter_dependency_graph.helpers.shard_results import ShardResult, shard_result_path
+from import_linter_dependency_graph.required_graph import RequiredGraphContract
+
+
+REQUIRED_IMPORTS = ["root.[**parent].* -> root.[parent].*"]
+IMPORTS = [
+    edge
+    for package in ('foo', 'bar', 'baz', 'qux')
+    for index in range(3)
+    for edge in [(f"root.{package}.m{index}", f"root.{package}.shared"), (f"root.{package}.m{index}", f"root.other{index}.{package}")]
+]
+
+
+def _merged_check(contract: RequiredGraphContract, graph: ImportGraph, shard_count: int, directory: str):
+    # Results go through their files, as they would between CI nodes.
+    for index in range(1, shard_count + 1):
+        shard = Shard(index, shard_count)
+        contract.check_shard(graph, shard).write(shard_result_path(directory, shard))
+    results = [ShardResult.read(shard_result_path(directory, Shard(index, shard_count))) for index in range(1, shard_count + 1)]
+    return contract.merge_shard_results(results)
+
+
+@pytest.mark.parametrize('shard_count', [1, 2, 3, 5])
+@pytest.mark.parametrize('options', [
+    {},
+    {"max_violations": '4'},
+    {"fail_fast": 'true'},
+    {"report_mode": 'aggregated', "report_samples": '1'},
+])
+def test_merge_shard_results__equals_single_node_check(make_graph, make_contract, tmp_path, printed_lines, shard_count, options):
+    contract = make_contract(REQUIRED_IMPORTS, **options)
+    expected = contract.check(make_graph(IMPORTS), verbose=False)
+    contract.render_broken_contract(expected)
+    expected_lines = list(printed_lines)
+    printed_lines.clear()
+
+    merged = _merged_check(contract, make_graph(IMPORTS), shard_count, str(tmp_path))
+    contract.render_broken_contract(merged)
+
+    assert merged.kept == expected.kept
+    assert merged.metadata["invalid_imports"] == expected.metadata["invalid_imports"]
+    assert merged.warnings == expected.warnings
+    assert printed_lines == expected_lines
+
+
+def test_check_shard__checks_every_import_in_one_shard(make_graph, make_contract):
+    contract = make_contract(REQUIRED_IMPORTS)
+
+    results = [contract.check_shard(make_graph(IMPORTS), Shard(index, 3)) for index in range(1, 4)]
+
+    positions = sorted(position for result in results for position, _, _ in result.invalid_imports)
+    assert positions == sorted(set(positions))
+    assert len(positions) == 12
+    assert {result.edge_count for result in results} == {24}
+
+
+def test_check_shard__keeps_verdicts_of_other_shards(make_graph, make_contract, tmp_path):
+    contract = make_contract(REQUIRED_IMPORTS, verdict_cache='true', cache_dir=str(tmp_path))
+
+    for index in range(1, 4):
+        contract.check_shard(make_graph(IMPORTS), Shard(index, 3))
+    result = contract.check(make_graph(IMPORTS), verbose=False)
+
+    assert result.metadata["verdict_cache"] == {"hits": 24, "misses": 0}
+
+
+def test_merge_shard_results__rejects_incomplete_or_foreign_results(make_graph, make_contract):
+    contract = make_contract(REQUIRED_IMPORTS)
+    results = [contract.check_shard(make_graph(IMPORTS), Shard(index, 3)) for index in range(1, 4)]
+    other_results = [make_contract(["root.** -> root.**"]).check_shard(make_graph(IMPORTS), Shard(1, 1))]
+
+    with pytest.raises(ValueError, match='not all shards'):
+        contract.merge_shard_results(results[:2])
+    with pytest.raises(ValueError, match='import expressions'):
+        contract.merge_shard_results(other_results)
+    with pytest.raises(ValueError, match='No shard results'):
+        contract.merge_shard_results([])
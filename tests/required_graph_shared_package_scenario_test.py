@@ -1,6 +1,7 @@
+import pytest
 from grimp.adaptors.graph import ImportGraph
 
-from import_linter_dependency_graph.import_graph import ImportGraphContract
+from import_linter_dependency_graph.required_graph import RequiredGraphContract as ImportGraphContract
 
 """
 This scenario tests the shared package import rule. By this rule imports of a module M in package P are only allowed to:
@@ -8,7 +9,9 @@ This scenario tests the shared package import rule. By this rule imports of a mo
     - modules contained in a 'shared' package S where S is the direct subpackage of any intermediate package inside the path from the root package to P.
 """
 
-def test_check_legal():
+@pytest.mark.parametrize('matching_engine', ['regex', 'combined-regex', 'segment'])
+@pytest.mark.parametrize('materialize_target_sets', ['false', 'true'])
+def test_check_legal(matching_engine, materialize_target_sets):
     import_graph = ImportGraph()
     import_graph.add_module('root')
     import_graph.add_module('root.shared')
@@ -32,6 +35,8 @@ def test_check_legal():
 
     contract = ImportGraphContract('contract',{},{
         "root_package": 'root',
+        "matching_engine": matching_engine,
+        "materialize_target_sets": materialize_target_sets,
         "required_imports": [
             "[**parent].* -> [parent].**",
             "[**?shared_parent].shared.** <- [shared_parent].**"
@@ -43,7 +48,9 @@ def test_check_legal():
     assert result.kept
 
 
-def test_check_illegal():
+@pytest.mark.parametrize('matching_engine', ['regex', 'combined-regex', 'segment'])
+@pytest.mark.parametrize('materialize_target_sets', ['false', 'true'])
+def test_check_illegal(matching_engine, materialize_target_sets):
     import_graph = ImportGraph()
     import_graph.add_module('root')
     import_graph.add_module('root.shared')
@@ -67,6 +74,8 @@ def test_check_illegal():
 
     contract = ImportGraphContract('contract',{},{
         "root_package": 'root',
+        "matching_engine": matching_engine,
+        "materialize_target_sets": materialize_target_sets,
         "required_imports": [
             "[**parent].* -> [parent].**",
             "[**?shared_parent].shared.** <- [shared_parent].**"
@@ -77,8 +86,23 @@ def test_check_illegal():
 
     assert result.kept == False
     assert set(result.metadata["invalid_imports"]) == {
-        "root.foo.B -> root.bar.E",
-        "root.shared.A -> root.foo.shared.C",
-        "root.foo.foobar.D -> root.foo.B",
-        "root.foo.foobar.D -> root.bar.E"
-    }
\ No newline at end of file
+        ("root.foo.B", "root.bar.E"),
+        ("root.shared.A", "root.foo.shared.C"),
+        ("root.foo.foobar.D", "root.foo.B"),
+        ("root.foo.foobar.D", "root.bar.E")
+    }
+
+def test_check__ignores_imports_of_the_root_package_itself():
+    import_graph = ImportGraph()
+    import_graph.add_import(importer='root.foo.B', imported='root')
+
+    contract = ImportGraphContract('contract',{},{
+        "root_package": 'root',
+        "required_imports": [
+            "[**parent].* -> [parent].**",
+        ]
+    })
+
+    result = contract.check(graph=import_graph, verbose=False)
+
+    assert result.kept
@@ -0,0 +1,45 @@
+import pytest
+
+
+REQUIRED_IMPORTS = [
+    "root.[package].** -> root.[package].**",
+    "root.shared.** <- root.*.**",
+]
+PACKAGES = ['foo', 'bar']
+LEAVES = ['a', 'b', 'c']
+IMPORTS = [
+    *((f"root.{package}.m{index}.{leaf}", f"root.{package}.m{(index + 1) % 4}.{leaf}.x") for package in PACKAGES for index in range(4) for leaf in LEAVES),
+    *((f"root.{package}.m{index}.{leaf}", f"root.shared.m{index}.{leaf}") for package in PACKAGES for index in range(4) for leaf in LEAVES),
+    *((f"root.{package}.m{index}", f"root.{'bar' if package == 'foo' else 'foo'}.m{index}.x") for package in PACKAGES for index in range(4)),
+    ('root.shared.m0', 'root.foo.m0'),
+    ('root', 'root.foo'),
+]
+
+
+@pytest.mark.parametrize('options', [
+    {},
+    {"evaluation_mode": 'grouped'},
+    {"fail_fast": 'true'},
+    {"materialize_target_sets": 'true'},
+])
+def test_check__reports_same_violations_as_unsquashed_check(make_graph, make_contract, options):
+    expected = make_contract(REQUIRED_IMPORTS, **options).check(graph=make_graph(IMPORTS), verbose=False)
+
+    result = make_contract(REQUIRED_IMPORTS, squash_modules='true', instrumentation='true', **options).check(graph=make_graph(IMPORTS), verbose=False)
+
+    assert result.metadata["invalid_imports"] == expected.metadata["invalid_imports"]
+    assert len(result.metadata["invalid_imports"]) > 0
+
+
+def test_check__materializes_target_sets_of_squashed_modules(make_graph, make_contract):
+    result = make_contract(["root.[p].** -> root.[p].**"], squash_modules='true', materialize_target_sets='true').check(graph=make_graph([('root.a.x.m', 'root.a.y.n')]), verbose=False)
+
+    assert result.kept
+
+
+def test_check__evaluates_every_squashed_import_once(make_graph, make_contract):
+    result = make_contract(REQUIRED_IMPORTS, squash_modules='true', instrumentation='true').check(graph=make_graph(IMPORTS), verbose=False)
+
+    # 48 imports between the leaf modules collapse to 16 imports between 'root.<package>.m<index>' and 'root.shared.m<index>'.
+    assert make_graph(IMPORTS).count_imports() == 58
+    assert result.metadata["instrumentation"]["edges_scanned"] == 26
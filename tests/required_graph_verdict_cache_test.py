@@ -0,0 +1,41 @@
+REQUIRED_IMPORTS = ["[**parent].* -> [parent].**"]
+IMPORTS = [('root.foo.a', 'root.foo.b'), ('root.foo.a', 'root.bar.c'), ('root.bar.c', 'root.foo.b')]
+
+
+def test_check__reuses_persisted_verdicts(make_graph, make_contract, tmp_path):
+    first = make_contract(REQUIRED_IMPORTS, verdict_cache='true', cache_dir=str(tmp_path)).check(graph=make_graph(IMPORTS), verbose=False)
+    second = make_contract(REQUIRED_IMPORTS, verdict_cache='true', cache_dir=str(tmp_path)).check(graph=make_graph(IMPORTS), verbose=False)
+
+    assert first.metadata["verdict_cache"] == {"hits": 0, "misses": 3}
+    assert second.metadata["verdict_cache"] == {"hits": 3, "misses": 0}
+    assert first.metadata["invalid_imports"] == second.metadata["invalid_imports"]
+    assert set(second.metadata["invalid_imports"]) == {("root.foo.a", "root.bar.c"), ("root.bar.c", "root.foo.b")}
+
+
+def test_check__only_evaluates_new_imports(make_graph, make_contract, tmp_path):
+    make_contract(REQUIRED_IMPORTS, verdict_cache='true', cache_dir=str(tmp_path)).check(graph=make_graph(IMPORTS), verbose=False)
+    import_graph = make_graph([*IMPORTS, ('root.bar.c', 'root.bar.d')])
+
+    result = make_contract(REQUIRED_IMPORTS, verdict_cache='true', cache_dir=str(tmp_path)).check(graph=import_graph, verbose=False)
+
+    assert result.metadata["verdict_cache"] == {"hits": 3, "misses": 1}
+    assert set(result.metadata["invalid_imports"]) == {("root.foo.a", "root.bar.c"), ("root.bar.c", "root.foo.b")}
+
+
+def test_check__changed_expressions_invalidate_verdicts(make_graph, make_contract, tmp_path):
+    make_contract(REQUIRED_IMPORTS, verdict_cache='true', cache_dir=str(tmp_path)).check(graph=make_graph(IMPORTS), verbose=False)
+
+    result = make_contract([*REQUIRED_IMPORTS, "root.** -> root.foo.**"], verdict_cache='true', cache_dir=str(tmp_path)).check(graph=make_graph(IMPORTS), verbose=False)
+
+    assert result.metadata["verdict_cache"] == {"hits": 0, "misses": 3}
+    assert result.metadata["invalid_imports"] == [("root.foo.a", "root.bar.c")]
+
+
+def test_check__scoped_check_keeps_verdicts_of_other_imports(make_graph, make_contract, tmp_path):
+    import_graph = make_graph([*IMPORTS, ('root.baz.x', 'root.baz.y')])
+    make_contract(REQUIRED_IMPORTS, verdict_cache='true', cache_dir=str(tmp_path)).check(graph=import_graph, verbose=False)
+    make_contract(REQUIRED_IMPORTS, verdict_cache='true', cache_dir=str(tmp_path), changed_modules=['root.baz.x']).check(graph=import_graph, verbose=False)
+
+    result = make_contract(REQUIRED_IMPORTS, verdict_cache='true', cache_dir=str(tmp_path)).check(graph=import_graph, verbose=False)
+
+    assert result.metadata["verdict_cache"] == {"hits": 4, "misses": 0}
@@ -0,0 +1,65 @@
+import pytest
+
+
+REQUIRED_IMPORTS = ["[**parent].* -> [parent].**"]
+IMPORTS = [(f"root.foo.m{index}", f"root.bar.m{index}") for index in range(10)] + [('root.foo.a', 'root.foo.b')]
+
+
+def test_check__reports_all_violations_without_limit(make_graph, make_contract):
+    result = make_contract(REQUIRED_IMPORTS).check(graph=make_graph(IMPORTS), verbose=False)
+
+    assert len(result.metadata["invalid_imports"]) == 10
+    assert "truncated" not in result.metadata
+    assert result.warnings == []
+
+
+@pytest.mark.parametrize('options', [
+    {},
+    {"evaluation_mode": 'grouped'},
+    {"workers": '2'},
+])
+def test_check__stops_at_max_violations(make_graph, make_contract, options):
+    result = make_contract(REQUIRED_IMPORTS, max_violations='3', **options).check(graph=make_graph(IMPORTS), verbose=False)
+
+    assert not result.kept
+    assert len(result.metadata["invalid_imports"]) == 3
+    assert result.metadata["truncated"]
+    assert len(result.warnings) == 1
+
+
+def test_check__fail_fast_stops_at_first_violation(make_graph, make_contract):
+    result = make_contract(REQUIRED_IMPORTS, fail_fast='true').check(graph=make_graph(IMPORTS), verbose=False)
+
+    assert len(result.metadata["invalid_imports"]) == 1
+    assert result.metadata["truncated"]
+
+
+@pytest.mark.parametrize('options', [{"max_violations": '1'}, {"fail_fast": 'true'}])
+def test_check__is_not_truncated_if_limit_equals_violations(make_graph, make_contract, options):
+    import_graph = make_graph([('root.foo.a', 'root.bar.b'), ('root.foo.a', 'root.foo.b')])
+
+    result = make_contract(REQUIRED_IMPORTS, **options).check(graph=import_graph, verbose=False)
+
+    assert result.metadata["invalid_imports"] == [('root.foo.a', 'root.bar.b')]
+    assert "truncated" not in result.metadata
+    assert result.warnings == []
+
+
+def test_check__is_kept_with_limit_if_nothing_is_violated(make_graph, make_contract):
+    import_graph = make_graph([('root.foo.a', 'root.foo.b')])
+
+    result = make_contract(REQUIRED_IMPORTS, fail_fast='true').check(graph=import_graph, verbose=False)
+
+    assert result.kept
+    assert result.warnings == []
+
+
+def test_render_broken_contract__formats_violations(make_graph, make_contract, printed_lines):
+    contract = make_contract(REQUIRED_IMPORTS, max_violations='2')
+    result = contract.check(graph=make_graph(IMPORTS), verbose=False)
+
+    contract.render_broken_contract(result)
+
+    assert [line for line in printed_lines if line] == [
+        f"{importer} -> {imported}" for importer, imported in result.metadata["invalid_imports"]
+    ]
@@ -0,0 +1,30 @@
+REQUIRED_IMPORTS = ["[**parent].* -> [parent].**"]
+IMPORTS = [(f"root.foo.m{index}", f"root.bar.m{index}") for index in range(5)] + [('root.baz.a', 'root.qux.b')]
+
+
+def test_render_broken_contract__prints_every_invalid_import_by_default(make_graph, make_contract, printed_lines):
+    contract = make_contract(REQUIRED_IMPORTS)
+    check = contract.check(graph=make_graph(IMPORTS), verbose=False)
+
+    contract.render_broken_contract(check)
+
+    assert "violation_groups" not in check.metadata
+    assert [line for line in printed_lines if line] == [f"{importer} -> {imported}" for importer, imported in check.metadata["invalid_imports"]]
+
+
+def test_render_broken_contract__prints_bounded_aggregated_report(make_graph, make_contract, printed_lines, tmp_path):
+    violations_file = tmp_path / 'violations.txt'
+    contract = make_contract(REQUIRED_IMPORTS, report_mode='aggregated', report_samples='2', report_max_groups='1', violations_file=str(violations_file))
+    check = contract.check(graph=make_graph(IMPORTS), verbose=False)
+
+    contract.render_broken_contract(check)
+
+    assert [group["count"] for group in check.metadata["violation_groups"]] == [5, 1]
+    assert [line for line in printed_lines if line] == [
+        "root.foo -> root.bar: 5 invalid imports",
+        "    root.foo.m0 -> root.bar.m0",
+        "    root.foo.m1 -> root.bar.m1",
+        "... and 1 invalid imports in 1 more package pairs.",
+        f"All 6 invalid imports were written to {violations_file}.",
+    ]
+    assert len(violations_file.read_text().splitlines()) == 6
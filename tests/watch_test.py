@@ -0,0 +1,97 @@
+import threading
+
+from import_linter_dependency_graph.watch import FileWatchSession, WatchServer, WatchSession, request
+
+
+REQUIRED_IMPORTS = ["[**parent].* -> [parent].*"]
+IMPORTS = [('root.foo.a', 'root.foo.b'), ('root.foo.b', 'root.bar.a'), ('root.bar.a', 'root.bar.b')]
+
+
+def test_update_imports__rechecks_only_added_imports(make_graph, make_contract):
+    session = WatchSession(make_contract(REQUIRED_IMPORTS), make_graph(IMPORTS))
+    assert sorted(session.check().metadata["invalid_imports"]) == [('root.foo.b', 'root.bar.a')]
+
+    rechecked = session.update_imports({
+        'root.foo.b': {'root.foo.a'},
+        'root.bar.c': {'root.foo.a', 'root.bar.b', 'os'},
+    })
+
+    assert rechecked == 4
+    check = session.check()
+    assert sorted(check.metadata["invalid_imports"]) == [('root.bar.c', 'root.foo.a')]
+    expected = make_contract(REQUIRED_IMPORTS).check(session.graph, verbose=False)
+    assert sorted(check.metadata["invalid_imports"]) == sorted(expected.metadata["invalid_imports"])
+
+
+def test_update_imports__removes_deleted_modules(make_graph, make_contract):
+    session = WatchSession(make_contract(REQUIRED_IMPORTS), make_graph(IMPORTS))
+
+    assert session.update_imports({'root.bar.a': None}) == 0
+
+    check = session.check()
+    assert check.kept
+    assert 'root.bar.a' not in session.graph.modules
+
+
+def test_update_imports__ignores_imports_of_the_root_package_itself(make_graph, make_contract):
+    session = WatchSession(make_contract(REQUIRED_IMPORTS), make_graph(IMPORTS))
+
+    assert session.update_imports({'root.bar.b': {'root'}}) == 1
+
+    assert sorted(session.check().metadata["invalid_imports"]) == [('root.foo.b', 'root.bar.a')]
+
+
+def test_server__answers_check_requests_for_changed_files(make_graph, make_contract, tmp_path):
+    package_directory = tmp_path / 'root'
+    (package_directory / 'foo').mkdir(parents=True)
+    (package_directory / 'foo' / 'b.py').write_text("from root.foo import a\n")
+    session = FileWatchSession(make_contract(REQUIRED_IMPORTS), make_graph(IMPORTS), str(package_directory))
+
+    with WatchServer(session, port=0) as server:
+        thread = threading.Thread(target=server.serve_until_stopped)
+        thread.start()
+        port = server.server_address[1]
+        response = request({"changed": [str(package_directory / 'foo' / 'b.py'), str(package_directory / 'bar' / 'a.py')]}, port)
+        request({"command": "stop"}, port)
+        thread.join()
+
+    assert response == {"kept": True, "invalid_imports": [], "rechecked": 1}
+
+
+def test_update_files__keeps_imports_of_unreadable_files(make_graph, make_contract, tmp_path):
+    package_directory = tmp_path / 'root'
+    (package_directory / 'foo').mkdir(parents=True)
+    (package_directory / 'foo' / 'b.py').write_bytes(b"from root.foo import a\n# \xff\n")
+    session = FileWatchSession(make_contract(REQUIRED_IMPORTS), make_graph(IMPORTS), str(package_directory))
+
+    assert session.update_files([str(package_directory / 'foo' / 'b.py')]) == 0
+
+    assert sorted(session.check().metadata["invalid_imports"]) == [('root.foo.b', 'root.bar.a')]
+
+
+def test_update_files__re_resolves_imports_of_the_package_of_an_added_module(make_graph, make_contract, tmp_path):
+    package_directory = tmp_path / 'root'
+    (package_directory / 'foo').mkdir(parents=True)
+    (package_directory / 'bar').mkdir()
+    (package_directory / 'foo' / 'a.py').write_text("from root.bar import c\n")
+    (package_directory / 'bar' / 'c.py').write_text("")
+    session = FileWatchSession(make_contract(REQUIRED_IMPORTS), make_graph([('root.foo.a', 'root.bar')]), str(package_directory))
+
+    session.update_files([str(package_directory / 'bar' / 'c.py')])
+
+    assert session.graph.find_modules_directly_imported_by('root.foo.a') == {'root.bar.c'}
+    assert session.check().metadata["invalid_imports"] == [('root.foo.a', 'root.bar.c')]
+
+
+def test_server__answers_failed_requests_with_the_error(make_graph, make_contract, tmp_path):
+    session = FileWatchSession(make_contract(REQUIRED_IMPORTS), make_graph(IMPORTS), str(tmp_path))
+
+    with WatchServer(session, port=0) as server:
+        thread = threading.Thread(target=server.serve_until_stopped)
+        thread.start()
+        port = server.server_address[1]
+        response = request({"changed": 1}, port)
+        request({"command": "stop"}, port)
+        thread.join()
+
+    assert response["error"].startswith("TypeError: ")